@@ -0,0 +1,122 @@
+"""Compare per-control parsing with the table-driven batch decoder.
+
+Run with ``python benchmarks/control_parsing.py``. The legacy path replays
+the former if-chain dispatch and uncached enum coercion.
+"""
+
+from __future__ import annotations
+
+import timeit
+from enum import Enum
+from typing import Any, TypeVar
+from unittest.mock import patch
+
+from pyliebherrhomeapi import models
+from pyliebherrhomeapi.models import (
+    AutoDoorControl,
+    BioFreshPlusControl,
+    ControlType,
+    DeviceControl,
+    HydroBreezeControl,
+    IceMakerControl,
+    TemperatureControl,
+    ToggleControl,
+    parse_controls,
+)
+
+CONTROLS = 10_000
+ROUNDS = 20
+
+_EnumT = TypeVar("_EnumT", bound=Enum)
+
+
+def legacy_coerce_enum(
+    enum_cls: type[_EnumT], value: str | None
+) -> _EnumT | str | None:
+    """Coerce without memoization, raising ValueError for unknown values."""
+    if value is None:
+        return None
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
+def legacy_parse_control(data: dict[str, Any]) -> DeviceControl:
+    """Dispatch through the former chain of type comparisons."""
+    control_type = data.get("type")
+    if control_type == ControlType.TEMPERATURE.value:
+        return TemperatureControl.from_dict(data)
+    if control_type == ControlType.TOGGLE.value:
+        return ToggleControl.from_dict(data)
+    if control_type == ControlType.AUTO_DOOR.value:
+        return AutoDoorControl.from_dict(data)
+    if control_type == ControlType.ICE_MAKER.value:
+        return IceMakerControl.from_dict(data)
+    if control_type == ControlType.HYDRO_BREEZE.value:
+        return HydroBreezeControl.from_dict(data)
+    if control_type == ControlType.BIO_FRESH_PLUS.value:
+        return BioFreshPlusControl.from_dict(data)
+    return ToggleControl.from_dict(data)
+
+
+def legacy_parse_controls(items: list[Any]) -> list[DeviceControl]:
+    """Parse controls one by one with the legacy helpers."""
+    with patch.object(models, "_coerce_enum", legacy_coerce_enum):
+        return [legacy_parse_control(d) for d in items if isinstance(d, dict)]
+
+
+def sample_controls() -> list[dict[str, Any]]:
+    """Build a mixed controls list including values the enums do not know."""
+    templates: list[dict[str, Any]] = [
+        {
+            "name": "temperature",
+            "type": "TemperatureControl",
+            "zoneId": 0,
+            "zonePosition": "top",
+            "value": 5,
+            "target": 5,
+            "unit": "°C",
+        },
+        {"name": "superfrost", "type": "ToggleControl", "zoneId": 1, "value": False},
+        {
+            "name": "autodoor",
+            "type": "AutoDoorControl",
+            "zoneId": 0,
+            "zonePosition": "left",  # unknown zone position
+            "value": "CLOSED",
+        },
+        {
+            "name": "icemaker",
+            "type": "IceMakerControl",
+            "zoneId": 1,
+            "iceMakerMode": "TURBO",  # unknown mode
+        },
+        {
+            "name": "biofreshplus",
+            "type": "BioFreshPlusControl",
+            "zoneId": 0,
+            "currentMode": "ZERO_ZERO",
+            "supportedModes": ["ZERO_ZERO", "MINUS_TWO_ZERO"],
+            "temperatureUnit": "°C",
+        },
+    ]
+    return [templates[i % len(templates)] for i in range(CONTROLS)]
+
+
+def main() -> None:
+    """Time both decoders on the same list."""
+    items = sample_controls()
+    assert legacy_parse_controls(items) == parse_controls(items)
+
+    print(f"{CONTROLS} controls, best of {ROUNDS} rounds")
+    legacy = min(
+        timeit.repeat(lambda: legacy_parse_controls(items), number=1, repeat=ROUNDS)
+    )
+    batch = min(timeit.repeat(lambda: parse_controls(items), number=1, repeat=ROUNDS))
+    print(f"  if-chain + uncached enums  {legacy * 1000:8.2f} ms")
+    print(f"  parse_controls             {batch * 1000:8.2f} ms  {legacy / batch:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
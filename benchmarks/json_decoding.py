@@ -0,0 +1,89 @@
+"""Compare JSON decoders on a fleet of controls payloads.
+
+Run with ``python benchmarks/json_decoding.py``. Install the ``speedups``
+extra to include orjson.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+DEVICES = 1000
+ROUNDS = 20
+
+
+def controls_body(device_index: int) -> bytes:
+    """Build a realistic controls response for one device."""
+    controls: list[dict[str, Any]] = [
+        {
+            "name": "temperature",
+            "type": "TemperatureControl",
+            "zoneId": zone,
+            "zonePosition": position,
+            "value": 5 - zone * 23,
+            "target": 5 - zone * 23,
+            "min": 2 - zone * 26,
+            "max": 9 - zone * 16,
+            "unit": "°C",
+        }
+        for zone, position in enumerate(("top", "bottom"))
+    ]
+    controls += [
+        {"name": name, "type": "ToggleControl", "zoneId": 0, "value": False}
+        for name in ("superfrost", "supercool")
+    ]
+    controls += [
+        {"name": "partymode", "type": "ToggleControl", "value": False},
+        {"name": "nightmode", "type": "ToggleControl", "value": device_index % 2 == 0},
+        {
+            "name": "icemaker",
+            "type": "IceMakerControl",
+            "zoneId": 1,
+            "iceMakerMode": "ON",
+            "hasMaxIce": True,
+        },
+    ]
+    return json.dumps(controls).encode()
+
+
+def stdlib_text(body: bytes) -> Any:
+    """Decode like aiohttp's response.json(): bytes to str, then json.loads."""
+    return json.loads(body.decode("utf-8"))
+
+
+def decode_all(loads: Callable[[bytes], Any], bodies: list[bytes]) -> None:
+    """Decode every body once."""
+    for body in bodies:
+        loads(body)
+
+
+def main() -> None:
+    """Time each decoder over the whole fleet."""
+    bodies = [controls_body(i) for i in range(DEVICES)]
+    decoders: dict[str, Callable[[bytes], Any]] = {
+        "response.json() equivalent": stdlib_text,
+        "json.loads(bytes)": json.loads,
+    }
+    try:
+        import orjson
+    except ImportError:
+        print("orjson not installed; pip install 'pyliebherrhomeapi[speedups]'")
+    else:
+        decoders["orjson.loads"] = orjson.loads
+
+    print(f"{DEVICES} controls bodies, best of {ROUNDS} rounds")
+    baseline = 0.0
+    for name, loads in decoders.items():
+        best = min(
+            timeit.repeat(partial(decode_all, loads, bodies), number=1, repeat=ROUNDS)
+        )
+        baseline = baseline or best
+        print(f"  {name:28} {best * 1000:8.2f} ms  {baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
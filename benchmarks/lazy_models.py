@@ -0,0 +1,87 @@
+"""Compare eager parsing with lazy views when only one field is read.
+
+Run with ``python benchmarks/lazy_models.py``. Each round reads the
+temperature ``value`` of every zone from a fleet of controls payloads.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from pyliebherrhomeapi.lazy import LazyTemperatureControl, lazy_controls
+from pyliebherrhomeapi.models import TemperatureControl, parse_controls
+
+DEVICES = 5_000
+ROUNDS = 10
+
+
+def sample_payloads() -> list[list[dict[str, Any]]]:
+    """Build one controls payload per device."""
+    return [
+        [
+            {
+                "name": "temperature",
+                "type": "TemperatureControl",
+                "zoneId": zone,
+                "zonePosition": position,
+                "value": 5 - zone * 23,
+                "target": 5 - zone * 23,
+                "min": 2 - zone * 26,
+                "max": 9 - zone * 16,
+                "unit": "°C",
+            }
+            for zone, position in enumerate(("top", "bottom"))
+        ]
+        + [
+            {"name": name, "type": "ToggleControl", "zoneId": 0, "value": False}
+            for name in ("supercool", "superfrost", "partymode", "nightmode")
+        ]
+        + [
+            {
+                "name": "icemaker",
+                "type": "IceMakerControl",
+                "zoneId": 1,
+                "zonePosition": "bottom",
+                "iceMakerMode": "OFF",
+                "hasMaxIce": True,
+            }
+        ]
+        for _ in range(DEVICES)
+    ]
+
+
+def eager_values(payloads: list[list[dict[str, Any]]]) -> list[Any]:
+    """Read temperatures from fully parsed controls."""
+    return [
+        control.value
+        for payload in payloads
+        for control in parse_controls(payload)
+        if isinstance(control, TemperatureControl)
+    ]
+
+
+def lazy_values(payloads: list[list[dict[str, Any]]]) -> list[Any]:
+    """Read temperatures from lazy views."""
+    return [
+        control.value
+        for payload in payloads
+        for control in lazy_controls(payload)
+        if isinstance(control, LazyTemperatureControl)
+    ]
+
+
+def main() -> None:
+    """Time both modes on the same payloads."""
+    payloads = sample_payloads()
+    assert eager_values(payloads) == lazy_values(payloads)
+
+    print(f"{DEVICES} devices, best of {ROUNDS} rounds")
+    eager = min(timeit.repeat(lambda: eager_values(payloads), number=1, repeat=ROUNDS))
+    lazy = min(timeit.repeat(lambda: lazy_values(payloads), number=1, repeat=ROUNDS))
+    print(f"  parse_controls  {eager * 1000:8.2f} ms")
+    print(f"  lazy_controls   {lazy * 1000:8.2f} ms  {eager / lazy:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure the memory held by DeviceState objects for a large fleet.
+
+Run with ``python benchmarks/memory.py``. Bodies are decoded from JSON so
+that, as with real responses, every device gets its own string objects. The
+script exits non-zero when a state takes more than ``BUDGET`` bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import Any
+
+from pyliebherrhomeapi.models import Device, DeviceState, parse_controls
+
+DEVICES = 10_000
+# Bytes per DeviceState; about 2,800 before models were slotted and interned
+BUDGET = 2_000
+
+
+def device_payloads(device_index: int) -> tuple[bytes, bytes]:
+    """Return the device and controls bodies of one appliance."""
+    device = {
+        "deviceId": f"{device_index:012d}",
+        "nickname": f"Fridge {device_index}",
+        "deviceType": "COMBI",
+        "imageUrl": "https://example.com/combi.png",
+        "deviceName": "CBNbsd 578i",
+    }
+    controls: list[dict[str, Any]] = [
+        {
+            "name": "temperature",
+            "type": "TemperatureControl",
+            "zoneId": zone,
+            "zonePosition": position,
+            "value": 5 - zone * 23,
+            "target": 5 - zone * 23,
+            "min": 2 - zone * 26,
+            "max": 9 - zone * 16,
+            "unit": "°C",
+        }
+        for zone, position in enumerate(("top", "bottom"))
+    ]
+    controls += [
+        {"name": "superfrost", "type": "ToggleControl", "zoneId": 1, "value": False},
+        {"name": "supercool", "type": "ToggleControl", "zoneId": 0, "value": False},
+        {"name": "partymode", "type": "ToggleControl", "value": False},
+        {"name": "nightmode", "type": "ToggleControl", "value": False},
+        {
+            "name": "icemaker",
+            "type": "IceMakerControl",
+            "zoneId": 1,
+            "zonePosition": "bottom",
+            "iceMakerMode": "OFF",
+            "hasMaxIce": True,
+        },
+        {
+            "name": "biofreshplus",
+            "type": "BioFreshPlusControl",
+            "zoneId": 0,
+            "currentMode": "ZERO_ZERO",
+            "supportedModes": ["ZERO_ZERO", "MINUS_TWO_ZERO"],
+            "temperatureUnit": "°C",
+        },
+    ]
+    return json.dumps(device).encode(), json.dumps(controls).encode()
+
+
+def build_fleet(devices: int) -> tuple[list[DeviceState], int]:
+    """Parse a fleet and return it with the bytes it holds."""
+    payloads = [device_payloads(i) for i in range(devices)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        fleet = [
+            DeviceState(
+                device=Device.from_dict(json.loads(device)),
+                controls=parse_controls(json.loads(controls)),
+            )
+            for device, controls in payloads
+        ]
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return fleet, held
+
+
+def main() -> None:
+    """Report bytes per DeviceState."""
+    fleet, held = build_fleet(DEVICES)
+    print(f"{len(fleet)} devices: {held / 1024 / 1024:.1f} MiB")
+    per_state = held / len(fleet)
+    print(f"  {per_state:,.0f} bytes per DeviceState (budget {BUDGET:,})")
+    if per_state > BUDGET:
+        raise SystemExit("memory budget exceeded")
+
+
+if __name__ == "__main__":
+    main()
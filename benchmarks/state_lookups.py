@@ -0,0 +1,80 @@
+"""Compare linear DeviceState scans with the indexed accessors.
+
+Run with ``python benchmarks/state_lookups.py``. Each sweep performs the
+lookups a rule engine typically makes on one state: a few accessors by
+type, by name and by zone.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from pyliebherrhomeapi.models import (
+    BioFreshPlusControl,
+    Device,
+    DeviceControl,
+    DeviceState,
+    IceMakerControl,
+    TemperatureControl,
+    ToggleControl,
+)
+
+SWEEPS = 10_000
+ROUNDS = 10
+
+
+def linear_sweep(state: DeviceState) -> None:
+    """Look controls up by scanning the list, as the accessors used to."""
+    {c.zone_id: c for c in state.controls if isinstance(c, TemperatureControl)}
+    {c.zone_id: c for c in state.controls if isinstance(c, ToggleControl)}
+    next((c for c in state.controls if c.name == "icemaker"), None)
+    next((c for c in state.controls if c.name == "partymode"), None)
+    [c for c in state.controls if c.zone_id == 1]
+
+
+def indexed_sweep(state: DeviceState) -> None:
+    """Look the same controls up through the DeviceState accessors."""
+    state.get_temperature_controls()
+    state.get_toggle_controls()
+    state.get_control_by_name("icemaker")
+    state.get_control_by_name("partymode")
+    state.get_controls_by_zone(1)
+
+
+def sample_state() -> DeviceState:
+    """Build a state with a typical three-zone appliance's controls."""
+    controls: list[DeviceControl] = []
+    for zone in range(3):
+        controls += [
+            TemperatureControl(
+                name="temperature", type="TemperatureControl", zone_id=zone
+            ),
+            ToggleControl(name="supercool", type="ToggleControl", zone_id=zone),
+        ]
+    controls += [
+        ToggleControl(name=name, type="ToggleControl")
+        for name in ("partymode", "nightmode", "holidaymode", "sabbathmode")
+    ]
+    controls += [
+        IceMakerControl(name="icemaker", type="IceMakerControl", zone_id=2),
+        BioFreshPlusControl(name="biofreshplus", type="BioFreshPlusControl", zone_id=1),
+    ]
+    return DeviceState(device=Device(device_id="1"), controls=controls)
+
+
+def main() -> None:
+    """Time both lookup styles on the same state."""
+    state = sample_state()
+    print(f"{SWEEPS} sweeps over {len(state.controls)} controls, best of {ROUNDS}")
+    linear = min(
+        timeit.repeat(lambda: linear_sweep(state), number=SWEEPS, repeat=ROUNDS)
+    )
+    indexed = min(
+        timeit.repeat(lambda: indexed_sweep(state), number=SWEEPS, repeat=ROUNDS)
+    )
+    print(f"  linear scans      {linear * 1000:8.2f} ms")
+    print(f"  indexed accessors {indexed * 1000:8.2f} ms  {linear / indexed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -115,11 +115,15 @@ async def main() -> None:
 
         # Polling example (commented out)
         # print("\nRecommended polling pattern:")
-        # print("Poll every 30 seconds using get_device_state() for efficiency")
+        # print("Poll every 30 seconds, refreshing all devices concurrently")
         # while True:
-        #     for device in devices:
-        #         state = await client.get_device_state(device.device_id)
-        #         print(f"{device.nickname}: {len(state.controls)} controls")
+        #     results = await client.get_all_device_states(concurrency=10)
+        #     for result in results:
+        #         if result.state is not None:
+        #             controls = result.state.controls
+        #             print(f"{result.device_id}: {len(controls)} controls")
+        #         else:
+        #             print(f"{result.device_id}: {result.error}")
         #     await asyncio.sleep(30)  # Wait 30 seconds (recommended interval)
 
 
@@ -3,7 +3,10 @@
 import logging
 from importlib.metadata import PackageNotFoundError, version
 
+from .cache import CacheStats, ResponseCache
 from .client import LiebherrClient
+from .connector import ConnectorConfig, PoolStats
+from .coordinator import BackpressurePolicy, DeviceCoordinator, Subscription
 from .exceptions import (
     LiebherrAuthenticationError,
     LiebherrBadRequestError,
@@ -11,18 +14,36 @@ from .exceptions import (
     LiebherrError,
     LiebherrNotFoundError,
     LiebherrPreconditionFailedError,
+    LiebherrRateLimitError,
     LiebherrServerError,
     LiebherrTimeoutError,
     LiebherrUnsupportedError,
 )
+from .lazy import (
+    LazyAutoDoorControl,
+    LazyBioFreshPlusControl,
+    LazyControl,
+    LazyDevice,
+    LazyHydroBreezeControl,
+    LazyIceMakerControl,
+    LazyModel,
+    LazyTemperatureControl,
+    LazyToggleControl,
+    lazy_controls,
+)
+from .metrics import ClientMetrics
 from .models import (
     AutoDoorControl,
     BioFreshPlusControl,
     BioFreshPlusMode,
+    ControlChange,
+    ControlChangeKind,
     Device,
     DeviceControl,
     DeviceState,
+    DeviceStateResult,
     DeviceType,
+    DeviceWriteResult,
     DoorState,
     HydroBreezeControl,
     HydroBreezeMode,
@@ -31,8 +52,23 @@ from .models import (
     TemperatureControl,
     TemperatureUnit,
     ToggleControl,
+    WriteResult,
     ZonePosition,
+    diff_states,
+    parse_controls,
+    register_control_type,
+)
+from .planner import RefreshPlan, RefreshPlanner
+from .ratelimit import RateLimiter
+from .reconcile import (
+    DesiredState,
+    DeviceReconcileResult,
+    ReconcileAction,
+    Reconciler,
+    ReconcileReport,
 )
+from .retry import RetryPolicy
+from .scheduler import AdaptivePolling, PollScheduler
 
 # Add NullHandler to prevent "No handler found" warnings
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -45,6 +81,31 @@ except PackageNotFoundError:
 __all__ = [
     # Client
     "LiebherrClient",
+    # Polling
+    "AdaptivePolling",
+    "BackpressurePolicy",
+    "DeviceCoordinator",
+    "PollScheduler",
+    "RefreshPlan",
+    "RefreshPlanner",
+    "Subscription",
+    # Reconciliation
+    "DesiredState",
+    "DeviceReconcileResult",
+    "ReconcileAction",
+    "ReconcileReport",
+    "Reconciler",
+    # Connection pool
+    "ConnectorConfig",
+    "PoolStats",
+    # Rate limiting and retries
+    "RateLimiter",
+    "RetryPolicy",
+    # Caching
+    "CacheStats",
+    "ResponseCache",
+    # Metrics
+    "ClientMetrics",
     # Exceptions
     "LiebherrAuthenticationError",
     "LiebherrBadRequestError",
@@ -52,6 +113,7 @@ __all__ = [
     "LiebherrError",
     "LiebherrNotFoundError",
     "LiebherrPreconditionFailedError",
+    "LiebherrRateLimitError",
     "LiebherrServerError",
     "LiebherrTimeoutError",
     "LiebherrUnsupportedError",
@@ -59,10 +121,14 @@ __all__ = [
     "AutoDoorControl",
     "BioFreshPlusControl",
     "BioFreshPlusMode",
+    "ControlChange",
+    "ControlChangeKind",
     "Device",
     "DeviceControl",
     "DeviceState",
+    "DeviceStateResult",
     "DeviceType",
+    "DeviceWriteResult",
     "DoorState",
     "HydroBreezeControl",
     "HydroBreezeMode",
@@ -71,5 +137,20 @@ __all__ = [
     "TemperatureControl",
     "TemperatureUnit",
     "ToggleControl",
+    "WriteResult",
     "ZonePosition",
+    "diff_states",
+    "parse_controls",
+    "register_control_type",
+    # Lazy models
+    "LazyAutoDoorControl",
+    "LazyBioFreshPlusControl",
+    "LazyControl",
+    "LazyDevice",
+    "LazyHydroBreezeControl",
+    "LazyIceMakerControl",
+    "LazyModel",
+    "LazyTemperatureControl",
+    "LazyToggleControl",
+    "lazy_controls",
 ]
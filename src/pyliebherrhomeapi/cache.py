@@ -0,0 +1,164 @@
+"""Response cache for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["CacheStats", "ResponseCache"]
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    CACHE_CONTROL,
+    CACHE_CONTROLS,
+    CACHE_DEVICE,
+    CACHE_DEVICES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_DEVICE_CACHE_TTL,
+)
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+def _endpoint_kind(endpoint: str) -> str | None:
+    """Return the cache kind of an endpoint path, if it has one."""
+
+    parts = endpoint.strip("/").split("/")
+    if parts[0] != "devices":
+        return None
+    if len(parts) == 1:
+        return CACHE_DEVICES
+    if len(parts) == 2:
+        return CACHE_DEVICE
+    if len(parts) == 3 and parts[2] == "controls":
+        return CACHE_CONTROLS
+    if len(parts) == 4 and parts[2] == "controls":
+        return CACHE_CONTROL
+    return None
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of response cache usage."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """In-memory TTL and LRU cache for GET responses.
+
+    Each endpoint kind (``devices``, ``device``, ``controls``, ``control``)
+    has its own TTL; kinds without a TTL are not cached. By default only
+    device metadata is cached, for one hour. The number of entries is bounded
+    and the least recently used entry is evicted first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttls: dict[str, float | None] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+            ttls: Seconds to keep responses per endpoint kind. Merged with
+                the defaults; ``None`` disables caching for a kind.
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._ttls: dict[str, float | None] = {
+            CACHE_DEVICES: DEFAULT_DEVICE_CACHE_TTL,
+            CACHE_DEVICE: DEFAULT_DEVICE_CACHE_TTL,
+            CACHE_CONTROLS: None,
+            CACHE_CONTROL: None,
+        }
+        if ttls:
+            unknown = set(ttls) - set(self._ttls)
+            if unknown:
+                raise ValueError(f"Unknown cache kinds: {sorted(unknown)}")
+            self._ttls.update(ttls)
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        """Return the TTL for an endpoint, or None if it is not cached."""
+        kind = _endpoint_kind(endpoint)
+        if kind is None:
+            return None
+        return self._ttls.get(kind)
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Look up a response.
+
+        Returns:
+            Tuple of (hit, value).
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, value
+            del self._entries[key]
+            self._expirations += 1
+        self._misses += 1
+        return False, None
+
+    def set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Store a response for ``ttl`` seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, predicate: Callable[[str], bool] | None = None) -> int:
+        """Drop cached responses.
+
+        Args:
+            predicate: Called with each cached endpoint; matching entries are
+                dropped. Drops everything when omitted.
+
+        Returns:
+            Number of entries dropped.
+
+        """
+        if predicate is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        keys = [key for key in self._entries if predicate(key[0])]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of cache usage."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._entries),
+        )
@@ -21,16 +21,27 @@ from __future__ import annotations
 
 __all__ = ["LiebherrClient"]
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any
+from typing import Any, Literal, TypeVar, overload
 
 import aiohttp
-from aiohttp import ContentTypeError
 
+from .cache import ResponseCache, _endpoint_kind
+from .connector import ConnectorConfig, PoolStats, _PoolTracker
 from .const import (
     API_BASE_URL,
     API_VERSION,
+    CACHE_DEVICES,
+    COALESCED_CONTROLS,
     CONTROL_AUTO_DOOR,
     CONTROL_BIO_FRESH_PLUS,
     CONTROL_HYDRO_BREEZE,
@@ -41,32 +52,76 @@ from .const import (
     CONTROL_SUPERCOOL,
     CONTROL_SUPERFROST,
     CONTROL_TEMPERATURE,
+    DEFAULT_BULK_CONCURRENCY,
     DEFAULT_TIMEOUT,
+    IDEMPOTENT_CONTROLS,
 )
 from .exceptions import (
     LiebherrAuthenticationError,
     LiebherrBadRequestError,
     LiebherrConnectionError,
+    LiebherrError,
     LiebherrNotFoundError,
     LiebherrPreconditionFailedError,
+    LiebherrRateLimitError,
     LiebherrServerError,
     LiebherrTimeoutError,
     LiebherrUnsupportedError,
 )
+from .lazy import LazyControl, LazyDevice, lazy_controls
+from .metrics import ClientMetrics
 from .models import (
+    BioFreshPlusControl,
     BioFreshPlusMode,
     Device,
     DeviceControl,
     DeviceState,
+    DeviceStateResult,
+    DeviceWriteResult,
+    HydroBreezeControl,
     HydroBreezeMode,
+    IceMakerControl,
     IceMakerMode,
     TemperatureControl,
     TemperatureUnit,
-    parse_control,
+    ToggleControl,
+    WriteResult,
+    parse_controls,
 )
+from .ratelimit import RateLimiter, _parse_retry_after
+from .retry import RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
+WriteListener = Callable[[str, str, int | None], None]
+WriteValueListener = Callable[[str, str, dict[str, Any]], None]
+JsonLoads = Callable[[bytes], Any]
+BulkProgress = Callable[[DeviceWriteResult, int, int], None]
+
+_ResultT = TypeVar("_ResultT")
+
+
+def _default_json_loads() -> JsonLoads:
+    """Return orjson.loads when orjson is installed, else json.loads."""
+
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def _freeze_params(params: dict[str, Any] | None) -> tuple[tuple[str, Any], ...]:
+    """Return query parameters in a hashable, order-independent form."""
+
+    return tuple(sorted((params or {}).items()))
+
+
+def _device_id_of(item: str | Device) -> str:
+    """Return the device ID of a device ID or Device."""
+
+    return item.device_id if isinstance(item, Device) else item
+
 
 def _get_version() -> str:
     """Return installed package version with a safe fallback."""
@@ -77,6 +132,143 @@ def _get_version() -> str:
         return "0.0.0"
 
 
+def _write_payload(control: DeviceControl) -> dict[str, Any] | None:
+    """Return the write body that would set a control to its current value."""
+
+    values: dict[str, Any]
+    if isinstance(control, TemperatureControl):
+        values = {"target": control.target, "unit": control.unit}
+    elif isinstance(control, ToggleControl):
+        values = {"value": control.value}
+    elif isinstance(control, IceMakerControl):
+        values = {"iceMakerMode": control.ice_maker_mode}
+    elif isinstance(control, HydroBreezeControl):
+        values = {"hydroBreezeMode": control.current_mode}
+    elif isinstance(control, BioFreshPlusControl):
+        values = {"bioFreshPlusMode": control.current_mode}
+    else:
+        return None
+    if any(value is None for value in values.values()):
+        return None
+    if control.zone_id is None:
+        return values
+    return {"zoneId": control.zone_id} | values
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    """Mark a shared future's exception as retrieved.
+
+    Every caller waiting on the future may have been cancelled before it
+    failed; asyncio would then log the exception as never retrieved.
+    """
+
+    if not future.cancelled():
+        future.exception()
+
+
+class _InFlight:
+    """An upstream request shared by concurrent identical callers."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class _PendingWrite:
+    """A debounced control write shared by every caller it superseded."""
+
+    __slots__ = ("flush_now", "future", "json_data", "previous")
+
+    def __init__(
+        self,
+        json_data: dict[str, Any],
+        future: asyncio.Future[WriteResult],
+        previous: asyncio.Future[WriteResult] | None,
+    ) -> None:
+        self.json_data = json_data
+        self.future = future
+        self.previous = previous
+        self.flush_now = asyncio.Event()
+
+
+class _BodyMemo:
+    """Digest, ETag and decoded data of the last response from an endpoint."""
+
+    __slots__ = ("data", "digest", "etag")
+
+    def __init__(
+        self,
+        digest: bytes,
+        etag: str | None,
+        data: dict[str, Any] | list[Any] | None,
+    ) -> None:
+        self.digest = digest
+        self.etag = etag
+        self.data = data
+
+
+async def _iter_bounded(
+    items: Iterable[str | Device],
+    run: Callable[[str | Device], Awaitable[_ResultT]],
+    timed_out: Callable[[str], _ResultT],
+    *,
+    concurrency: int,
+    deadline: float | None,
+) -> AsyncGenerator[_ResultT, None]:
+    """Run ``run`` per device with bounded concurrency, yielding results.
+
+    Items are pulled only as slots free up. Devices not done by the deadline
+    are cancelled or never started and yielded as ``timed_out(device_id)``.
+    Leaving the loop early cancels the calls still in flight.
+    """
+
+    remaining = iter(items)
+    loop = asyncio.get_running_loop()
+    expires = None if deadline is None else loop.time() + deadline
+    running: dict[asyncio.Future[_ResultT], str] = {}
+
+    def _start_next() -> None:
+        for item in remaining:
+            running[asyncio.ensure_future(run(item))] = _device_id_of(item)
+            return
+
+    try:
+        for _ in range(concurrency):
+            _start_next()
+        while running:
+            timeout = None if expires is None else max(0, expires - loop.time())
+            done, _pending = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                del running[task]
+                _start_next()
+            for task in done:
+                yield task.result()
+
+        if running:
+            unfinished = list(running.values())
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            running.clear()
+            unfinished.extend(_device_id_of(item) for item in remaining)
+            _LOGGER.warning(
+                "Deadline of %ss exceeded with %d device(s) not done",
+                deadline,
+                len(unfinished),
+            )
+            for device_id in unfinished:
+                yield timed_out(device_id)
+    finally:
+        for task in running:
+            task.cancel()
+
+
 class LiebherrClient:
     """Client for interacting with Liebherr Home API."""
 
@@ -86,6 +278,15 @@ class LiebherrClient:
         session: aiohttp.ClientSession | None = None,
         timeout: int = DEFAULT_TIMEOUT,
         base_url: str = API_BASE_URL,
+        connector_config: ConnectorConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalesce_requests: bool = True,
+        cache: ResponseCache | None = None,
+        skip_unchanged: bool = False,
+        json_loads: JsonLoads | None = None,
+        write_debounce: float | None = None,
+        skip_redundant_writes: float | None = None,
     ) -> None:
         """Initialize the Liebherr client.
 
@@ -94,6 +295,35 @@ class LiebherrClient:
             session: Optional aiohttp session. If not provided, new one created.
             timeout: Request timeout in seconds.
             base_url: Base URL for the API (default: production URL).
+            connector_config: Connection pool settings for the client-owned
+                session. Ignored when a session is provided.
+            rate_limiter: Optional token bucket every request waits on. Use
+                ``RateLimiter.for_api_key`` to share one budget between
+                clients using the same API key.
+            retry_policy: Optional retry policy. By default it only applies
+                to GET requests.
+            coalesce_requests: Share one upstream request between concurrent
+                identical GET requests.
+            cache: Optional response cache for GET requests. By default it
+                caches device metadata only.
+            skip_unchanged: Hash GET response bodies and reuse the previously
+                decoded and parsed objects when a body has not changed. Also
+                sends If-None-Match when the server provides ETags. Reused
+                model objects are shared between calls and must be treated
+                as read-only.
+            json_loads: Function decoding a raw response body. Must raise
+                ValueError for invalid JSON. Defaults to ``orjson.loads``
+                when orjson is installed and ``json.loads`` otherwise.
+            write_debounce: Seconds to hold temperature, presentation light,
+                ice maker, HydroBreeze and BioFreshPlus writes so that later
+                writes to the same control and zone replace them. Only the
+                last value is sent and every superseded call completes with
+                it. Disabled by default.
+            skip_redundant_writes: Maximum age in seconds of a known control
+                value that writes are checked against. A write matching the
+                value last read or written within that time is skipped and
+                returns ``WriteResult.NO_OP``. Auto door actions are always
+                sent. Disabled by default.
 
         """
         self._api_key = api_key
@@ -102,6 +332,40 @@ class LiebherrClient:
         self._base_url = base_url.rstrip("/")
         self._own_session = session is None
         self._user_agent = f"pyliebherrhomeapi/{_get_version()}"
+        self._connector_config = connector_config or ConnectorConfig()
+        self._pool_tracker = _PoolTracker()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._metrics = ClientMetrics()
+        self._coalesce_requests = coalesce_requests
+        self._inflight: dict[tuple[Any, ...], _InFlight] = {}
+        self._cache = cache
+        self._write_listeners: list[WriteListener] = []
+        self._write_value_listeners: list[WriteValueListener] = []
+        if write_debounce is not None and write_debounce < 0:
+            raise ValueError("write_debounce must be >= 0")
+        self._write_debounce = write_debounce
+        self._pending_writes: dict[tuple[str, str, Any], _PendingWrite] = {}
+        self._sending_writes: dict[
+            tuple[str, str, Any], asyncio.Future[WriteResult]
+        ] = {}
+        self._write_tasks: set[asyncio.Task[None]] = set()
+        if skip_redundant_writes is not None and skip_redundant_writes < 0:
+            raise ValueError("skip_redundant_writes must be >= 0")
+        self._known_max_age = skip_redundant_writes
+        self._known_values: dict[
+            tuple[str, str, Any], tuple[float, dict[str, Any]]
+        ] = {}
+        self._skip_unchanged = skip_unchanged
+        self._json_loads = json_loads or _default_json_loads()
+        self._body_memo: dict[tuple[Any, ...], _BodyMemo] = {}
+        self._parsed_controls: dict[
+            tuple[Any, ...], tuple[list[Any], list[DeviceControl]]
+        ] = {}
+        if session is not None and connector_config is not None:
+            _LOGGER.warning(
+                "connector_config is ignored when an external session is provided"
+            )
         _LOGGER.debug(
             "Initialized LiebherrClient "
             "(base_url=%s, timeout=%ds, external_session=%s)",
@@ -113,10 +377,74 @@ class LiebherrClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None:
-            _LOGGER.debug("Creating new aiohttp ClientSession")
-            self._session = aiohttp.ClientSession()
+            _LOGGER.debug(
+                "Creating new aiohttp ClientSession "
+                "(limit=%d, limit_per_host=%d, keepalive=%ss, dns_ttl=%s)",
+                self._connector_config.limit,
+                self._connector_config.limit_per_host,
+                self._connector_config.keepalive_timeout,
+                self._connector_config.ttl_dns_cache,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector_config.create_connector(),
+                trace_configs=[self._pool_tracker.trace_config()],
+            )
         return self._session
 
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of connection pool usage.
+
+        Wait and connection counters are only collected for client-owned
+        sessions; ``in_use`` always reflects requests made by this client.
+
+        Returns:
+            PoolStats snapshot.
+
+        """
+        connector = self._session.connector if self._session is not None else None
+        return self._pool_tracker.snapshot(connector)
+
+    async def warm_up(self, connections: int | None = None) -> int:
+        """Pre-open pooled connections to the API host.
+
+        Issues concurrent HEAD requests to the base URL so that the TCP and TLS
+        handshakes are done before the first API call. The requests carry no
+        API key. Failures are logged and ignored.
+
+        Args:
+            connections: Number of connections to open. Defaults to
+                ``ConnectorConfig.warm_up_connections``.
+
+        Returns:
+            Number of connections that were opened successfully.
+
+        """
+        count = (
+            self._connector_config.warm_up_connections
+            if connections is None
+            else connections
+        )
+        if count <= 0:
+            return 0
+        session = await self._get_session()
+
+        async def _open() -> bool:
+            try:
+                async with session.head(
+                    self._base_url,
+                    headers={"User-Agent": self._user_agent},
+                    timeout=aiohttp.ClientTimeout(total=self._timeout),
+                ):
+                    return True
+            except (TimeoutError, aiohttp.ClientError) as ex:
+                _LOGGER.debug("Warm-up connection failed: %s", ex)
+                return False
+
+        results = await asyncio.gather(*(_open() for _ in range(count)))
+        opened = sum(results)
+        _LOGGER.debug("Warmed up %d/%d connection(s)", opened, count)
+        return opened
+
     async def _request(
         self,
         method: str,
@@ -142,19 +470,174 @@ class LiebherrClient:
             LiebherrPreconditionFailedError: If precondition fails.
             LiebherrUnsupportedError: If operation is not supported.
             LiebherrServerError: If server returns 500 error.
+            LiebherrRateLimitError: If the rate or bandwidth limit is exceeded.
             LiebherrConnectionError: If connection fails.
             LiebherrTimeoutError: If request times out.
 
         """
+        if method != "GET" or json_data is not None:
+            return await self._request_with_retry(method, endpoint, json_data, params)
+
+        ttl = self._cache.ttl_for(endpoint) if self._cache is not None else None
+        cache_key = (endpoint, _freeze_params(params))
+        if self._cache is not None and ttl:
+            hit, cached = self._cache.get(cache_key)
+            if hit:
+                _LOGGER.debug("Cache hit for %s", endpoint)
+                return cached  # type: ignore[no-any-return]
+
+        if self._coalesce_requests:
+            data = await self._coalesced_request(method, endpoint, params)
+        else:
+            data = await self._request_with_retry(method, endpoint, None, params)
+
+        if self._cache is not None and ttl:
+            self._cache.set(cache_key, data, ttl)
+            self._seed_device_cache(endpoint, data)
+        return data
+
+    def _seed_device_cache(
+        self, endpoint: str, data: dict[str, Any] | list[Any] | None
+    ) -> None:
+        """Store each device of a device list response as its own entry."""
+        if self._cache is None or _endpoint_kind(endpoint) != CACHE_DEVICES:
+            return
+        if not isinstance(data, list):
+            return
+        for device in data:
+            if not isinstance(device, dict) or "deviceId" not in device:
+                continue
+            device_endpoint = f"devices/{device['deviceId']}"
+            ttl = self._cache.ttl_for(device_endpoint)
+            if ttl:
+                self._cache.set((device_endpoint, ()), device, ttl)
+
+    async def _coalesced_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Share one upstream request between identical concurrent callers.
+
+        The upstream request runs in its own task. Each caller waits on it
+        through a shield, so cancelling one caller does not affect the others;
+        the request is only cancelled once every caller has gone away.
+        """
+        key = (method, endpoint, _freeze_params(params))
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _InFlight(
+                asyncio.ensure_future(
+                    self._request_with_retry(method, endpoint, None, params)
+                )
+            )
+            self._inflight[key] = flight
+            flight.task.add_done_callback(
+                lambda _task: self._forget_inflight(key, flight)
+            )
+        else:
+            self._metrics.coalesced += 1
+            _LOGGER.debug("Joining in-flight %s request to %s", method, endpoint)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._forget_inflight(key, flight)
+                flight.task.cancel()
+
+    def _forget_inflight(self, key: tuple[Any, ...], flight: _InFlight) -> None:
+        """Remove an in-flight request so new callers start a fresh one."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Send a request, retrying per the configured retry policy."""
+        policy = self._retry_policy
+        if policy is None or not policy.applies_to(method):
+            return await self._send_request(method, endpoint, json_data, params)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if policy.deadline is None else loop.time() + policy.deadline
+        attempt = 1
+        try:
+            async with asyncio.timeout_at(deadline):
+                while True:
+                    try:
+                        return await self._send_request(
+                            method, endpoint, json_data, params
+                        )
+                    except LiebherrError as err:
+                        if not policy.should_retry(err):
+                            raise
+                        delay = policy.backoff(attempt)
+                        if isinstance(err, LiebherrRateLimitError) and err.retry_after:
+                            delay = max(delay, err.retry_after)
+                        if attempt >= policy.max_attempts or (
+                            deadline is not None and loop.time() + delay >= deadline
+                        ):
+                            self._metrics.retries_exhausted += 1
+                            _LOGGER.warning(
+                                "Giving up on %s %s after %d attempt(s): %s",
+                                method,
+                                endpoint,
+                                attempt,
+                                err,
+                            )
+                            raise
+                        self._metrics.record_retry(err)
+                        _LOGGER.debug(
+                            "Retrying %s %s in %.2fs (attempt %d/%d): %s",
+                            method,
+                            endpoint,
+                            delay,
+                            attempt + 1,
+                            policy.max_attempts,
+                            err,
+                        )
+                        await asyncio.sleep(delay)
+                        attempt += 1
+        except TimeoutError as ex:
+            self._metrics.retries_exhausted += 1
+            _LOGGER.warning("Retry deadline exceeded for %s %s", method, endpoint)
+            raise LiebherrTimeoutError("Retry deadline exceeded") from ex
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Send a single API request and map the response status."""
         url = f"{self._base_url}/{API_VERSION}/{endpoint}"
         headers = {
             "api-key": self._api_key,
             "User-Agent": self._user_agent,
         }
+        memo_key = None
+        if self._skip_unchanged and method == "GET":
+            memo_key = (endpoint, _freeze_params(params))
+            memo = self._body_memo.get(memo_key)
+            if memo is not None and memo.etag is not None:
+                headers["If-None-Match"] = memo.etag
         session = await self._get_session()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
 
         _LOGGER.debug("Making %s request to %s", method, endpoint)
 
+        self._metrics.requests += 1
+        self._pool_tracker.in_use += 1
         try:
             async with session.request(
                 method,
@@ -167,18 +650,31 @@ class LiebherrClient:
                 _LOGGER.debug("Response %d from %s", response.status, endpoint)
                 if response.status == 204:
                     return None
+                if response.status == 304:
+                    if memo_key in self._body_memo:
+                        self._metrics.unchanged += 1
+                        return self._body_memo[memo_key].data
+                    raise LiebherrServerError(
+                        f"Unexpected response format (304): {response.reason or ''}"
+                    )
+
+                body: bytes | None = None
 
-                async def _safe_json() -> Any:
-                    return await response.json()
+                async def _read_body() -> bytes:
+                    nonlocal body
+                    if body is None:
+                        body = await response.read()
+                    return body
 
                 async def _extract_message() -> str:
+                    raw = await _read_body()
                     try:
-                        error_data = await _safe_json()
-                        if isinstance(error_data, dict):
-                            return str(error_data.get("message", "Unknown error"))
-                    except (ContentTypeError, ValueError):
-                        text = await response.text()
+                        error_data = self._json_loads(raw)
+                    except ValueError:
+                        text = raw.decode(errors="replace")
                         return text.strip() or response.reason or ""
+                    if isinstance(error_data, dict):
+                        return str(error_data.get("message", "Unknown error"))
                     return response.reason or ""
 
                 if response.status == 401:
@@ -204,6 +700,22 @@ class LiebherrClient:
                     msg = await _extract_message()
                     _LOGGER.error("Server error: %s", msg)
                     raise LiebherrServerError(f"Internal server error: {msg}")
+                if response.status in (429, 509):
+                    retry_after = _parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    msg = await _extract_message()
+                    _LOGGER.warning(
+                        "Rate limit exceeded (%d, retry after %s): %s",
+                        response.status,
+                        retry_after,
+                        msg,
+                    )
+                    if self._rate_limiter is not None and retry_after:
+                        self._rate_limiter.pause(retry_after)
+                    raise LiebherrRateLimitError(
+                        f"Rate limit exceeded: {msg}", retry_after=retry_after
+                    )
                 if response.status == 503:
                     msg = await _extract_message()
                     _LOGGER.error("Service unavailable: %s", msg)
@@ -218,14 +730,10 @@ class LiebherrClient:
                     raise LiebherrConnectionError(
                         f"HTTP {response.status}: {msg}"
                     ) from err
-                try:
-                    data: dict[str, Any] | list[Any] = await _safe_json()
-                except (ContentTypeError, ValueError) as err:
-                    msg = await _extract_message()
-                    raise LiebherrServerError(
-                        f"Unexpected response format ({response.status}): {msg}"
-                    ) from err
-                return data
+                raw = await _read_body()
+                if memo_key is not None:
+                    return self._decode_memoized(memo_key, raw, response)
+                return self._decode(raw, response)
 
         except (TimeoutError, aiohttp.ServerTimeoutError) as ex:
             _LOGGER.warning(
@@ -238,9 +746,168 @@ class LiebherrClient:
         except aiohttp.ClientError as ex:
             _LOGGER.error("Connection error for %s %s: %s", method, endpoint, ex)
             raise LiebherrConnectionError(f"Connection error: {ex}") from ex
+        finally:
+            self._pool_tracker.in_use -= 1
+
+    def _decode(
+        self, body: bytes, response: aiohttp.ClientResponse
+    ) -> dict[str, Any] | list[Any] | None:
+        """Decode a JSON response body with the configured loads function.
+
+        An empty body decodes to None, like ``aiohttp``'s ``json()``.
+        """
+        if not body.strip():
+            return None
+        try:
+            data: dict[str, Any] | list[Any] = self._json_loads(body)
+        except ValueError as err:
+            msg = body.decode(errors="replace").strip() or response.reason or ""
+            raise LiebherrServerError(
+                f"Unexpected response format ({response.status}): {msg}"
+            ) from err
+        return data
+
+    def _decode_memoized(
+        self, key: tuple[Any, ...], body: bytes, response: aiohttp.ClientResponse
+    ) -> dict[str, Any] | list[Any] | None:
+        """Decode a response body unless it matches the last one for ``key``."""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        memo = self._body_memo.get(key)
+        if memo is not None and memo.digest == digest:
+            self._metrics.unchanged += 1
+            return memo.data
+        data = self._decode(body, response)
+        self._body_memo[key] = _BodyMemo(digest, response.headers.get("ETag"), data)
+        return data
+
+    def _parse_controls(
+        self, key: tuple[Any, ...], response: list[Any]
+    ) -> list[DeviceControl]:
+        """Parse controls, reusing the last result for an unchanged response."""
+        if not self._skip_unchanged:
+            controls = parse_controls(response)
+        else:
+            memo = self._parsed_controls.get(key)
+            if memo is None or memo[0] is not response:
+                memo = self._parsed_controls[key] = (response, parse_controls(response))
+            controls = list(memo[1])
+        if self._known_max_age is not None:
+            self._remember_controls(key[0], controls)
+        return controls
+
+    def _remember_controls(self, device_id: str, controls: list[DeviceControl]) -> None:
+        """Record the write payloads matching freshly read controls."""
+        now = time.monotonic()
+        for control in controls:
+            payload = _write_payload(control)
+            if payload is not None:
+                key = (device_id, control.name, control.zone_id)
+                self._known_values[key] = (now, payload)
+
+    def _is_redundant(
+        self, key: tuple[str, str, Any], json_data: dict[str, Any]
+    ) -> bool:
+        """Return True if a write would not change a recently known value."""
+        if self._known_max_age is None or key[1] not in IDEMPOTENT_CONTROLS:
+            return False
+        known = self._known_values.get(key)
+        if known is None:
+            return False
+        seen, payload = known
+        return time.monotonic() - seen <= self._known_max_age and payload == json_data
+
+    @property
+    def metrics(self) -> ClientMetrics:
+        """Return the counters collected by this client."""
+        return self._metrics
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Return the response cache, if one is configured."""
+        return self._cache
+
+    def invalidate_cache(self, device_id: str | None = None) -> int:
+        """Drop cached responses.
+
+        Args:
+            device_id: Only drop responses for this device (and the device
+                list, which contains it). Drops everything when omitted.
+
+        Returns:
+            Number of entries dropped.
+
+        """
+        if self._cache is None:
+            return 0
+        if device_id is None:
+            return self._cache.invalidate()
+        prefix = f"devices/{device_id}"
+        return self._cache.invalidate(
+            lambda endpoint: (
+                endpoint == "devices"
+                or endpoint == prefix
+                or endpoint.startswith(f"{prefix}/")
+            )
+        )
+
+    @property
+    def rate_limit_queue_depth(self) -> int:
+        """Return the number of requests waiting on the rate limiter."""
+        if self._rate_limiter is None:
+            return 0
+        return self._rate_limiter.queue_depth
+
+    def add_write_listener(self, listener: WriteListener) -> Callable[[], None]:
+        """Call ``listener`` after every successful control write.
+
+        Args:
+            listener: Callable taking the device ID, control name and zone ID
+                (None for base controls).
+
+        Returns:
+            Callable that removes the listener.
+
+        """
+        self._write_listeners.append(listener)
+        return lambda: self._write_listeners.remove(listener)
+
+    def add_write_value_listener(
+        self, listener: WriteValueListener
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the written values after every control write.
+
+        Only writes that were sent and succeeded are reported.
+
+        Args:
+            listener: Callable taking the device ID, control name and the
+                request body of the write.
+
+        Returns:
+            Callable that removes the listener.
+
+        """
+        self._write_value_listeners.append(listener)
+        return lambda: self._write_value_listeners.remove(listener)
+
+    async def flush_writes(self) -> None:
+        """Send all debounced writes now and wait until they completed.
+
+        Writes whose request is already being sent are waited for too.
+        Errors are reported to the callers of the write methods.
+        """
+        pending = list(self._pending_writes.values())
+        for write in pending:
+            write.flush_now.set()
+        futures = [write.future for write in pending]
+        futures.extend(self._sending_writes.values())
+        await asyncio.gather(
+            *(asyncio.shield(future) for future in futures),
+            return_exceptions=True,
+        )
 
     async def close(self) -> None:
-        """Close the client session."""
+        """Send debounced writes and close the client session."""
+        await self.flush_writes()
         if self._own_session and self._session:
             _LOGGER.debug("Closing aiohttp ClientSession")
             await self._session.close()
@@ -248,6 +915,8 @@ class LiebherrClient:
 
     async def __aenter__(self) -> LiebherrClient:
         """Async context manager entry."""
+        if self._own_session and self._connector_config.warm_up_connections:
+            await self.warm_up()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -256,9 +925,21 @@ class LiebherrClient:
 
     # Device endpoints
 
-    async def get_devices(self) -> list[Device]:
+    @overload
+    async def get_devices(self, *, lazy: Literal[False] = False) -> list[Device]: ...
+
+    @overload
+    async def get_devices(self, *, lazy: Literal[True]) -> list[LazyDevice]: ...
+
+    async def get_devices(
+        self, *, lazy: bool = False
+    ) -> list[Device] | list[LazyDevice]:
         """Get all connected devices.
 
+        Args:
+            lazy: Return LazyDevice views that decode fields on first access
+                instead of Device objects.
+
         Returns:
             List of Device objects.
 
@@ -275,9 +956,11 @@ class LiebherrClient:
         if not isinstance(response, list):
             raise LiebherrServerError("Unexpected response format for devices")
 
-        devices = [
-            Device.from_dict(device) for device in response if isinstance(device, dict)
-        ]
+        devices: list[Device] | list[LazyDevice]
+        if lazy:
+            devices = [LazyDevice(d) for d in response if isinstance(d, dict)]
+        else:
+            devices = [Device.from_dict(d) for d in response if isinstance(d, dict)]
         _LOGGER.debug("Retrieved %d device(s)", len(devices))
         return devices
 
@@ -305,11 +988,25 @@ class LiebherrClient:
 
     # Control endpoints
 
-    async def get_controls(self, device_id: str) -> list[DeviceControl]:
+    @overload
+    async def get_controls(
+        self, device_id: str, *, lazy: Literal[False] = False
+    ) -> list[DeviceControl]: ...
+
+    @overload
+    async def get_controls(
+        self, device_id: str, *, lazy: Literal[True]
+    ) -> list[LazyControl | DeviceControl]: ...
+
+    async def get_controls(
+        self, device_id: str, *, lazy: bool = False
+    ) -> list[DeviceControl] | list[LazyControl | DeviceControl]:
         """Get all controls for a device.
 
         Args:
             device_id: The device ID (serial number).
+            lazy: Return lazy views that decode fields on first access
+                instead of control objects (see ``lazy_controls()``).
 
         Returns:
             List of control objects.
@@ -323,9 +1020,9 @@ class LiebherrClient:
         response = await self._request("GET", f"devices/{device_id}/controls")
         if not isinstance(response, list):
             raise LiebherrServerError("Unexpected response format for controls")
-        return [
-            parse_control(control) for control in response if isinstance(control, dict)
-        ]
+        if lazy:
+            return lazy_controls(response)
+        return self._parse_controls((device_id,), response)
 
     async def get_control(
         self,
@@ -357,9 +1054,98 @@ class LiebherrClient:
         )
         if not isinstance(response, list):
             raise LiebherrServerError("Unexpected response format for control")
-        return [
-            parse_control(control) for control in response if isinstance(control, dict)
-        ]
+        return self._parse_controls((device_id, control_name, zone_id), response)
+
+    async def _post_control(
+        self, device_id: str, control_name: str, json_data: dict[str, Any]
+    ) -> WriteResult:
+        """Write a control, debounced when write coalescing applies to it."""
+        if self._write_debounce is None or control_name not in COALESCED_CONTROLS:
+            return await self._send_control(device_id, control_name, json_data)
+
+        key = (device_id, control_name, json_data.get("zoneId"))
+        write = self._pending_writes.get(key)
+        if write is not None:
+            # Last write wins; earlier callers complete with this one
+            write.json_data = json_data
+            self._metrics.writes_coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+            write = _PendingWrite(json_data, future, self._sending_writes.get(key))
+            self._pending_writes[key] = write
+            task = loop.create_task(self._flush_write(key, write))
+            self._write_tasks.add(task)
+            task.add_done_callback(partial(self._finish_write, key, write))
+        return await asyncio.shield(write.future)
+
+    async def _flush_write(
+        self, key: tuple[str, str, Any], write: _PendingWrite
+    ) -> None:
+        """Send a debounced write after its window and resolve its callers."""
+        try:
+            try:
+                async with asyncio.timeout(self._write_debounce):
+                    await write.flush_now.wait()
+            except TimeoutError:
+                pass
+            del self._pending_writes[key]
+            self._sending_writes[key] = write.future
+            if write.previous is not None:
+                # Keep writes to one control in order
+                await asyncio.wait([write.previous])
+            result = await self._send_control(key[0], key[1], write.json_data)
+        except Exception as err:
+            write.future.set_exception(err)
+        else:
+            write.future.set_result(result)
+
+    def _finish_write(
+        self, key: tuple[str, str, Any], write: _PendingWrite, task: asyncio.Task[None]
+    ) -> None:
+        """Forget a finished write; cancel its callers if it never completed."""
+        self._write_tasks.discard(task)
+        if self._pending_writes.get(key) is write:
+            del self._pending_writes[key]
+        if self._sending_writes.get(key) is write.future:
+            del self._sending_writes[key]
+        if not write.future.done():
+            write.future.cancel()
+
+    async def _send_control(
+        self, device_id: str, control_name: str, json_data: dict[str, Any]
+    ) -> WriteResult:
+        """Write a control unless redundant and notify the write listeners."""
+        zone_id = json_data.get("zoneId")
+        key = (device_id, control_name, zone_id)
+        if self._is_redundant(key, json_data):
+            _LOGGER.debug("Skipping redundant %s write", control_name)
+            self._metrics.writes_skipped += 1
+            return WriteResult.NO_OP
+        try:
+            await self._request(
+                "POST",
+                f"devices/{device_id}/controls/{control_name}",
+                json_data=json_data,
+            )
+        except Exception:
+            # The device may or may not have applied the write
+            self._known_values.pop(key, None)
+            raise
+        if self._known_max_age is not None and control_name in IDEMPOTENT_CONTROLS:
+            self._known_values[key] = (time.monotonic(), json_data)
+        for listener in list(self._write_listeners):
+            try:
+                listener(device_id, control_name, zone_id)
+            except Exception:
+                _LOGGER.exception("Error in control write listener")
+        for value_listener in list(self._write_value_listeners):
+            try:
+                value_listener(device_id, control_name, dict(json_data))
+            except Exception:
+                _LOGGER.exception("Error in control write listener")
+        return WriteResult.SENT
 
     # Temperature control
 
@@ -369,7 +1155,7 @@ class LiebherrClient:
         zone_id: int,
         target: int,
         unit: TemperatureUnit = TemperatureUnit.CELSIUS,
-    ) -> None:
+    ) -> WriteResult:
         """Set temperature for a zone.
 
         Args:
@@ -378,6 +1164,10 @@ class LiebherrClient:
             target: Target temperature.
             unit: Temperature unit (default: Celsius).
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -386,10 +1176,10 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_TEMPERATURE}",
-            json_data={
+        return await self._post_control(
+            device_id,
+            CONTROL_TEMPERATURE,
+            {
                 "zoneId": zone_id,
                 "target": target,
                 "unit": unit.value,
@@ -398,7 +1188,9 @@ class LiebherrClient:
 
     # Toggle controls (SuperFrost, SuperCool, etc.)
 
-    async def set_superfrost(self, device_id: str, zone_id: int, value: bool) -> None:
+    async def set_superfrost(
+        self, device_id: str, zone_id: int, value: bool
+    ) -> WriteResult:
         """Set SuperFrost mode.
 
         Args:
@@ -406,6 +1198,10 @@ class LiebherrClient:
             zone_id: The zone ID.
             value: True to enable, False to disable.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -414,13 +1210,13 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_SUPERFROST}",
-            json_data={"zoneId": zone_id, "value": value},
+        return await self._post_control(
+            device_id, CONTROL_SUPERFROST, {"zoneId": zone_id, "value": value}
         )
 
-    async def set_supercool(self, device_id: str, zone_id: int, value: bool) -> None:
+    async def set_supercool(
+        self, device_id: str, zone_id: int, value: bool
+    ) -> WriteResult:
         """Set SuperCool mode.
 
         Args:
@@ -428,6 +1224,10 @@ class LiebherrClient:
             zone_id: The zone ID.
             value: True to enable, False to disable.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -436,19 +1236,21 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_SUPERCOOL}",
-            json_data={"zoneId": zone_id, "value": value},
+        return await self._post_control(
+            device_id, CONTROL_SUPERCOOL, {"zoneId": zone_id, "value": value}
         )
 
-    async def set_party_mode(self, device_id: str, value: bool) -> None:
+    async def set_party_mode(self, device_id: str, value: bool) -> WriteResult:
         """Set PartyMode.
 
         Args:
             device_id: The device ID (serial number).
             value: True to enable, False to disable.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -457,19 +1259,19 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_PARTY_MODE}",
-            json_data={"value": value},
-        )
+        return await self._post_control(device_id, CONTROL_PARTY_MODE, {"value": value})
 
-    async def set_night_mode(self, device_id: str, value: bool) -> None:
+    async def set_night_mode(self, device_id: str, value: bool) -> WriteResult:
         """Set NightMode.
 
         Args:
             device_id: The device ID (serial number).
             value: True to enable, False to disable.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -478,19 +1280,19 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_NIGHT_MODE}",
-            json_data={"value": value},
-        )
+        return await self._post_control(device_id, CONTROL_NIGHT_MODE, {"value": value})
 
-    async def set_presentation_light(self, device_id: str, target: int) -> None:
+    async def set_presentation_light(self, device_id: str, target: int) -> WriteResult:
         """Set presentation light intensity.
 
         Args:
             device_id: The device ID (serial number).
             target: Light intensity value.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -499,17 +1301,15 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_PRESENTATION_LIGHT}",
-            json_data={"target": target},
+        return await self._post_control(
+            device_id, CONTROL_PRESENTATION_LIGHT, {"target": target}
         )
 
     # Special controls
 
     async def set_ice_maker(
         self, device_id: str, zone_id: int, mode: IceMakerMode
-    ) -> None:
+    ) -> WriteResult:
         """Set ice maker mode.
 
         Args:
@@ -517,6 +1317,10 @@ class LiebherrClient:
             zone_id: The zone ID.
             mode: Ice maker mode (OFF, ON, MAX_ICE).
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -526,15 +1330,15 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_ICE_MAKER}",
-            json_data={"zoneId": zone_id, "iceMakerMode": mode.value},
+        return await self._post_control(
+            device_id,
+            CONTROL_ICE_MAKER,
+            {"zoneId": zone_id, "iceMakerMode": mode.value},
         )
 
     async def set_hydro_breeze(
         self, device_id: str, zone_id: int, mode: HydroBreezeMode
-    ) -> None:
+    ) -> WriteResult:
         """Set HydroBreeze mode.
 
         Args:
@@ -542,6 +1346,10 @@ class LiebherrClient:
             zone_id: The zone ID.
             mode: HydroBreeze mode (OFF, LOW, MEDIUM, HIGH).
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -551,15 +1359,15 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_HYDRO_BREEZE}",
-            json_data={"zoneId": zone_id, "hydroBreezeMode": mode.value},
+        return await self._post_control(
+            device_id,
+            CONTROL_HYDRO_BREEZE,
+            {"zoneId": zone_id, "hydroBreezeMode": mode.value},
         )
 
     async def set_bio_fresh_plus(
         self, device_id: str, zone_id: int, mode: BioFreshPlusMode
-    ) -> None:
+    ) -> WriteResult:
         """Set BioFreshPlus mode.
 
         Args:
@@ -567,6 +1375,10 @@ class LiebherrClient:
             zone_id: The zone ID.
             mode: BioFreshPlus mode.
 
+        Returns:
+            WriteResult.SENT, or WriteResult.NO_OP if the write was skipped
+            because the control already has the requested value.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -576,15 +1388,15 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_BIO_FRESH_PLUS}",
-            json_data={"zoneId": zone_id, "bioFreshPlusMode": mode.value},
+        return await self._post_control(
+            device_id,
+            CONTROL_BIO_FRESH_PLUS,
+            {"zoneId": zone_id, "bioFreshPlusMode": mode.value},
         )
 
     async def trigger_auto_door(
         self, device_id: str, zone_id: int, value: bool
-    ) -> None:
+    ) -> WriteResult:
         """Open or close auto door.
 
         Args:
@@ -592,6 +1404,9 @@ class LiebherrClient:
             zone_id: The zone ID.
             value: True to open, False to close.
 
+        Returns:
+            WriteResult.SENT; auto door actions are never skipped.
+
         Raises:
             LiebherrBadRequestError: If invalid data is provided.
             LiebherrNotFoundError: If device is not reachable.
@@ -601,19 +1416,23 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        await self._request(
-            "POST",
-            f"devices/{device_id}/controls/{CONTROL_AUTO_DOOR}",
-            json_data={"zoneId": zone_id, "value": value},
+        return await self._post_control(
+            device_id, CONTROL_AUTO_DOOR, {"zoneId": zone_id, "value": value}
         )
 
     # Convenience methods
 
-    async def get_device_state(self, device_id: str) -> DeviceState:
+    async def get_device_state(
+        self, device_id: str, device: Device | None = None
+    ) -> DeviceState:
         """Get complete device state (device info + all controls).
 
+        Device info and controls are fetched concurrently. When a known
+        Device is passed (e.g. from get_devices), only controls are fetched.
+
         Args:
             device_id: The device ID (serial number).
+            device: Optional already known device info to reuse.
 
         Returns:
             DeviceState object containing device info and all controls.
@@ -624,17 +1443,196 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        device = await self.get_device(device_id)
-        controls = await self.get_controls(device_id)
-        return DeviceState(device=device, controls=controls)
+        if device is not None:
+            controls = await self.get_controls(device_id)
+            return DeviceState(device=device, controls=controls)
+
+        device_task = asyncio.ensure_future(self.get_device(device_id))
+        controls_task = asyncio.ensure_future(self.get_controls(device_id))
+        try:
+            fetched, controls = await asyncio.gather(device_task, controls_task)
+        except BaseException:
+            device_task.cancel()
+            controls_task.cancel()
+            raise
+        return DeviceState(device=fetched, controls=controls)
+
+    async def get_all_device_states(
+        self,
+        device_ids: Iterable[str | Device] | None = None,
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> list[DeviceStateResult]:
+        """Get the state of many devices with bounded concurrency.
+
+        Per-device failures (e.g. an offline appliance or a malformed
+        response) are returned as results instead of aborting the sweep.
+
+        Args:
+            device_ids: Device IDs or known Device objects to fetch; device
+                info is only requested for bare IDs. Defaults to all devices
+                returned by get_devices.
+            concurrency: Maximum number of devices fetched at once.
+            deadline: Optional overall time limit in seconds. Devices not done
+                by then get a LiebherrTimeoutError result.
+
+        Returns:
+            One DeviceStateResult per device, in input order.
+
+        Raises:
+            LiebherrConnectionError: If the device list cannot be fetched.
+            LiebherrTimeoutError: If the device list request times out.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        items = await self.get_devices() if device_ids is None else list(device_ids)
+        by_id: dict[str, deque[DeviceStateResult]] = defaultdict(deque)
+        async for result in self.iter_device_states(
+            items, concurrency=concurrency, deadline=deadline
+        ):
+            by_id[result.device_id].append(result)
+        return [by_id[_device_id_of(item)].popleft() for item in items]
+
+    async def iter_device_states(
+        self,
+        device_ids: Iterable[str | Device] | None = None,
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        deadline: float | None = None,
+    ) -> AsyncGenerator[DeviceStateResult, None]:
+        """Yield device states as soon as each request completes.
+
+        At most ``concurrency`` devices are in flight, and device ids are
+        pulled from ``device_ids`` only as slots free up, so very large
+        fleets are never materialized at once. Leaving the loop early
+        cancels the requests still in flight.
+
+        Args:
+            device_ids: Device IDs or known Device objects to fetch; device
+                info is only requested for bare IDs. Defaults to all devices
+                returned by get_devices.
+            concurrency: Maximum number of devices fetched at once.
+            deadline: Optional overall time limit in seconds. Devices not done
+                by then are yielded with a LiebherrTimeoutError.
+
+        Yields:
+            DeviceStateResult for each device, in completion order.
+
+        Raises:
+            LiebherrConnectionError: If the device list cannot be fetched.
+            LiebherrTimeoutError: If the device list request times out.
 
-    async def refresh_device(self, device_id: str) -> DeviceState:
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if device_ids is None:
+            device_ids = await self.get_devices()
+
+        def _fetch(item: str | Device) -> Awaitable[DeviceStateResult]:
+            if isinstance(item, Device):
+                return self._fetch_state_result(item.device_id, item)
+            return self._fetch_state_result(item, None)
+
+        results = _iter_bounded(
+            device_ids,
+            _fetch,
+            lambda device_id: DeviceStateResult(
+                device_id=device_id, error=LiebherrTimeoutError("Deadline exceeded")
+            ),
+            concurrency=concurrency,
+            deadline=deadline,
+        )
+        async with aclosing(results):
+            async for result in results:
+                yield result
+
+    async def _fetch_state_result(
+        self, device_id: str, device: Device | None
+    ) -> DeviceStateResult:
+        """Fetch one device state, capturing any error in the result."""
+        try:
+            state = await self.get_device_state(device_id, device)
+        except Exception as err:
+            return DeviceStateResult(device_id=device_id, error=err)
+        return DeviceStateResult(device_id=device_id, state=state)
+
+    async def apply_to_devices(
+        self,
+        device_ids: Iterable[str | Device],
+        operation: Callable[[str], Awaitable[WriteResult]],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        deadline: float | None = None,
+        progress: BulkProgress | None = None,
+    ) -> list[DeviceWriteResult]:
+        """Apply the same write to many devices with bounded concurrency.
+
+        ``operation`` is called with each device ID and typically wraps one
+        of the setters, e.g. ``lambda device_id:
+        client.set_night_mode(device_id, True)``. Any exception raised for
+        a device is returned in its result instead of aborting the run.
+
+        Args:
+            device_ids: Device IDs or Device objects to write to.
+            operation: Write to apply to one device.
+            concurrency: Maximum number of devices written at once.
+            deadline: Optional overall time limit in seconds. Devices not done
+                by then get a LiebherrTimeoutError result.
+            progress: Optional callback called with each result, the number
+                of devices done so far and the total, in completion order.
+
+        Returns:
+            One DeviceWriteResult per device, in input order.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        items = list(device_ids)
+        total = len(items)
+
+        async def _apply(item: str | Device) -> DeviceWriteResult:
+            device_id = _device_id_of(item)
+            try:
+                result = await operation(device_id)
+            except Exception as err:
+                # Also covers errors raised by the operation itself
+                return DeviceWriteResult(device_id=device_id, error=err)
+            return DeviceWriteResult(device_id=device_id, result=result)
+
+        by_id: dict[str, deque[DeviceWriteResult]] = defaultdict(deque)
+        done = 0
+        writes = _iter_bounded(
+            items,
+            _apply,
+            lambda device_id: DeviceWriteResult(
+                device_id=device_id, error=LiebherrTimeoutError("Deadline exceeded")
+            ),
+            concurrency=concurrency,
+            deadline=deadline,
+        )
+        async with aclosing(writes):
+            async for write in writes:
+                by_id[write.device_id].append(write)
+                done += 1
+                if progress is not None:
+                    try:
+                        progress(write, done, total)
+                    except Exception:
+                        _LOGGER.exception("Error in bulk progress callback")
+        return [by_id[_device_id_of(item)].popleft() for item in items]
+
+    async def refresh_device(
+        self, device_id: str, device: Device | None = None
+    ) -> DeviceState:
         """Refresh and return current device state.
 
         This is an alias for get_device_state for better naming consistency.
 
         Args:
             device_id: The device ID (serial number).
+            device: Optional already known device info to reuse.
 
         Returns:
             DeviceState object containing device info and all controls.
@@ -645,7 +1643,7 @@ class LiebherrClient:
             LiebherrTimeoutError: If request times out.
 
         """
-        return await self.get_device_state(device_id)
+        return await self.get_device_state(device_id, device)
 
     async def get_temperature_controls(
         self, device_id: str
@@ -0,0 +1,133 @@
+"""Connection pool configuration for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["ConnectorConfig", "PoolStats"]
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+)
+
+
+@dataclass
+class ConnectorConfig:
+    """Connection pool settings for a client-owned aiohttp session.
+
+    These settings only apply when the client creates its own session. A
+    session passed to the client keeps the connector it was created with.
+    """
+
+    limit: int = DEFAULT_CONNECTION_LIMIT
+    limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: int | None = DEFAULT_DNS_CACHE_TTL
+    warm_up_connections: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate pool settings."""
+        if self.limit < 0:
+            raise ValueError("limit must be >= 0")
+        if self.limit_per_host < 0:
+            raise ValueError("limit_per_host must be >= 0")
+        if self.keepalive_timeout < 0:
+            raise ValueError("keepalive_timeout must be >= 0")
+        if self.warm_up_connections < 0:
+            raise ValueError("warm_up_connections must be >= 0")
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """Create a TCP connector using these settings.
+
+        Must be called from within a running event loop.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.ttl_dns_cache is not None,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of connection pool usage."""
+
+    limit: int
+    limit_per_host: int
+    in_use: int
+    idle: int
+    waiting: int
+    total_waits: int
+    connections_created: int
+    connections_reused: int
+
+
+class _PoolTracker:
+    """Collect connection pool statistics through aiohttp request tracing."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.in_use = 0
+        self.waiting = 0
+        self.total_waits = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config that feeds this tracker."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuseconn)
+        return trace_config
+
+    async def _on_queued_start(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.waiting += 1
+        self.total_waits += 1
+
+    async def _on_queued_end(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.waiting = max(0, self.waiting - 1)
+
+    async def _on_create_end(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_reuseconn(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    def snapshot(self, connector: aiohttp.BaseConnector | None) -> PoolStats:
+        """Build a stats snapshot for the given connector."""
+        limit = limit_per_host = idle = 0
+        if connector is not None:
+            limit = connector.limit
+            limit_per_host = connector.limit_per_host
+            # aiohttp keeps idle keep-alive connections per host key in _conns
+            conns = getattr(connector, "_conns", {})
+            idle = sum(len(host_conns) for host_conns in conns.values())
+        return PoolStats(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            in_use=self.in_use,
+            idle=idle,
+            waiting=self.waiting,
+            total_waits=self.total_waits,
+            connections_created=self.connections_created,
+            connections_reused=self.connections_reused,
+        )
@@ -4,6 +4,26 @@
 API_BASE_URL = "https://home-api.smartdevice.liebherr.com"
 API_VERSION = "v1"
 DEFAULT_TIMEOUT = 10
+DEFAULT_BULK_CONCURRENCY = 10
+DEFAULT_POLL_INTERVAL = 30
+DEFAULT_ADAPTIVE_FLOOR = 5
+DEFAULT_ADAPTIVE_CEILING = 300
+DEFAULT_ADAPTIVE_BACKOFF = 2.0
+DEFAULT_SUBSCRIPTION_QUEUE_SIZE = 16
+
+# Connection pool defaults (client-owned sessions only)
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+DEFAULT_DNS_CACHE_TTL = 300
+
+# Response cache
+CACHE_DEVICES = "devices"
+CACHE_DEVICE = "device"
+CACHE_CONTROLS = "controls"
+CACHE_CONTROL = "control"
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_DEVICE_CACHE_TTL = 3600
 
 # Control names
 CONTROL_TEMPERATURE = "temperature"
@@ -17,6 +37,23 @@ CONTROL_HYDRO_BREEZE = "hydrobreeze"
 CONTROL_BIO_FRESH_PLUS = "biofreshplus"
 CONTROL_AUTO_DOOR = "autodoor"
 
+# Refresh planning
+DEFAULT_VOLATILE_CONTROLS = (CONTROL_TEMPERATURE, CONTROL_AUTO_DOOR)
+DEFAULT_WRITE_WINDOW = 60
+DEFAULT_FULL_REFRESH_INTERVAL = 300
+DEFAULT_MAX_TARGETED_CONTROLS = 3
+
+# Write coalescing
+COALESCED_CONTROLS = frozenset(
+    {
+        CONTROL_TEMPERATURE,
+        CONTROL_PRESENTATION_LIGHT,
+        CONTROL_ICE_MAKER,
+        CONTROL_HYDRO_BREEZE,
+        CONTROL_BIO_FRESH_PLUS,
+    }
+)
+
 # Temperature units
 UNIT_CELSIUS = "°C"
 UNIT_FAHRENHEIT = "°F"
@@ -53,3 +90,18 @@ ZONE_BOTTOM = "bottom"
 DOOR_CLOSED = "CLOSED"
 DOOR_OPEN = "OPEN"
 DOOR_MOVING = "MOVING"
+
+# Redundant write suppression (every setter except auto door actions)
+IDEMPOTENT_CONTROLS = frozenset(
+    {
+        CONTROL_TEMPERATURE,
+        CONTROL_SUPERFROST,
+        CONTROL_SUPERCOOL,
+        CONTROL_PRESENTATION_LIGHT,
+        CONTROL_PARTY_MODE,
+        CONTROL_NIGHT_MODE,
+        CONTROL_ICE_MAKER,
+        CONTROL_HYDRO_BREEZE,
+        CONTROL_BIO_FRESH_PLUS,
+    }
+)
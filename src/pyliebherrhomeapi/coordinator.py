@@ -0,0 +1,608 @@
+"""Polling coordinator for pyliebherrhomeapi.
+
+A single DeviceCoordinator polls each device once per interval and fans the
+resulting DeviceState out to any number of listeners and subscriptions, so
+adding consumers does not add upstream requests. Polls are staggered across
+the interval by a PollScheduler and can adapt to device state through an
+AdaptivePolling policy.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BackpressurePolicy", "DeviceCoordinator", "Subscription"]
+
+import asyncio
+import inspect
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable, Container, Iterable
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
+)
+from .exceptions import LiebherrError
+from .models import (
+    ControlChange,
+    Device,
+    DeviceControl,
+    DeviceState,
+    DeviceStateResult,
+    diff_states,
+)
+from .scheduler import AdaptivePolling, PollScheduler
+
+if TYPE_CHECKING:
+    from .client import LiebherrClient
+
+_LOGGER = logging.getLogger(__name__)
+
+Listener = Callable[[DeviceState], Awaitable[None] | None]
+
+_CLOSED: Any = object()
+
+
+class BackpressurePolicy(str, Enum):
+    """What to do when a subscriber's queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
+class Subscription:
+    """Bounded stream of DeviceState updates from a coordinator.
+
+    Iterate with ``async for``; iteration ends when the subscription is
+    closed or the coordinator stops.
+    """
+
+    def __init__(
+        self,
+        device_id: str | None,
+        maxsize: int,
+        policy: BackpressurePolicy,
+        on_close: Callable[[Subscription], None],
+    ) -> None:
+        """Initialize the subscription."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.device_id = device_id
+        self.policy = policy
+        self.dropped = 0
+        self._queue: asyncio.Queue[DeviceState] = asyncio.Queue(maxsize)
+        self._closed = False
+        self._closed_event = asyncio.Event()
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        """Return True once the subscription has been closed."""
+        return self._closed
+
+    def matches(self, state: DeviceState) -> bool:
+        """Return True if this subscription wants updates for ``state``."""
+        return self.device_id is None or self.device_id == state.device.device_id
+
+    async def offer(self, state: DeviceState) -> None:
+        """Queue an update, applying the backpressure policy when full."""
+        if self._closed:
+            return
+        if self.policy is BackpressurePolicy.BLOCK:
+            if not self._queue.full():
+                self._queue.put_nowait(state)
+                return
+            # Stop waiting for space once the consumer goes away
+            put = asyncio.ensure_future(self._queue.put(state))
+            closed = asyncio.ensure_future(self._closed_event.wait())
+            try:
+                await asyncio.wait((put, closed), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                put.cancel()
+                closed.cancel()
+            return
+        if self._queue.full():
+            self.dropped += 1
+            if self.policy is BackpressurePolicy.DROP_NEWEST:
+                return
+            self._queue.get_nowait()
+        self._queue.put_nowait(state)
+
+    async def get(self) -> DeviceState:
+        """Wait for the next update.
+
+        Raises:
+            StopAsyncIteration: If the subscription is closed.
+
+        """
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        state = await self._queue.get()
+        if state is _CLOSED:
+            raise StopAsyncIteration
+        return state
+
+    def __aiter__(self) -> Subscription:
+        """Return the async iterator."""
+        return self
+
+    async def __anext__(self) -> DeviceState:
+        """Return the next update."""
+        return await self.get()
+
+    def close(self) -> None:
+        """Stop receiving updates and end iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self._closed_event.set()
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+        self._on_close(self)
+
+
+class DeviceCoordinator:
+    """Poll devices once per interval and fan updates out to consumers."""
+
+    def __init__(
+        self,
+        client: LiebherrClient,
+        device_ids: Iterable[str] = (),
+        *,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ramp_up: float = 0.0,
+        adaptive: AdaptivePolling | None = None,
+        optimistic_updates: bool = False,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            client: Client used for polling.
+            device_ids: Devices to poll. More can be added later.
+            interval: Seconds between polls of each device.
+            concurrency: Maximum number of devices polled at once. Due devices
+                beyond it wait for a free slot.
+            ramp_up: Seconds over which the first polls after ``start()`` are
+                spread (default: poll every device immediately).
+            adaptive: Policy adapting each device's interval to its state
+                (default: poll every device at ``interval``).
+            optimistic_updates: While running, patch successful writes made
+                through ``client`` into the known states and publish them
+                right away, marked optimistic until a later poll confirms them.
+
+        """
+        self._scheduler = PollScheduler(interval, ramp_up=ramp_up)
+        self._client = client
+        self._device_ids: dict[str, None] = dict.fromkeys(device_ids)
+        self._concurrency = concurrency
+        self._adaptive = adaptive
+        self._hot: dict[str, list[DeviceControl]] = {}
+        self._states: dict[str, DeviceState] = {}
+        self._optimistic_updates = optimistic_updates
+        # Per device: (control name, zone) -> (write time, patched control)
+        self._optimistic: dict[
+            str, dict[tuple[str, int | None], tuple[float, DeviceControl]]
+        ] = {}
+        self._detach_writes: Callable[[], None] | None = None
+        self._publish_tasks: set[asyncio.Task[None]] = set()
+        self._errors: dict[str, Exception] = {}
+        self._subscriptions: list[Subscription] = []
+        self._listener_tasks: dict[Subscription, asyncio.Task[None]] = {}
+        self._poll_task: asyncio.Task[None] | None = None
+        # Due devices waiting for a free slot, and devices being polled
+        self._queued: dict[str, None] = {}
+        self._polling: dict[str, None] = {}
+        self._poll_tasks: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def device_ids(self) -> list[str]:
+        """Return the polled device IDs."""
+        return list(self._device_ids)
+
+    @property
+    def interval(self) -> float:
+        """Return the polling interval in seconds."""
+        return self._scheduler.interval
+
+    def interval_for(self, device_id: str) -> float:
+        """Return the current polling interval of a device in seconds."""
+        return self._scheduler.interval_for(device_id)
+
+    @property
+    def states(self) -> dict[str, DeviceState]:
+        """Return the latest state of each device."""
+        return dict(self._states)
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Return the error of each device whose last poll failed."""
+        return dict(self._errors)
+
+    @property
+    def running(self) -> bool:
+        """Return True while the polling loop is running."""
+        return self._poll_task is not None and not self._poll_task.done()
+
+    def add_device(self, device_id: str) -> None:
+        """Start polling a device."""
+        self._device_ids[device_id] = None
+        if self.running and device_id not in self._scheduler:
+            self._scheduler.add(device_id, asyncio.get_running_loop().time())
+            self._wakeup.set()
+
+    def remove_device(self, device_id: str) -> None:
+        """Stop polling a device and forget its state."""
+        self._device_ids.pop(device_id, None)
+        self._scheduler.remove(device_id)
+        self._hot.pop(device_id, None)
+        self._states.pop(device_id, None)
+        self._optimistic.pop(device_id, None)
+        self._queued.pop(device_id, None)
+        self._errors.pop(device_id, None)
+
+    def subscribe(
+        self,
+        device_id: str | None = None,
+        *,
+        maxsize: int = DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ) -> Subscription:
+        """Subscribe to state updates.
+
+        Args:
+            device_id: Only receive updates for this device (default: all).
+            maxsize: Maximum number of queued updates.
+            policy: What to do when the queue is full. ``BLOCK`` makes polling
+                wait for this subscriber.
+
+        Returns:
+            Subscription to iterate with ``async for``.
+
+        """
+        subscription = Subscription(device_id, maxsize, policy, self._unsubscribe)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def changes(
+        self,
+        device_id: str | None = None,
+        *,
+        maxsize: int = DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ) -> AsyncGenerator[ControlChange, None]:
+        """Stream the control changes between consecutive polls.
+
+        Each update is compared with the last state this stream saw for the
+        device, so dropped updates never hide a change. Devices without a
+        known state report all of their controls as added.
+
+        Args:
+            device_id: Only report changes of this device (default: all).
+            maxsize: Maximum number of queued state updates.
+            policy: What to do when the queue is full.
+
+        Yields:
+            One ControlChange per added, removed or changed control.
+
+        """
+        subscription = self.subscribe(device_id, maxsize=maxsize, policy=policy)
+        seen = {
+            known_id: state
+            for known_id, state in self._states.items()
+            if device_id is None or known_id == device_id
+        }
+        try:
+            async for state in subscription:
+                changes = diff_states(seen.get(state.device.device_id), state)
+                seen[state.device.device_id] = state
+                for change in changes:
+                    yield change
+        finally:
+            subscription.close()
+
+    def add_listener(
+        self,
+        listener: Listener,
+        device_id: str | None = None,
+        *,
+        maxsize: int = 1,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ) -> Callable[[], None]:
+        """Call ``listener`` with each state update.
+
+        Every listener runs in its own task behind its own queue, so a slow
+        listener only falls behind itself. By default it keeps just the most
+        recent update. Must be called from a running event loop.
+
+        Args:
+            listener: Sync or async callable taking a DeviceState.
+            device_id: Only receive updates for this device (default: all).
+            maxsize: Maximum number of queued updates.
+            policy: What to do when the queue is full.
+
+        Returns:
+            Callable that removes the listener.
+
+        """
+        subscription = self.subscribe(device_id, maxsize=maxsize, policy=policy)
+        self._listener_tasks[subscription] = asyncio.get_running_loop().create_task(
+            self._run_listener(subscription, listener)
+        )
+        return subscription.close
+
+    async def _run_listener(
+        self, subscription: Subscription, listener: Listener
+    ) -> None:
+        async for state in subscription:
+            try:
+                result = listener(state)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                _LOGGER.exception("Error in device state listener")
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        task = self._listener_tasks.pop(subscription, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _publish(self, state: DeviceState) -> None:
+        for subscription in list(self._subscriptions):
+            if subscription.matches(state):
+                await subscription.offer(state)
+
+    def _apply_write(
+        self, device_id: str, control_name: str, values: dict[str, Any]
+    ) -> None:
+        """Patch a successful write into the known state and publish it."""
+        previous = self._states.get(device_id)
+        if previous is None:
+            return
+        state = DeviceState(
+            device=previous.device,
+            controls=list(previous.controls),
+            optimistic_controls=previous.optimistic_controls,
+        )
+        control = state.apply_write(control_name, values)
+        if control is None:
+            return
+        key = (control.name, control.zone_id)
+        loop = asyncio.get_running_loop()
+        self._optimistic.setdefault(device_id, {})[key] = (loop.time(), control)
+        state.optimistic_controls = previous.optimistic_controls | {key}
+        self._states[device_id] = state
+        task = loop.create_task(self._publish(state))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    def _keep_optimistic(
+        self,
+        device_id: str,
+        state: DeviceState,
+        started: float,
+        polled: Container[tuple[str, int | None]] | None = None,
+    ) -> None:
+        """Carry optimistic values over into a freshly polled state.
+
+        A write is confirmed once a poll covering its control started after
+        it; values written while a poll was in flight are re-applied, since
+        the poll may have read the device before the write.
+        """
+        pending = self._optimistic.get(device_id)
+        if not pending:
+            return
+        for key, (written, control) in list(pending.items()):
+            if written < started and (polled is None or key in polled):
+                del pending[key]
+            else:
+                state.update_control(control)
+        if pending:
+            state.optimistic_controls = frozenset(pending)
+        else:
+            del self._optimistic[device_id]
+
+    async def _handle_result(self, result: DeviceStateResult, started: float) -> None:
+        if result.device_id not in self._device_ids:
+            return
+        if result.state is None:
+            if result.error is not None:
+                self._errors[result.device_id] = result.error
+                _LOGGER.debug("Polling device failed: %s", result.error)
+            return
+        self._errors.pop(result.device_id, None)
+        self._keep_optimistic(result.device_id, result.state, started)
+        previous = self._states.get(result.device_id)
+        self._states[result.device_id] = result.state
+        self._adapt(result.device_id, previous, result.state)
+        await self._publish(result.state)
+
+    def _adapt(
+        self, device_id: str, previous: DeviceState | None, state: DeviceState
+    ) -> None:
+        """Update hot-poll mode and the interval of a device after a poll."""
+        if self._adaptive is None:
+            return
+        transient = self._adaptive.transient_controls(state)
+        if transient and self._adaptive.hot_poll:
+            self._hot[device_id] = transient
+        else:
+            self._hot.pop(device_id, None)
+        interval = self._adaptive.next_interval(
+            state,
+            self._scheduler.interval_for(device_id),
+            self.interval,
+            changed=previous is None or previous.controls != state.controls,
+        )
+        self._scheduler.set_interval(
+            device_id, interval, asyncio.get_running_loop().time()
+        )
+
+    async def _hot_poll(self, device_id: str) -> None:
+        """Refresh only the transient controls of a device."""
+        previous = self._states.get(device_id)
+        hot = self._hot.get(device_id)
+        if previous is None or hot is None:
+            return
+        started = asyncio.get_running_loop().time()
+        state = DeviceState(device=previous.device, controls=list(previous.controls))
+        try:
+            for control in hot:
+                for fresh in await self._client.get_control(
+                    device_id, control.name, control.zone_id
+                ):
+                    state.update_control(fresh)
+        except LiebherrError as err:
+            self._errors[device_id] = err
+            _LOGGER.debug("Hot polling device failed: %s", err)
+            return
+        if device_id not in self._device_ids:
+            return
+        self._errors.pop(device_id, None)
+        self._keep_optimistic(
+            device_id, state, started, {(c.name, c.zone_id) for c in hot}
+        )
+        self._states[device_id] = state
+        self._adapt(device_id, previous, state)
+        if device_id not in self._hot:
+            # Transient state settled: refresh everything else right away
+            self._scheduler.add(device_id, asyncio.get_running_loop().time())
+        await self._publish(state)
+
+    def _poll_targets(self, device_ids: Iterable[str]) -> list[str | Device]:
+        """Return what to poll, reusing known devices to skip device requests."""
+        return [
+            self._states[device_id].device if device_id in self._states else device_id
+            for device_id in device_ids
+        ]
+
+    async def refresh(self) -> list[DeviceStateResult]:
+        """Poll all devices once and publish the updates.
+
+        Returns:
+            Result of each device poll.
+
+        """
+        return await self._poll(self._device_ids)
+
+    async def _poll(self, device_ids: Iterable[str]) -> list[DeviceStateResult]:
+        results: list[DeviceStateResult] = []
+        started = asyncio.get_running_loop().time()
+        async for result in self._client.iter_device_states(
+            self._poll_targets(device_ids), concurrency=self._concurrency
+        ):
+            results.append(result)
+            await self._handle_result(result, started)
+            self._release(result.device_id)
+        return results
+
+    def _release(self, device_id: str) -> None:
+        """Free the poll slot of a device and let the loop fill it."""
+        if device_id in self._polling:
+            del self._polling[device_id]
+            self._wakeup.set()
+
+    async def _guarded(self, poll: Awaitable[Any]) -> None:
+        try:
+            await poll
+        except Exception:
+            _LOGGER.exception("Unexpected error while polling devices")
+
+    def _spawn(self, poll: Awaitable[Any], device_ids: list[str]) -> None:
+        """Run a poll in the background, holding its devices' slots."""
+        task = asyncio.get_running_loop().create_task(self._guarded(poll))
+        self._poll_tasks.add(task)
+
+        def _done(task: asyncio.Task[None]) -> None:
+            self._poll_tasks.discard(task)
+            for device_id in device_ids:
+                self._release(device_id)
+
+        task.add_done_callback(_done)
+
+    def _start_polls(self) -> None:
+        """Start queued polls while fewer than ``concurrency`` are running."""
+        free = self._concurrency - len(self._polling)
+        if free <= 0 or not self._queued:
+            return
+        batch = list(self._queued)[:free]
+        for device_id in batch:
+            del self._queued[device_id]
+            self._polling[device_id] = None
+        for device_id in batch:
+            if device_id in self._hot:
+                self._spawn(self._hot_poll(device_id), [device_id])
+        full = [device_id for device_id in batch if device_id not in self._hot]
+        if full:
+            self._spawn(self._poll(full), full)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            for device_id in self._scheduler.pop_due(loop.time()):
+                # A device still being polled skips this slot
+                if device_id not in self._polling:
+                    self._queued[device_id] = None
+            self._start_polls()
+            next_due = self._scheduler.next_due()
+            timeout = None if next_due is None else next_due - loop.time()
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """Start polling in the background."""
+        if self.running:
+            return
+        now = asyncio.get_running_loop().time()
+        self._scheduler.start(now)
+        self._hot.clear()
+        for device_id in self._device_ids:
+            self._scheduler.add(device_id, now)
+        if self._optimistic_updates:
+            self._detach_writes = self._client.add_write_value_listener(
+                self._apply_write
+            )
+        self._poll_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and close all subscriptions and listeners."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+        for task in self._poll_tasks:
+            task.cancel()
+        await asyncio.gather(*self._poll_tasks, return_exceptions=True)
+        self._queued.clear()
+        self._polling.clear()
+        if self._detach_writes is not None:
+            self._detach_writes()
+            self._detach_writes = None
+        for task in self._publish_tasks:
+            task.cancel()
+        tasks = [*self._publish_tasks, *self._listener_tasks.values()]
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> DeviceCoordinator:
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.stop()
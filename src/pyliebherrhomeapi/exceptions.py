@@ -7,6 +7,7 @@ __all__ = [
     "LiebherrConnectionError",
     "LiebherrNotFoundError",
     "LiebherrPreconditionFailedError",
+    "LiebherrRateLimitError",
     "LiebherrServerError",
     "LiebherrTimeoutError",
     "LiebherrUnsupportedError",
@@ -47,3 +48,18 @@ class LiebherrUnsupportedError(LiebherrError):
 
 class LiebherrServerError(LiebherrError):
     """Exception raised when server returns 500 error."""
+
+
+class LiebherrRateLimitError(LiebherrConnectionError):
+    """Exception raised when the API rate or bandwidth limit is exceeded."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message.
+            retry_after: Seconds to wait before retrying, if the server said so.
+
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,369 @@
+"""Lazy views over raw API payloads for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = [
+    "LazyAutoDoorControl",
+    "LazyBioFreshPlusControl",
+    "LazyControl",
+    "LazyDevice",
+    "LazyHydroBreezeControl",
+    "LazyIceMakerControl",
+    "LazyModel",
+    "LazyTemperatureControl",
+    "LazyToggleControl",
+    "lazy_controls",
+]
+
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from functools import partial
+from typing import Any, ClassVar, Generic, TypeVar, cast, overload
+
+from .models import _CONTROL_PARSERS as _EAGER_PARSERS
+from .models import (
+    AutoDoorControl,
+    BioFreshPlusControl,
+    BioFreshPlusMode,
+    ControlType,
+    Device,
+    DeviceControl,
+    DeviceType,
+    DoorState,
+    HydroBreezeControl,
+    HydroBreezeMode,
+    IceMakerControl,
+    IceMakerMode,
+    TemperatureControl,
+    TemperatureUnit,
+    ToggleControl,
+    ZonePosition,
+    _coerce_enum,
+    _intern,
+)
+
+_T = TypeVar("_T")
+_ModelT = TypeVar("_ModelT")
+
+_MISSING = object()
+
+
+class _LazyField(Generic[_T]):
+    """Attribute decoded from the raw payload on first access, then cached."""
+
+    __slots__ = ("decode", "default", "key", "name")
+
+    def __init__(
+        self,
+        key: str,
+        decode: Callable[[Any], _T] | None = None,
+        *,
+        default: Any = None,
+    ) -> None:
+        """Initialize the field.
+
+        Args:
+            key: Key of the value in the raw payload.
+            decode: Conversion applied to the raw value.
+            default: Value used when the key is missing, or ``_MISSING`` for
+                keys the eager model requires.
+
+        """
+        self.key = key
+        self.decode = decode
+        self.default = default
+        self.name = key
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> _LazyField[_T]: ...
+
+    @overload
+    def __get__(self, instance: LazyModel[Any], owner: type[Any]) -> _T: ...
+
+    def __get__(
+        self, instance: LazyModel[Any] | None, owner: type[Any]
+    ) -> _LazyField[_T] | _T:
+        if instance is None:
+            return self
+        values = instance._values
+        if values is None:
+            values = instance._values = {}
+        elif self.name in values:
+            return cast("_T", values[self.name])
+        if self.default is _MISSING:
+            value = instance._data[self.key]
+        else:
+            value = instance._data.get(self.key, self.default)
+        if self.decode is not None:
+            value = self.decode(value)
+        values[self.name] = value
+        return cast("_T", value)
+
+    def __set__(self, instance: LazyModel[Any], value: _T) -> None:
+        if instance._values is None:
+            instance._values = {}
+        instance._values[self.name] = value
+
+
+def _supported_modes(modes: Any) -> list[BioFreshPlusMode | str]:
+    """Coerce the supported BioFreshPlus modes like the eager model does."""
+    supported: list[BioFreshPlusMode | str] = []
+    for mode in modes:
+        coerced = _coerce_enum(BioFreshPlusMode, mode)
+        if coerced is not None:
+            supported.append(coerced)
+    return supported
+
+
+class LazyModel(Generic[_ModelT]):
+    """Read-mostly view over one raw API object.
+
+    Attributes have the names of the matching model class and are decoded on
+    first access. A missing required key raises KeyError on access rather
+    than on construction. The raw payload is never modified; assigning an
+    attribute only overrides the cached value.
+    """
+
+    __slots__ = ("_data", "_values")
+
+    _model: ClassVar[type[Any]]
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Wrap a raw payload.
+
+        Args:
+            data: Object decoded from an API response.
+
+        """
+        self._data = data
+        self._values: dict[str, Any] | None = None
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """Return the wrapped payload."""
+        return self._data
+
+    def materialize(self) -> _ModelT:
+        """Return the equivalent model instance, decoding every field."""
+        return cast(
+            "_ModelT",
+            self._model(**{f.name: getattr(self, f.name) for f in fields(self._model)}),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by decoded values with lazy views and model instances."""
+        if isinstance(other, LazyModel):
+            other = other.materialize()
+        if isinstance(other, self._model):
+            return cast("bool", self.materialize() == other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation showing the raw payload."""
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class LazyDevice(LazyModel[Device]):
+    """Lazy view with the attributes and helpers of Device."""
+
+    __slots__ = ()
+    _model = Device
+
+    device_id: _LazyField[str] = _LazyField("deviceId", _intern, default=_MISSING)
+    nickname: _LazyField[str | None] = _LazyField("nickname")
+    device_type: _LazyField[DeviceType | str | None] = _LazyField(
+        "deviceType", partial(_coerce_enum, DeviceType)
+    )
+    image_url: _LazyField[str | None] = _LazyField("imageUrl")
+    device_name: _LazyField[str | None] = _LazyField("deviceName")
+
+    def is_fridge(self) -> bool:
+        """Check if device is a fridge."""
+        return self.device_type == DeviceType.FRIDGE
+
+    def is_freezer(self) -> bool:
+        """Check if device is a freezer."""
+        return self.device_type == DeviceType.FREEZER
+
+    def is_combi(self) -> bool:
+        """Check if device is a combination fridge/freezer."""
+        return self.device_type == DeviceType.COMBI
+
+    def is_wine(self) -> bool:
+        """Check if device is a wine cooler."""
+        return self.device_type == DeviceType.WINE
+
+
+class _LazyControlBase(LazyModel[_ModelT]):
+    """Fields shared by every lazy control view."""
+
+    __slots__ = ()
+
+    name: _LazyField[str] = _LazyField("name", _intern, default=_MISSING)
+    type: _LazyField[str] = _LazyField("type", _intern, default=_MISSING)
+    zone_id: _LazyField[int] = _LazyField("zoneId", default=_MISSING)
+
+
+class LazyTemperatureControl(_LazyControlBase[TemperatureControl]):
+    """Lazy view with the attributes and helpers of TemperatureControl."""
+
+    __slots__ = ()
+    _model = TemperatureControl
+
+    zone_position: _LazyField[ZonePosition | str | None] = _LazyField(
+        "zonePosition", partial(_coerce_enum, ZonePosition)
+    )
+    value: _LazyField[int | None] = _LazyField("value")
+    target: _LazyField[int | None] = _LazyField("target")
+    min: _LazyField[int | None] = _LazyField("min")
+    max: _LazyField[int | None] = _LazyField("max")
+    unit: _LazyField[TemperatureUnit | str | None] = _LazyField(
+        "unit", partial(_coerce_enum, TemperatureUnit)
+    )
+
+    def validate_temperature(self, temp: int) -> bool:
+        """Validate if temperature is within allowed range.
+
+        Args:
+            temp: Temperature value to validate.
+
+        Returns:
+            True if temperature is within min/max range, False otherwise.
+
+        """
+        if self.min is not None and temp < self.min:
+            return False
+        if self.max is not None and temp > self.max:
+            return False
+        return True
+
+
+class LazyToggleControl(_LazyControlBase[ToggleControl]):
+    """Lazy view with the attributes of ToggleControl."""
+
+    __slots__ = ()
+    _model = ToggleControl
+
+    zone_id: _LazyField[int | None] = _LazyField("zoneId")  # type: ignore[assignment]
+    zone_position: _LazyField[ZonePosition | str | None] = _LazyField(
+        "zonePosition", partial(_coerce_enum, ZonePosition)
+    )
+    value: _LazyField[bool | None] = _LazyField("value")
+
+
+class LazyAutoDoorControl(_LazyControlBase[AutoDoorControl]):
+    """Lazy view with the attributes of AutoDoorControl."""
+
+    __slots__ = ()
+    _model = AutoDoorControl
+
+    zone_position: _LazyField[ZonePosition | str | None] = _LazyField(
+        "zonePosition", partial(_coerce_enum, ZonePosition)
+    )
+    value: _LazyField[DoorState | str | None] = _LazyField(
+        "value", partial(_coerce_enum, DoorState)
+    )
+
+
+class LazyIceMakerControl(_LazyControlBase[IceMakerControl]):
+    """Lazy view with the attributes of IceMakerControl."""
+
+    __slots__ = ()
+    _model = IceMakerControl
+
+    zone_position: _LazyField[ZonePosition | str | None] = _LazyField(
+        "zonePosition", partial(_coerce_enum, ZonePosition)
+    )
+    ice_maker_mode: _LazyField[IceMakerMode | str | None] = _LazyField(
+        "iceMakerMode", partial(_coerce_enum, IceMakerMode)
+    )
+    has_max_ice: _LazyField[bool | None] = _LazyField("hasMaxIce")
+
+
+class LazyHydroBreezeControl(_LazyControlBase[HydroBreezeControl]):
+    """Lazy view with the attributes of HydroBreezeControl."""
+
+    __slots__ = ()
+    _model = HydroBreezeControl
+
+    current_mode: _LazyField[HydroBreezeMode | str | None] = _LazyField(
+        "currentMode", partial(_coerce_enum, HydroBreezeMode)
+    )
+
+
+class LazyBioFreshPlusControl(_LazyControlBase[BioFreshPlusControl]):
+    """Lazy view with the attributes of BioFreshPlusControl."""
+
+    __slots__ = ()
+    _model = BioFreshPlusControl
+
+    current_mode: _LazyField[BioFreshPlusMode | str | None] = _LazyField(
+        "currentMode", partial(_coerce_enum, BioFreshPlusMode)
+    )
+    supported_modes: _LazyField[list[BioFreshPlusMode | str]] = _LazyField(
+        "supportedModes", _supported_modes, default=()
+    )
+    temperature_unit: _LazyField[TemperatureUnit | str | None] = _LazyField(
+        "temperatureUnit", partial(_coerce_enum, TemperatureUnit)
+    )
+
+
+LazyControl = (
+    LazyTemperatureControl
+    | LazyToggleControl
+    | LazyAutoDoorControl
+    | LazyIceMakerControl
+    | LazyHydroBreezeControl
+    | LazyBioFreshPlusControl
+)
+
+_LAZY_CONTROLS: dict[Any, type[LazyControl]] = {
+    ControlType.TEMPERATURE.value: LazyTemperatureControl,
+    ControlType.TOGGLE.value: LazyToggleControl,
+    ControlType.AUTO_DOOR.value: LazyAutoDoorControl,
+    ControlType.ICE_MAKER.value: LazyIceMakerControl,
+    ControlType.HYDRO_BREEZE.value: LazyHydroBreezeControl,
+    ControlType.BIO_FRESH_PLUS.value: LazyBioFreshPlusControl,
+}
+
+
+def lazy_controls(items: Iterable[Any]) -> list[LazyControl | DeviceControl]:
+    """Wrap a raw controls list in lazy views without decoding any field.
+
+    Control types added with ``register_control_type()`` are parsed eagerly
+    by their registered parser; other unknown types become
+    ``LazyToggleControl`` like ``parse_controls()`` falls back to
+    ``ToggleControl``.
+
+    Args:
+        items: Raw controls list from the API; non-dict entries are skipped.
+
+    Returns:
+        One lazy view or registered control per entry.
+
+    """
+    lazy = _LAZY_CONTROLS
+    eager = _EAGER_PARSERS
+    controls: list[LazyControl | DeviceControl] = []
+    for data in items:
+        if not isinstance(data, dict):
+            continue
+        control_type = data.get("type")
+        try:
+            view = lazy.get(control_type)
+            parser = None if view is not None else eager.get(control_type)
+        except TypeError:
+            # Unhashable type value
+            view, parser = LazyToggleControl, None
+        if view is not None:
+            controls.append(view(data))
+        elif parser is not None:
+            controls.append(parser(data))
+        else:
+            controls.append(LazyToggleControl(data))
+    return controls
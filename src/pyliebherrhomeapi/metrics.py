@@ -0,0 +1,36 @@
+"""Client metrics for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["ClientMetrics"]
+
+from dataclasses import dataclass, field, fields
+
+
+@dataclass
+class ClientMetrics:
+    """Counters collected by a LiebherrClient."""
+
+    requests: int = 0
+    coalesced: int = 0
+    unchanged: int = 0
+    writes_coalesced: int = 0
+    writes_skipped: int = 0
+    retries: int = 0
+    retries_exhausted: int = 0
+    retries_by_error: dict[str, int] = field(default_factory=dict)
+
+    def record_retry(self, err: Exception) -> None:
+        """Record a retry caused by ``err``."""
+        self.retries += 1
+        name = type(err).__name__
+        self.retries_by_error[name] = self.retries_by_error.get(name, 0) + 1
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        for metric in fields(self):
+            value = getattr(self, metric.name)
+            if isinstance(value, dict):
+                value.clear()
+            else:
+                setattr(self, metric.name, 0)
@@ -20,30 +20,65 @@ __all__ = [
     "BioFreshPlusControl",
     "DeviceControl",
     "DeviceState",
+    "DeviceStateResult",
+    "ControlChangeKind",
+    "ControlChange",
+    "WriteResult",
+    "DeviceWriteResult",
+    "diff_states",
     "parse_control",
+    "parse_controls",
+    "register_control_type",
 ]
 
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import Any, TypeVar
+from functools import lru_cache
+from typing import Any, Self, SupportsIndex, TypeVar, cast
 
 _EnumT = TypeVar("_EnumT", bound=Enum)
 
 
+@lru_cache(maxsize=1024)
+def _lookup_enum(enum_cls: type[Enum], value: Any) -> Any:
+    """Return the enum member for a value, or the value if there is none."""
+
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
 def _coerce_enum(enum_cls: type[_EnumT], value: str | None) -> _EnumT | str | None:
     """Return enum member when possible, else the raw value.
 
     This prevents hard failures when the upstream API introduces new values.
+    Lookups are memoized, including values the enum does not know.
     """
 
     if value is None:
         return None
     try:
-        return enum_cls(value)
-    except ValueError:
+        return cast("_EnumT | str", _lookup_enum(enum_cls, value))
+    except TypeError:
+        # Unhashable values can never be enum members
         return value
 
 
+def _intern(value: Any) -> Any:
+    """Return the interned copy of a string, or the value unchanged.
+
+    Control names, types and device IDs repeat across every device and every
+    poll; interning lets all model instances share a single string object.
+    """
+
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 class DeviceType(str, Enum):
     """Device type enumeration."""
 
@@ -113,7 +148,7 @@ class ControlType(str, Enum):
     BIO_FRESH_PLUS = "BioFreshPlusControl"
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Liebherr device information."""
 
@@ -127,7 +162,7 @@ class Device:
     def from_dict(cls, data: dict[str, Any]) -> Device:
         """Create Device from API response."""
         return cls(
-            device_id=data["deviceId"],
+            device_id=_intern(data["deviceId"]),
             nickname=data.get("nickname"),
             device_type=_coerce_enum(DeviceType, data.get("deviceType")),
             image_url=data.get("imageUrl"),
@@ -151,7 +186,7 @@ class Device:
         return self.device_type == DeviceType.WINE
 
 
-@dataclass
+@dataclass(slots=True)
 class TemperatureControl:
     """Temperature control information."""
 
@@ -169,8 +204,8 @@ class TemperatureControl:
     def from_dict(cls, data: dict[str, Any]) -> TemperatureControl:
         """Create TemperatureControl from API response."""
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data["zoneId"],
             zone_position=_coerce_enum(ZonePosition, data.get("zonePosition")),
             value=data.get("value"),
@@ -197,7 +232,7 @@ class TemperatureControl:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ToggleControl:
     """Toggle control (SuperCool, SuperFrost, etc.)."""
 
@@ -211,15 +246,15 @@ class ToggleControl:
     def from_dict(cls, data: dict[str, Any]) -> ToggleControl:
         """Create ToggleControl from API response."""
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data.get("zoneId"),
             zone_position=_coerce_enum(ZonePosition, data.get("zonePosition")),
             value=data.get("value"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoDoorControl:
     """Auto door control information."""
 
@@ -233,15 +268,15 @@ class AutoDoorControl:
     def from_dict(cls, data: dict[str, Any]) -> AutoDoorControl:
         """Create AutoDoorControl from API response."""
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data["zoneId"],
             zone_position=_coerce_enum(ZonePosition, data.get("zonePosition")),
             value=_coerce_enum(DoorState, data.get("value")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IceMakerControl:
     """Ice maker control information."""
 
@@ -256,8 +291,8 @@ class IceMakerControl:
     def from_dict(cls, data: dict[str, Any]) -> IceMakerControl:
         """Create IceMakerControl from API response."""
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data["zoneId"],
             zone_position=_coerce_enum(ZonePosition, data.get("zonePosition")),
             ice_maker_mode=_coerce_enum(IceMakerMode, data.get("iceMakerMode")),
@@ -265,7 +300,7 @@ class IceMakerControl:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HydroBreezeControl:
     """HydroBreeze control information."""
 
@@ -278,14 +313,14 @@ class HydroBreezeControl:
     def from_dict(cls, data: dict[str, Any]) -> HydroBreezeControl:
         """Create HydroBreezeControl from API response."""
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data["zoneId"],
             current_mode=_coerce_enum(HydroBreezeMode, data.get("currentMode")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BioFreshPlusControl:
     """BioFreshPlus control information."""
 
@@ -305,8 +340,8 @@ class BioFreshPlusControl:
             if coerced is not None:
                 supported.append(coerced)
         return cls(
-            name=data["name"],
-            type=data["type"],
+            name=_intern(data["name"]),
+            type=_intern(data["type"]),
             zone_id=data["zoneId"],
             current_mode=_coerce_enum(BioFreshPlusMode, data.get("currentMode")),
             supported_modes=supported,
@@ -324,12 +359,170 @@ DeviceControl = (
 )
 
 
-@dataclass
-class DeviceState:
-    """Complete device state including info and all controls."""
+_ControlT = TypeVar(
+    "_ControlT",
+    TemperatureControl,
+    ToggleControl,
+    AutoDoorControl,
+    IceMakerControl,
+    HydroBreezeControl,
+    BioFreshPlusControl,
+)
+
+_INDEXED_TYPES = (
+    TemperatureControl,
+    ToggleControl,
+    AutoDoorControl,
+    IceMakerControl,
+    HydroBreezeControl,
+    BioFreshPlusControl,
+)
+
+
+class _ControlList(list[DeviceControl]):
+    """Controls list counting its changes so indexes can detect them."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, controls: Iterable[DeviceControl] = ()) -> None:
+        super().__init__(controls)
+        self.version = 0
+
+    def append(self, control: DeviceControl) -> None:
+        super().append(control)
+        self.version += 1
+
+    def extend(self, controls: Iterable[DeviceControl]) -> None:
+        super().extend(controls)
+        self.version += 1
+
+    def insert(self, index: SupportsIndex, control: DeviceControl) -> None:
+        super().insert(index, control)
+        self.version += 1
+
+    def remove(self, control: DeviceControl) -> None:
+        super().remove(control)
+        self.version += 1
+
+    def pop(self, index: SupportsIndex = -1) -> DeviceControl:
+        self.version += 1
+        return super().pop(index)
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, controls: Iterable[DeviceControl]) -> Self:  # type: ignore[override, misc]
+        self.version += 1
+        return super().__iadd__(controls)
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        self.version += 1
+        return super().__imul__(count)
+
+
+class _ControlIndex:
+    """Lookup tables over one controls list, built in a single pass."""
+
+    __slots__ = ("by_name", "by_type", "by_zone", "source", "version")
+
+    def __init__(self, controls: _ControlList) -> None:
+        """Index controls by type and zone, by name and by zone."""
+        self.source = controls
+        self.version = controls.version
+        self.by_name: dict[str, DeviceControl] = {}
+        self.by_type: dict[type, dict[int | None, DeviceControl]] = {
+            control_type: {} for control_type in _INDEXED_TYPES
+        }
+        self.by_zone: dict[int | None, list[DeviceControl]] = {}
+        for control in controls:
+            self.by_name.setdefault(control.name, control)
+            by_zone = self.by_type.get(type(control))
+            if by_zone is None:
+                # Subclasses and registered types keep isinstance semantics
+                matches = [t for t in _INDEXED_TYPES if isinstance(control, t)]
+                if not matches:
+                    continue
+                by_zone = self.by_type[matches[0]]
+            by_zone[control.zone_id] = control
+            self.by_zone.setdefault(control.zone_id, []).append(control)
+
+    def is_current(self, controls: _ControlList) -> bool:
+        """Return True if the index matches the current controls list."""
+        return controls is self.source and controls.version == self.version
+
+
+class _Indexed:
+    """Holds the lookup index of a DeviceState outside its dataclass fields."""
+
+    __slots__ = ("_index",)
+
+
+@dataclass(slots=True)
+class DeviceState(_Indexed):
+    """Complete device state including info and all controls.
+
+    Accessors answer from indexes built on first use. ``controls`` is kept
+    as a list that records its changes: assigning a list stores a copy of
+    it, and any change made through the list (``append()``, ``remove()``,
+    ``sort()``, item and slice assignment, ...) rebuilds the indexes. Call
+    ``invalidate_indexes()`` after changing the name, zone or type of a
+    control in place.
+
+    ``optimistic_controls`` holds the ``(name, zone_id)`` pairs whose values
+    were patched in from a write and not yet confirmed by a poll.
+    """
 
     device: Device
     controls: list[DeviceControl] = field(default_factory=list)
+    optimistic_controls: frozenset[tuple[str, int | None]] = field(
+        default=frozenset(), compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Start without lookup indexes."""
+        self._index: _ControlIndex | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store assigned controls lists as change-tracking lists."""
+        if name == "controls" and type(value) is not _ControlList:
+            value = _ControlList(value)
+        object.__setattr__(self, name, value)
+
+    def _indexes(self) -> _ControlIndex:
+        controls = cast(_ControlList, self.controls)
+        index = self._index
+        if index is None or not index.is_current(controls):
+            index = self._index = _ControlIndex(controls)
+        return index
+
+    def _controls_of(self, control_type: type[_ControlT]) -> dict[Any, _ControlT]:
+        return dict(cast("dict[Any, _ControlT]", self._indexes().by_type[control_type]))
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes after renaming or rezoning a control."""
+        self._index = None
+
+    @property
+    def optimistic(self) -> bool:
+        """Return True if some controls show written but unconfirmed values."""
+        return bool(self.optimistic_controls)
 
     def get_temperature_controls(self) -> dict[int, TemperatureControl]:
         """Get all temperature controls grouped by zone.
@@ -338,11 +531,7 @@ class DeviceState:
             Dictionary mapping zone_id to temperature control.
 
         """
-        result: dict[int, TemperatureControl] = {}
-        for control in self.controls:
-            if isinstance(control, TemperatureControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(TemperatureControl)
 
     def get_toggle_controls(self) -> dict[int | None, ToggleControl]:
         """Get all toggle controls grouped by zone.
@@ -351,11 +540,7 @@ class DeviceState:
             Dictionary mapping zone_id to toggle control.
 
         """
-        result: dict[int | None, ToggleControl] = {}
-        for control in self.controls:
-            if isinstance(control, ToggleControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(ToggleControl)
 
     def get_auto_door_controls(self) -> dict[int, AutoDoorControl]:
         """Get all auto door controls grouped by zone.
@@ -364,11 +549,7 @@ class DeviceState:
             Dictionary mapping zone_id to auto door control.
 
         """
-        result: dict[int, AutoDoorControl] = {}
-        for control in self.controls:
-            if isinstance(control, AutoDoorControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(AutoDoorControl)
 
     def get_ice_maker_controls(self) -> dict[int, IceMakerControl]:
         """Get all ice maker controls grouped by zone.
@@ -377,11 +558,7 @@ class DeviceState:
             Dictionary mapping zone_id to ice maker control.
 
         """
-        result: dict[int, IceMakerControl] = {}
-        for control in self.controls:
-            if isinstance(control, IceMakerControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(IceMakerControl)
 
     def get_hydro_breeze_controls(self) -> dict[int, HydroBreezeControl]:
         """Get all HydroBreeze controls grouped by zone.
@@ -390,11 +567,7 @@ class DeviceState:
             Dictionary mapping zone_id to HydroBreeze control.
 
         """
-        result: dict[int, HydroBreezeControl] = {}
-        for control in self.controls:
-            if isinstance(control, HydroBreezeControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(HydroBreezeControl)
 
     def get_biofresh_plus_controls(self) -> dict[int, BioFreshPlusControl]:
         """Get all BioFreshPlus controls grouped by zone.
@@ -403,11 +576,7 @@ class DeviceState:
             Dictionary mapping zone_id to BioFreshPlus control.
 
         """
-        result: dict[int, BioFreshPlusControl] = {}
-        for control in self.controls:
-            if isinstance(control, BioFreshPlusControl):
-                result[control.zone_id] = control
-        return result
+        return self._controls_of(BioFreshPlusControl)
 
     def get_control_by_name(self, name: str) -> DeviceControl | None:
         """Get control by name.
@@ -419,10 +588,7 @@ class DeviceState:
             Control with matching name, or None if not found.
 
         """
-        for control in self.controls:
-            if control.name == name:
-                return control
-        return None
+        return self._indexes().by_name.get(name)
 
     def get_controls_by_zone(self, zone_id: int) -> list[DeviceControl]:
         """Get all controls for a specific zone.
@@ -434,41 +600,338 @@ class DeviceState:
             List of controls for the specified zone.
 
         """
-        zone_controls: list[DeviceControl] = []
+        return list(self._indexes().by_zone.get(zone_id, ()))
+
+    def update_control(self, control: DeviceControl) -> None:
+        """Replace the control with the same name and zone, or add it.
+
+        Args:
+            control: Freshly fetched control.
+
+        """
+        for index, existing in enumerate(self.controls):
+            if existing.name == control.name and existing.zone_id == control.zone_id:
+                self.controls[index] = control
+                return
+        self.controls.append(control)
+
+    def apply_write(
+        self, control_name: str, values: dict[str, Any]
+    ) -> DeviceControl | None:
+        """Apply the body of a successful control write to this state.
+
+        The written control is replaced by an updated copy, so control
+        instances shared with other states are left untouched.
+
+        Args:
+            control_name: Name of the written control.
+            values: Request body sent by the ``set_*`` method.
+
+        Returns:
+            The updated control, or None if the state has no such control or
+            the write does not map to its fields (e.g. an auto door trigger).
+
+        """
+        zone_id = values.get("zoneId")
         for control in self.controls:
-            if isinstance(control, TemperatureControl) and control.zone_id == zone_id:
-                zone_controls.append(control)
-            elif isinstance(control, ToggleControl) and control.zone_id == zone_id:
-                zone_controls.append(control)
-            elif isinstance(control, AutoDoorControl) and control.zone_id == zone_id:
-                zone_controls.append(control)
-            elif isinstance(control, IceMakerControl) and control.zone_id == zone_id:
-                zone_controls.append(control)
-            elif isinstance(control, HydroBreezeControl) and control.zone_id == zone_id:
-                zone_controls.append(control)
-            elif (
-                isinstance(control, BioFreshPlusControl) and control.zone_id == zone_id
-            ):
-                zone_controls.append(control)
-        return zone_controls
+            if control.name == control_name and control.zone_id == zone_id:
+                break
+        else:
+            return None
+        changes: dict[str, Any]
+        try:
+            if isinstance(control, TemperatureControl):
+                changes = {
+                    "target": values["target"],
+                    "unit": _coerce_enum(TemperatureUnit, values["unit"]),
+                }
+            elif isinstance(control, ToggleControl):
+                changes = {"value": values["value"]}
+            elif isinstance(control, IceMakerControl):
+                changes = {
+                    "ice_maker_mode": _coerce_enum(IceMakerMode, values["iceMakerMode"])
+                }
+            elif isinstance(control, HydroBreezeControl):
+                changes = {
+                    "current_mode": _coerce_enum(
+                        HydroBreezeMode, values["hydroBreezeMode"]
+                    )
+                }
+            elif isinstance(control, BioFreshPlusControl):
+                changes = {
+                    "current_mode": _coerce_enum(
+                        BioFreshPlusMode, values["bioFreshPlusMode"]
+                    )
+                }
+            else:
+                return None
+        except KeyError:
+            return None
+        updated = replace(control, **changes)
+        self.update_control(updated)
+        return updated
+
+    def apply_controls_payload(
+        self, controls: Iterable[DeviceControl]
+    ) -> list[ControlChange]:
+        """Merge a fresh controls list into this state in place.
+
+        Controls are matched by name and zone. An unchanged control keeps its
+        instance, so references held by consumers stay valid, and a changed
+        one is replaced by the fresh control. Control instances are never
+        modified, since the client may share them between responses. New
+        controls are added and controls missing from the payload are
+        removed. The ``controls`` list itself is reused and only rewritten
+        when controls were added, removed, changed or reordered.
+
+        Args:
+            controls: Controls from a ``get_controls()`` response.
+
+        Returns:
+            One ControlChange per touched control.
+
+        """
+        device_id = self.device.device_id
+        previous: dict[tuple[str, int | None], DeviceControl] = {}
+        for control in self.controls:
+            previous[(control.name, control.zone_id)] = control
+
+        merged: list[DeviceControl] = []
+        changes: list[ControlChange] = []
+        for control in controls:
+            key = (control.name, control.zone_id)
+            existing = previous.pop(key, None)
+            if existing is None:
+                merged.append(control)
+                changes.append(
+                    ControlChange(
+                        device_id, key[0], key[1], ControlChangeKind.ADDED, new=control
+                    )
+                )
+            elif existing is control or existing == control:
+                merged.append(existing)
+            else:
+                merged.append(control)
+                changes.append(
+                    ControlChange(
+                        device_id,
+                        key[0],
+                        key[1],
+                        ControlChangeKind.CHANGED,
+                        old=existing,
+                        new=control,
+                        changed_fields=_changed_fields(existing, control),
+                    )
+                )
+        for (name, zone_id), control in previous.items():
+            changes.append(
+                ControlChange(
+                    device_id, name, zone_id, ControlChangeKind.REMOVED, old=control
+                )
+            )
+
+        current = self.controls
+        if len(merged) != len(current) or any(
+            a is not b for a, b in zip(merged, current, strict=True)
+        ):
+            current[:] = merged
+        return changes
+
+
+@dataclass(slots=True)
+class DeviceStateResult:
+    """Outcome of fetching one device's state during a bulk request."""
+
+    device_id: str
+    state: DeviceState | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the state was fetched successfully."""
+        return self.error is None
+
+
+class ControlChangeKind(str, Enum):
+    """Kind of difference between two device state snapshots."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+class WriteResult(str, Enum):
+    """Outcome of a control write."""
+
+    SENT = "sent"
+    NO_OP = "no_op"
+
+
+@dataclass(slots=True)
+class DeviceWriteResult:
+    """Outcome of writing to one device during a bulk request."""
+
+    device_id: str
+    result: WriteResult | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the write was sent or not needed."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class ControlChange:
+    """A control that differs between two device state snapshots.
+
+    ``changed_fields`` maps each differing field to its ``(old, new)`` values
+    and is only filled for ``CHANGED`` entries.
+    """
+
+    device_id: str
+    name: str
+    zone_id: int | None
+    kind: ControlChangeKind
+    old: DeviceControl | None = None
+    new: DeviceControl | None = None
+    changed_fields: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    @property
+    def control(self) -> DeviceControl:
+        """Return the new control, or the old one if it was removed."""
+        control = self.new if self.new is not None else self.old
+        if control is None:
+            raise ValueError("ControlChange without old or new control")
+        return control
+
+
+def _changed_fields(
+    old: DeviceControl, new: DeviceControl
+) -> dict[str, tuple[Any, Any]]:
+    """Return the fields that differ between two versions of a control."""
+    if type(old) is not type(new):
+        return {
+            f.name: (getattr(old, f.name, None), getattr(new, f.name))
+            for f in fields(new)
+        }
+    changed: dict[str, tuple[Any, Any]] = {}
+    for f in fields(new):
+        old_value = getattr(old, f.name)
+        new_value = getattr(new, f.name)
+        if old_value != new_value:
+            changed[f.name] = (old_value, new_value)
+    return changed
+
+
+def diff_states(old: DeviceState | None, new: DeviceState) -> list[ControlChange]:
+    """Compare two snapshots of a device, keyed by control name and zone.
+
+    Runs in linear time in the number of controls.
+
+    Args:
+        old: Previous snapshot, or None to report every control as added.
+        new: Current snapshot.
+
+    Returns:
+        One ControlChange per added, removed or changed control, in the
+        order of the new snapshot followed by removed controls.
+
+    """
+    device_id = new.device.device_id
+    previous: dict[tuple[str, int | None], DeviceControl] = {}
+    if old is not None:
+        for control in old.controls:
+            previous[(control.name, control.zone_id)] = control
+
+    changes: list[ControlChange] = []
+    for control in new.controls:
+        key = (control.name, control.zone_id)
+        before = previous.pop(key, None)
+        if before is None:
+            changes.append(
+                ControlChange(
+                    device_id, key[0], key[1], ControlChangeKind.ADDED, new=control
+                )
+            )
+        elif before is not control and before != control:
+            changes.append(
+                ControlChange(
+                    device_id,
+                    key[0],
+                    key[1],
+                    ControlChangeKind.CHANGED,
+                    old=before,
+                    new=control,
+                    changed_fields=_changed_fields(before, control),
+                )
+            )
+    for (name, zone_id), control in previous.items():
+        changes.append(
+            ControlChange(
+                device_id, name, zone_id, ControlChangeKind.REMOVED, old=control
+            )
+        )
+    return changes
+
+
+ControlParser = Callable[[dict[str, Any]], DeviceControl]
+
+_CONTROL_PARSERS: dict[Any, ControlParser] = {
+    ControlType.TEMPERATURE.value: TemperatureControl.from_dict,
+    ControlType.TOGGLE.value: ToggleControl.from_dict,
+    ControlType.AUTO_DOOR.value: AutoDoorControl.from_dict,
+    ControlType.ICE_MAKER.value: IceMakerControl.from_dict,
+    ControlType.HYDRO_BREEZE.value: HydroBreezeControl.from_dict,
+    ControlType.BIO_FRESH_PLUS.value: BioFreshPlusControl.from_dict,
+}
+
+
+def register_control_type(control_type: str, parser: ControlParser) -> None:
+    """Register the parser for a control type.
+
+    Replaces the parser of an existing type. Unregistered types are parsed
+    as ToggleControl.
+
+    Args:
+        control_type: Value of the ``type`` field in API responses.
+        parser: Callable building a control from its API dictionary.
+
+    """
+    _CONTROL_PARSERS[control_type] = parser
 
 
 def parse_control(data: dict[str, Any]) -> DeviceControl:
     """Parse device control from API response."""
-    control_type = data.get("type")
-
-    if control_type == ControlType.TEMPERATURE.value:
-        return TemperatureControl.from_dict(data)
-    if control_type == ControlType.TOGGLE.value:
-        return ToggleControl.from_dict(data)
-    if control_type == ControlType.AUTO_DOOR.value:
-        return AutoDoorControl.from_dict(data)
-    if control_type == ControlType.ICE_MAKER.value:
-        return IceMakerControl.from_dict(data)
-    if control_type == ControlType.HYDRO_BREEZE.value:
-        return HydroBreezeControl.from_dict(data)
-    if control_type == ControlType.BIO_FRESH_PLUS.value:
-        return BioFreshPlusControl.from_dict(data)
-
-    # Fallback to ToggleControl for unknown types
-    return ToggleControl.from_dict(data)
+    try:
+        parser = _CONTROL_PARSERS.get(data.get("type"), ToggleControl.from_dict)
+    except TypeError:
+        # Unhashable type value
+        parser = ToggleControl.from_dict
+    return parser(data)
+
+
+def parse_controls(items: Iterable[Any]) -> list[DeviceControl]:
+    """Parse a list of controls from an API response.
+
+    Entries that are not dictionaries are skipped.
+
+    Args:
+        items: Raw controls list.
+
+    Returns:
+        Parsed controls, in response order.
+
+    """
+    parsers = _CONTROL_PARSERS
+    fallback = ToggleControl.from_dict
+    controls: list[DeviceControl] = []
+    for data in items:
+        if not isinstance(data, dict):
+            continue
+        try:
+            parser = parsers.get(data.get("type"), fallback)
+        except TypeError:
+            parser = fallback
+        controls.append(parser(data))
+    return controls
@@ -0,0 +1,185 @@
+"""Refresh planning for pyliebherrhomeapi.
+
+A RefreshPlanner decides per device whether a refresh needs the full
+controls list or only a few named controls fetched through the
+single-control endpoint, and patches the known DeviceState in place.
+"""
+
+from __future__ import annotations
+
+__all__ = ["RefreshPlan", "RefreshPlanner"]
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .const import (
+    DEFAULT_FULL_REFRESH_INTERVAL,
+    DEFAULT_MAX_TARGETED_CONTROLS,
+    DEFAULT_VOLATILE_CONTROLS,
+    DEFAULT_WRITE_WINDOW,
+)
+from .models import DeviceState
+
+if TYPE_CHECKING:
+    from .client import LiebherrClient
+
+
+@dataclass
+class RefreshPlan:
+    """What to fetch when refreshing one device.
+
+    ``targets`` lists ``(control_name, zone_id)`` pairs for the
+    single-control endpoint; a zone ID of None fetches every zone.
+    """
+
+    device_id: str
+    full: bool
+    targets: list[tuple[str, int | None]] = field(default_factory=list)
+
+
+class RefreshPlanner:
+    """Plan full or targeted control refreshes per device.
+
+    A device gets a full refresh when nothing is known about it yet, when its
+    last full refresh is older than ``full_refresh_interval``, or when more
+    than ``max_targeted`` controls would be fetched one by one. Otherwise
+    only its volatile controls and the controls written within
+    ``write_window`` seconds are fetched.
+    """
+
+    def __init__(
+        self,
+        *,
+        volatile: Iterable[str] = DEFAULT_VOLATILE_CONTROLS,
+        write_window: float = DEFAULT_WRITE_WINDOW,
+        full_refresh_interval: float = DEFAULT_FULL_REFRESH_INTERVAL,
+        max_targeted: int = DEFAULT_MAX_TARGETED_CONTROLS,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            volatile: Names of controls refreshed on every cycle.
+            write_window: Seconds a written control keeps being refreshed.
+            full_refresh_interval: Maximum seconds between full refreshes.
+            max_targeted: Maximum single-control requests per refresh before
+                falling back to the full controls list.
+
+        """
+        if max_targeted < 0:
+            raise ValueError("max_targeted must be >= 0")
+        self._volatile = frozenset(volatile)
+        self._write_window = write_window
+        self._full_refresh_interval = full_refresh_interval
+        self._max_targeted = max_targeted
+        self._writes: dict[str, dict[tuple[str, int | None], float]] = {}
+        self._full_refreshed: dict[str, float] = {}
+        self.full_refreshes = 0
+        self.targeted_refreshes = 0
+
+    def attach(self, client: LiebherrClient) -> Callable[[], None]:
+        """Record every control written through ``client``.
+
+        Returns:
+            Callable that detaches the planner.
+
+        """
+        return client.add_write_listener(self.record_write)
+
+    def record_write(
+        self,
+        device_id: str,
+        control_name: str,
+        zone_id: int | None = None,
+        at: float | None = None,
+    ) -> None:
+        """Mark a control as recently written."""
+        written = self._writes.setdefault(device_id, {})
+        written[(control_name, zone_id)] = time.monotonic() if at is None else at
+
+    def forget(self, device_id: str) -> None:
+        """Drop everything recorded about a device."""
+        self._writes.pop(device_id, None)
+        self._full_refreshed.pop(device_id, None)
+
+    def plan(
+        self, device_id: str, state: DeviceState | None, now: float | None = None
+    ) -> RefreshPlan:
+        """Decide how to refresh a device.
+
+        Args:
+            device_id: Device to refresh.
+            state: Currently known state, if any.
+            now: Current monotonic time (default: ``time.monotonic()``).
+
+        Returns:
+            RefreshPlan for the device.
+
+        """
+        if now is None:
+            now = time.monotonic()
+        last_full = self._full_refreshed.get(device_id)
+        if (
+            state is None
+            or last_full is None
+            or now - last_full >= self._full_refresh_interval
+        ):
+            return RefreshPlan(device_id, full=True)
+
+        targets: dict[tuple[str, int | None], None] = {}
+        for control in state.controls:
+            if control.name in self._volatile:
+                targets[(control.name, None)] = None
+        written = self._writes.get(device_id, {})
+        for key, at in list(written.items()):
+            if now - at > self._write_window:
+                del written[key]
+            elif (key[0], None) not in targets:
+                targets[key] = None
+        if len(targets) > self._max_targeted:
+            return RefreshPlan(device_id, full=True)
+        return RefreshPlan(device_id, full=False, targets=list(targets))
+
+    async def refresh(
+        self, client: LiebherrClient, device_id: str, state: DeviceState | None
+    ) -> DeviceState:
+        """Refresh a device according to its plan.
+
+        A known state is patched in place and returned; otherwise the full
+        state is fetched.
+
+        Args:
+            client: Client used for the requests.
+            device_id: Device to refresh.
+            state: Currently known state, if any.
+
+        Returns:
+            The refreshed DeviceState.
+
+        Raises:
+            LiebherrError: If a request fails.
+
+        """
+        plan = self.plan(device_id, state)
+        if state is None:
+            state = await client.get_device_state(device_id)
+        elif plan.full:
+            state.apply_controls_payload(await client.get_controls(device_id))
+        if plan.full:
+            self.full_refreshes += 1
+            self._full_refreshed[device_id] = time.monotonic()
+            return state
+
+        self.targeted_refreshes += 1
+        results = await asyncio.gather(
+            *(
+                client.get_control(device_id, name, zone_id)
+                for name, zone_id in plan.targets
+            )
+        )
+        for controls in results:
+            for control in controls:
+                state.update_control(control)
+        return state
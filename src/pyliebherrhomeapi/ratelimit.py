@@ -0,0 +1,147 @@
+"""Client-side rate limiting for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["RateLimiter"]
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import ClassVar
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into seconds.
+
+    Supports both delay-seconds and HTTP-date values.
+    """
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class RateLimiter:
+    """Async token bucket shared by all requests passing through it.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    request takes one token; callers wait in FIFO order when the bucket is
+    empty. A server-side rate limit response pauses the bucket for the
+    duration given in its Retry-After header.
+    """
+
+    _shared: ClassVar[dict[str, RateLimiter]] = {}
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Sustained requests per second.
+            burst: Maximum number of requests allowed at once
+                (default: ``rate`` rounded up).
+
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        capacity = burst if burst is not None else max(1, math.ceil(rate))
+        if capacity < 1:
+            raise ValueError("burst must be >= 1")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+
+    @classmethod
+    def for_api_key(
+        cls, api_key: str, rate: float, burst: int | None = None
+    ) -> RateLimiter:
+        """Return the limiter shared by all clients using an API key.
+
+        The first call for an API key creates the limiter; later calls return
+        the same instance and ignore ``rate`` and ``burst``.
+
+        Args:
+            api_key: API key the limit applies to.
+            rate: Sustained requests per second.
+            burst: Maximum number of requests allowed at once.
+
+        Returns:
+            Shared RateLimiter instance.
+
+        """
+        key = hashlib.sha256(api_key.encode()).hexdigest()
+        limiter = cls._shared.get(key)
+        if limiter is None:
+            limiter = cls._shared[key] = cls(rate, burst)
+        return limiter
+
+    @property
+    def rate(self) -> float:
+        """Return the sustained rate in requests per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Return the bucket capacity."""
+        return self._capacity
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return self._waiting
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._waiting -= 1
+
+    def pause(self, delay: float) -> None:
+        """Stop handing out tokens for ``delay`` seconds.
+
+        Args:
+            delay: Seconds to wait, typically from a Retry-After header.
+
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + delay)
+        self._tokens = 0.0
+        self._updated = self._blocked_until
+        _LOGGER.debug("Rate limiter paused for %.1f seconds", delay)
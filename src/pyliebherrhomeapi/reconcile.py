@@ -0,0 +1,324 @@
+"""Desired-state reconciliation for pyliebherrhomeapi.
+
+A Reconciler compares a declarative DesiredState per device with the
+device's current controls and issues only the writes needed to close the
+difference. Devices that already match cost a single controls read.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DesiredState",
+    "DeviceReconcileResult",
+    "ReconcileAction",
+    "ReconcileReport",
+    "Reconciler",
+]
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from .const import (
+    CONTROL_BIO_FRESH_PLUS,
+    CONTROL_HYDRO_BREEZE,
+    CONTROL_ICE_MAKER,
+    CONTROL_NIGHT_MODE,
+    CONTROL_PARTY_MODE,
+    CONTROL_SUPERCOOL,
+    CONTROL_SUPERFROST,
+    CONTROL_TEMPERATURE,
+    DEFAULT_BULK_CONCURRENCY,
+)
+from .models import (
+    BioFreshPlusControl,
+    BioFreshPlusMode,
+    Device,
+    DeviceControl,
+    DeviceState,
+    HydroBreezeControl,
+    HydroBreezeMode,
+    IceMakerControl,
+    IceMakerMode,
+    TemperatureControl,
+    TemperatureUnit,
+    ToggleControl,
+    WriteResult,
+)
+
+if TYPE_CHECKING:
+    from .client import LiebherrClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DesiredState:
+    """Target configuration of one device.
+
+    Zone-keyed fields map a zone ID to its target; controls that are absent
+    or None are left as they are.
+    """
+
+    temperatures: dict[int, int] = field(default_factory=dict)
+    temperature_unit: TemperatureUnit = TemperatureUnit.CELSIUS
+    superfrost: dict[int, bool] = field(default_factory=dict)
+    supercool: dict[int, bool] = field(default_factory=dict)
+    party_mode: bool | None = None
+    night_mode: bool | None = None
+    ice_maker: dict[int, IceMakerMode] = field(default_factory=dict)
+    hydro_breeze: dict[int, HydroBreezeMode] = field(default_factory=dict)
+    bio_fresh_plus: dict[int, BioFreshPlusMode] = field(default_factory=dict)
+
+    def targets(self) -> Iterator[tuple[str, int | None, Any]]:
+        """Yield ``(control_name, zone_id, value)`` for every set target."""
+        for zone_id, target in self.temperatures.items():
+            yield CONTROL_TEMPERATURE, zone_id, target
+        for zone_id, value in self.superfrost.items():
+            yield CONTROL_SUPERFROST, zone_id, value
+        for zone_id, value in self.supercool.items():
+            yield CONTROL_SUPERCOOL, zone_id, value
+        if self.party_mode is not None:
+            yield CONTROL_PARTY_MODE, None, self.party_mode
+        if self.night_mode is not None:
+            yield CONTROL_NIGHT_MODE, None, self.night_mode
+        for zone_id, ice_maker_mode in self.ice_maker.items():
+            yield CONTROL_ICE_MAKER, zone_id, ice_maker_mode
+        for zone_id, hydro_breeze_mode in self.hydro_breeze.items():
+            yield CONTROL_HYDRO_BREEZE, zone_id, hydro_breeze_mode
+        for zone_id, bio_fresh_plus_mode in self.bio_fresh_plus.items():
+            yield CONTROL_BIO_FRESH_PLUS, zone_id, bio_fresh_plus_mode
+
+
+@dataclass
+class ReconcileAction:
+    """A write needed to bring one control to its desired value."""
+
+    device_id: str
+    control: str
+    zone_id: int | None
+    current: Any
+    target: Any
+
+
+@dataclass
+class DeviceReconcileResult:
+    """Outcome of reconciling one device.
+
+    ``actions`` lists the writes the device needed and ``applied`` the ones
+    that completed. ``missing`` holds desired ``(control_name, zone_id)``
+    pairs the device does not have.
+    """
+
+    device_id: str
+    actions: list[ReconcileAction] = field(default_factory=list)
+    applied: list[ReconcileAction] = field(default_factory=list)
+    missing: list[tuple[str, int | None]] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the device was read and every needed write done."""
+        return self.error is None and len(self.applied) == len(self.actions)
+
+    @property
+    def in_sync(self) -> bool:
+        """Return True if the device already matched its desired state."""
+        return self.error is None and not self.actions
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of a reconciliation run, one result per device."""
+
+    results: list[DeviceReconcileResult] = field(default_factory=list)
+
+    @property
+    def in_sync(self) -> list[str]:
+        """Return the devices that needed no writes."""
+        return [r.device_id for r in self.results if r.in_sync]
+
+    @property
+    def changed(self) -> list[str]:
+        """Return the devices that needed writes and got all of them."""
+        return [r.device_id for r in self.results if r.actions and r.ok]
+
+    @property
+    def failed(self) -> list[str]:
+        """Return the devices that could not be read or fully written."""
+        return [r.device_id for r in self.results if not r.ok]
+
+    @property
+    def writes(self) -> int:
+        """Return the number of writes that completed."""
+        return sum(len(r.applied) for r in self.results)
+
+
+def _current_value(control: DeviceControl, unit: TemperatureUnit) -> Any:
+    """Return the value of a control comparable with a desired target."""
+    if isinstance(control, TemperatureControl):
+        # A target in another known unit always needs a write
+        if control.unit is not None and control.unit != unit:
+            return None
+        return control.target
+    if isinstance(control, ToggleControl):
+        return control.value
+    if isinstance(control, IceMakerControl):
+        return control.ice_maker_mode
+    if isinstance(control, HydroBreezeControl | BioFreshPlusControl):
+        return control.current_mode
+    return None
+
+
+def _write(
+    client: LiebherrClient, action: ReconcileAction, desired: DesiredState
+) -> Awaitable[WriteResult]:
+    """Return the setter call that applies an action."""
+    device_id, target = action.device_id, action.target
+    if action.control == CONTROL_PARTY_MODE:
+        return client.set_party_mode(device_id, target)
+    if action.control == CONTROL_NIGHT_MODE:
+        return client.set_night_mode(device_id, target)
+    zone_id = cast(int, action.zone_id)
+    if action.control == CONTROL_TEMPERATURE:
+        return client.set_temperature(
+            device_id, zone_id, target, desired.temperature_unit
+        )
+    if action.control == CONTROL_SUPERFROST:
+        return client.set_superfrost(device_id, zone_id, target)
+    if action.control == CONTROL_SUPERCOOL:
+        return client.set_supercool(device_id, zone_id, target)
+    if action.control == CONTROL_ICE_MAKER:
+        return client.set_ice_maker(device_id, zone_id, target)
+    if action.control == CONTROL_HYDRO_BREEZE:
+        return client.set_hydro_breeze(device_id, zone_id, target)
+    return client.set_bio_fresh_plus(device_id, zone_id, target)
+
+
+class Reconciler:
+    """Bring devices to their desired state with the fewest writes.
+
+    Each device's controls are read (unless a current state is supplied),
+    compared with its DesiredState, and only differing controls are
+    written. Devices are processed concurrently, at most ``concurrency`` at
+    a time; the writes of one device are sent one after another.
+    """
+
+    def __init__(
+        self,
+        client: LiebherrClient,
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> None:
+        """Initialize the reconciler.
+
+        Args:
+            client: Client used for reads and writes.
+            concurrency: Maximum number of devices reconciled at once.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._client = client
+        self._concurrency = concurrency
+
+    def plan(
+        self, device_id: str, state: DeviceState, desired: DesiredState
+    ) -> DeviceReconcileResult:
+        """Compare a device state with its desired state without writing.
+
+        Args:
+            device_id: Device the state belongs to.
+            state: Current state of the device.
+            desired: Desired state of the device.
+
+        Returns:
+            DeviceReconcileResult with the needed actions and missing controls.
+
+        """
+        result = DeviceReconcileResult(device_id)
+        controls = {(c.name, c.zone_id): c for c in state.controls}
+        for name, zone_id, target in desired.targets():
+            control = controls.get((name, zone_id))
+            if control is None and zone_id is None:
+                control = state.get_control_by_name(name)
+            if control is None:
+                result.missing.append((name, zone_id))
+                continue
+            current = _current_value(control, desired.temperature_unit)
+            if current != target:
+                result.actions.append(
+                    ReconcileAction(device_id, name, zone_id, current, target)
+                )
+        return result
+
+    async def reconcile(
+        self,
+        desired: Mapping[str, DesiredState],
+        *,
+        states: Mapping[str, DeviceState] | None = None,
+        dry_run: bool = False,
+    ) -> ReconcileReport:
+        """Reconcile every device in ``desired``.
+
+        Args:
+            desired: Desired state per device ID.
+            states: Known current states; these devices are not read again.
+            dry_run: Plan the writes without sending them.
+
+        Returns:
+            ReconcileReport with one result per device, in ``desired`` order.
+            Read and write errors of any kind are captured in the device's result.
+
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        known = states or {}
+
+        async def _one(device_id: str, target: DesiredState) -> DeviceReconcileResult:
+            async with semaphore:
+                return await self._reconcile_device(
+                    device_id, target, known.get(device_id), dry_run
+                )
+
+        results = await asyncio.gather(
+            *(_one(device_id, target) for device_id, target in desired.items())
+        )
+        report = ReconcileReport(list(results))
+        _LOGGER.debug(
+            "Reconciled %d device(s): %d in sync, %d changed, %d failed",
+            len(report.results),
+            len(report.in_sync),
+            len(report.changed),
+            len(report.failed),
+        )
+        return report
+
+    async def _reconcile_device(
+        self,
+        device_id: str,
+        desired: DesiredState,
+        state: DeviceState | None,
+        dry_run: bool,
+    ) -> DeviceReconcileResult:
+        """Read, plan and write one device, capturing any error."""
+        if state is None:
+            try:
+                controls = await self._client.get_controls(device_id)
+            except Exception as err:
+                return DeviceReconcileResult(device_id, error=err)
+            state = DeviceState(device=Device(device_id=device_id), controls=controls)
+
+        result = self.plan(device_id, state, desired)
+        if dry_run:
+            return result
+        for action in result.actions:
+            try:
+                await _write(self._client, action, desired)
+            except Exception as err:
+                _LOGGER.debug("Reconciling %s failed: %s", device_id, err)
+                result.error = err
+                break
+            result.applied.append(action)
+        return result
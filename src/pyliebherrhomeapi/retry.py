@@ -0,0 +1,69 @@
+"""Retry policy for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["RetryPolicy"]
+
+import random
+from dataclasses import dataclass, field
+
+from .exceptions import (
+    LiebherrConnectionError,
+    LiebherrServerError,
+    LiebherrTimeoutError,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy with exponential backoff and full jitter.
+
+    By default only GET requests are retried, and only for errors that are
+    usually transient (server errors, connection errors and timeouts).
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    deadline: float | None = None
+    retry_on: tuple[type[Exception], ...] = (
+        LiebherrServerError,
+        LiebherrConnectionError,
+        LiebherrTimeoutError,
+    )
+    give_up_on: tuple[type[Exception], ...] = ()
+    methods: frozenset[str] = field(default_factory=lambda: frozenset({"GET"}))
+
+    def __post_init__(self) -> None:
+        """Validate the policy."""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must be >= 0")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be > 0")
+
+    def applies_to(self, method: str) -> bool:
+        """Return True if requests with this HTTP method may be retried."""
+        return method.upper() in self.methods
+
+    def should_retry(self, err: Exception) -> bool:
+        """Return True if ``err`` is classified as retryable.
+
+        ``give_up_on`` takes precedence, so a subclass of a retryable error
+        can be excluded.
+        """
+        return isinstance(err, self.retry_on) and not isinstance(err, self.give_up_on)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based).
+
+        Returns:
+            Random delay between zero and the capped exponential backoff.
+
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
@@ -0,0 +1,228 @@
+"""Phase-staggered poll scheduling for pyliebherrhomeapi."""
+
+from __future__ import annotations
+
+__all__ = ["AdaptivePolling", "PollScheduler"]
+
+import hashlib
+import heapq
+import math
+from dataclasses import dataclass
+
+from .const import (
+    CONTROL_SUPERCOOL,
+    CONTROL_SUPERFROST,
+    DEFAULT_ADAPTIVE_BACKOFF,
+    DEFAULT_ADAPTIVE_CEILING,
+    DEFAULT_ADAPTIVE_FLOOR,
+)
+from .models import (
+    AutoDoorControl,
+    DeviceControl,
+    DeviceState,
+    DoorState,
+    ToggleControl,
+)
+
+
+def _phase_fraction(device_id: str) -> float:
+    """Map a device ID to a stable position in [0, 1)."""
+    digest = hashlib.blake2b(device_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+class PollScheduler:
+    """Spread periodic device polls evenly across the polling interval.
+
+    Each device gets a phase offset derived from a hash of its ID, so its
+    slot within the interval does not depend on which other devices are
+    scheduled and stays the same across restarts. With ``ramp_up`` set, the
+    first polls after ``start()`` are spread over that many seconds instead
+    of all happening at once.
+    """
+
+    def __init__(self, interval: float, *, ramp_up: float = 0.0) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            interval: Seconds between polls of each device.
+            ramp_up: Seconds over which the first polls are spread
+                (default: poll every device immediately).
+
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if ramp_up < 0:
+            raise ValueError("ramp_up must be >= 0")
+        self._interval = interval
+        self._ramp_up = ramp_up
+        self._started = -math.inf
+        self._intervals: dict[str, float] = {}
+        self._due: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    @property
+    def interval(self) -> float:
+        """Return the polling interval in seconds."""
+        return self._interval
+
+    def interval_for(self, device_id: str) -> float:
+        """Return the polling interval of a device in seconds."""
+        return self._intervals.get(device_id, self._interval)
+
+    def set_interval(self, device_id: str, interval: float, now: float) -> None:
+        """Change the polling interval of one device.
+
+        A scheduled device moves to the first slot of the new interval after
+        ``now``; its phase stays the same fraction of the interval.
+
+        Args:
+            device_id: Device to reschedule.
+            interval: New interval in seconds.
+            now: Current time on the clock used for ``add``.
+
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if interval == self.interval_for(device_id):
+            return
+        if interval == self._interval:
+            self._intervals.pop(device_id, None)
+        else:
+            self._intervals[device_id] = interval
+        if device_id in self._due:
+            self._schedule(device_id, self._next_slot(device_id, now))
+
+    def phase(self, device_id: str) -> float:
+        """Return the offset of a device within its interval in seconds."""
+        return _phase_fraction(device_id) * self.interval_for(device_id)
+
+    def start(self, now: float) -> None:
+        """Forget all scheduled devices and begin a new ramp-up at ``now``."""
+        self._started = now
+        self._intervals.clear()
+        self._due.clear()
+        self._heap.clear()
+
+    def add(self, device_id: str, now: float) -> None:
+        """Schedule the first poll of a device.
+
+        During ramp-up the first poll is placed at the device's share of the
+        ramp-up window; afterwards new devices are due immediately.
+        """
+        ramp_slot = self._started + _phase_fraction(device_id) * self._ramp_up
+        self._schedule(device_id, max(now, ramp_slot))
+
+    def remove(self, device_id: str) -> None:
+        """Stop scheduling a device."""
+        self._due.pop(device_id, None)
+        self._intervals.pop(device_id, None)
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return True if the device is scheduled."""
+        return device_id in self._due
+
+    def __len__(self) -> int:
+        """Return the number of scheduled devices."""
+        return len(self._due)
+
+    def next_due(self) -> float | None:
+        """Return when the next poll is due, or None if nothing is scheduled."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[str]:
+        """Return the devices due at ``now`` and move them to their next slot.
+
+        Args:
+            now: Current time on the clock used for ``add``.
+
+        Returns:
+            Device IDs to poll, earliest first.
+
+        """
+        due: list[str] = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, device_id = heapq.heappop(self._heap)
+            due.append(device_id)
+            self._schedule(device_id, self._next_slot(device_id, now))
+
+    def _next_slot(self, device_id: str, now: float) -> float:
+        """Return the first time after ``now`` that matches the device phase."""
+        interval = self.interval_for(device_id)
+        offset = (now - self.phase(device_id)) % interval
+        return now - offset + interval
+
+    def _schedule(self, device_id: str, when: float) -> None:
+        self._due[device_id] = when
+        heapq.heappush(self._heap, (when, device_id))
+
+    def _discard_stale(self) -> None:
+        """Drop heap entries for removed or rescheduled devices."""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+
+@dataclass
+class AdaptivePolling:
+    """Adapt each device's polling interval to its latest state.
+
+    Devices in a transient state (an auto door that is moving, SuperFrost or
+    SuperCool switched on) are polled at ``floor``. Devices whose controls
+    did not change since the previous poll back off by ``backoff`` up to
+    ``ceiling``; any change resets them to the base interval. With
+    ``hot_poll`` enabled, a transient device only has its transient controls
+    refreshed until they settle.
+    """
+
+    floor: float = DEFAULT_ADAPTIVE_FLOOR
+    ceiling: float = DEFAULT_ADAPTIVE_CEILING
+    backoff: float = DEFAULT_ADAPTIVE_BACKOFF
+    hot_poll: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate interval bounds."""
+        if self.floor <= 0:
+            raise ValueError("floor must be > 0")
+        if self.ceiling < self.floor:
+            raise ValueError("ceiling must be >= floor")
+        if self.backoff < 1:
+            raise ValueError("backoff must be >= 1")
+
+    def transient_controls(self, state: DeviceState) -> list[DeviceControl]:
+        """Return the controls of a state that need fast refresh."""
+        transient: list[DeviceControl] = []
+        for control in state.controls:
+            if isinstance(control, AutoDoorControl):
+                if control.value == DoorState.MOVING:
+                    transient.append(control)
+            elif isinstance(control, ToggleControl):
+                if control.value and control.name in (
+                    CONTROL_SUPERFROST,
+                    CONTROL_SUPERCOOL,
+                ):
+                    transient.append(control)
+        return transient
+
+    def next_interval(
+        self, state: DeviceState, current: float, base: float, *, changed: bool
+    ) -> float:
+        """Return the interval to use after polling a device.
+
+        Args:
+            state: State returned by the poll.
+            current: Interval used for the poll.
+            base: Configured polling interval.
+            changed: Whether the controls differ from the previous poll.
+
+        Returns:
+            Next polling interval in seconds, between floor and ceiling.
+
+        """
+        if self.transient_controls(state):
+            return self.floor
+        interval = base if changed else current * self.backoff
+        return min(self.ceiling, max(self.floor, interval))
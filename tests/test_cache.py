@@ -0,0 +1,104 @@
+"""Tests for the response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyliebherrhomeapi import CacheStats, ResponseCache
+from pyliebherrhomeapi.cache import _endpoint_kind
+
+
+class TestEndpointKind:
+    """Tests for endpoint classification."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "kind"),
+        [
+            ("devices", "devices"),
+            ("devices/123", "device"),
+            ("devices/123/controls", "controls"),
+            ("devices/123/controls/temperature", "control"),
+            ("devices/123/other", None),
+            ("status", None),
+        ],
+    )
+    def test_endpoint_kind(self, endpoint: str, kind: str | None) -> None:
+        """Test endpoints map to cache kinds."""
+        assert _endpoint_kind(endpoint) == kind
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_default_ttls(self) -> None:
+        """Test only device metadata is cached by default."""
+        cache = ResponseCache()
+        assert cache.ttl_for("devices") == 3600
+        assert cache.ttl_for("devices/123") == 3600
+        assert cache.ttl_for("devices/123/controls") is None
+        assert cache.ttl_for("unknown") is None
+
+    def test_custom_ttls(self) -> None:
+        """Test TTLs can be overridden per kind."""
+        cache = ResponseCache(ttls={"controls": 10, "devices": None})
+        assert cache.ttl_for("devices/123/controls") == 10
+        assert cache.ttl_for("devices") is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_entries": 0}, {"ttls": {"bogus": 1}}],
+    )
+    def test_invalid_configuration(self, kwargs: dict[str, object]) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache(**kwargs)  # type: ignore[arg-type]
+
+    def test_hit_and_miss(self) -> None:
+        """Test lookups count hits and misses."""
+        cache = ResponseCache()
+        key = ("devices", ())
+        assert cache.get(key) == (False, None)
+        cache.set(key, [1], ttl=60)
+        assert cache.get(key) == (True, [1])
+        assert cache.stats == CacheStats(
+            hits=1, misses=1, evictions=0, expirations=0, size=1
+        )
+        assert cache.stats.hit_rate == 0.5
+
+    def test_hit_rate_without_lookups(self) -> None:
+        """Test hit rate is zero before any lookup."""
+        assert ResponseCache().stats.hit_rate == 0.0
+
+    def test_expiry(self) -> None:
+        """Test expired entries are dropped on lookup."""
+        cache = ResponseCache()
+        key = ("devices", ())
+        with patch("pyliebherrhomeapi.cache.time.monotonic", return_value=100.0):
+            cache.set(key, [1], ttl=10)
+        with patch("pyliebherrhomeapi.cache.time.monotonic", return_value=111.0):
+            assert cache.get(key) == (False, None)
+        assert cache.stats.expirations == 1
+        assert cache.stats.size == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.set(("devices/a", ()), "a", ttl=60)
+        cache.set(("devices/b", ()), "b", ttl=60)
+        cache.get(("devices/a", ()))
+        cache.set(("devices/c", ()), "c", ttl=60)
+
+        assert cache.get(("devices/b", ()))[0] is False
+        assert cache.get(("devices/a", ()))[0] is True
+        assert cache.stats.evictions == 1
+
+    def test_invalidate(self) -> None:
+        """Test selective and full invalidation."""
+        cache = ResponseCache()
+        cache.set(("devices/a", ()), "a", ttl=60)
+        cache.set(("devices/b", ()), "b", ttl=60)
+
+        assert cache.invalidate(lambda endpoint: endpoint == "devices/a") == 1
+        assert cache.stats.size == 1
+        assert cache.invalidate() == 1
+        assert cache.stats.size == 0
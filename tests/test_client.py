@@ -1,36 +1,61 @@
 """Tests for Liebherr client."""
 # pylint: disable=redefined-outer-name, protected-access
 
+import asyncio
 import importlib
+import json
+import sys
+from collections.abc import Iterator
 from importlib.metadata import PackageNotFoundError
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
-from aiohttp.client_exceptions import ContentTypeError
 
 from pyliebherrhomeapi import (
     BioFreshPlusMode,
+    ConnectorConfig,
+    Device,
+    DeviceState,
+    DeviceType,
     HydroBreezeMode,
     IceMakerMode,
+    LazyDevice,
+    LazyTemperatureControl,
     LiebherrAuthenticationError,
     LiebherrBadRequestError,
     LiebherrClient,
     LiebherrConnectionError,
     LiebherrNotFoundError,
     LiebherrPreconditionFailedError,
+    LiebherrRateLimitError,
     LiebherrServerError,
     LiebherrTimeoutError,
     LiebherrUnsupportedError,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
     TemperatureUnit,
+    ToggleControl,
+    WriteResult,
+    parse_controls,
 )
-from pyliebherrhomeapi.client import _get_version
+from pyliebherrhomeapi.client import _default_json_loads, _get_version
 
 API_KEY = "test-api-key"
 DEVICE_ID = "12.345.678.9"
 
 
+def json_body(*payloads: Any) -> AsyncMock:
+    """Return a ``response.read`` mock serving JSON-encoded payloads in turn."""
+
+    bodies = [json.dumps(payload).encode() for payload in payloads]
+    if len(bodies) == 1:
+        return AsyncMock(return_value=bodies[0])
+    return AsyncMock(side_effect=bodies)
+
+
 @pytest.fixture
 def mock_response() -> MagicMock:
     """Create a mock response."""
@@ -48,6 +73,38 @@ def mock_session(mock_response: MagicMock) -> MagicMock:
     return session
 
 
+def route_requests(
+    mock_session: MagicMock,
+    routes: dict[str, tuple[int, Any]],
+    gates: dict[str, asyncio.Event] | None = None,
+) -> None:
+    """Answer session requests per endpoint with (status, json) pairs.
+
+    Endpoints listed in ``gates`` only respond once their event is set.
+    """
+
+    def _request(method: str, url: str, **kwargs: Any) -> MagicMock:
+        endpoint = url.split("/v1/", 1)[1]
+        status, payload = routes[endpoint]
+        response = MagicMock()
+        response.status = status
+        response.reason = "Reason"
+        response.headers = {}
+        response.read = json_body(payload)
+
+        async def _enter() -> MagicMock:
+            gate = (gates or {}).get(endpoint)
+            if gate is not None:
+                await gate.wait()
+            return response
+
+        response.__aenter__ = AsyncMock(side_effect=_enter)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    mock_session.request.side_effect = _request
+
+
 @pytest.fixture
 def client(mock_session: MagicMock) -> LiebherrClient:
     """Create a test client."""
@@ -92,7 +149,7 @@ class TestClientLifecycle:
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=[])
+        mock_response.read = json_body([])
 
         with patch.object(aiohttp.ClientSession, "request", return_value=mock_response):
             await client.get_devices()
@@ -117,6 +174,91 @@ class TestClientLifecycle:
         assert client._session is None
 
 
+class TestConnectionPool:
+    """Tests for connection pool configuration and statistics."""
+
+    async def test_own_session_uses_connector_config(self) -> None:
+        """Test the client-owned session is built from the connector config."""
+        config = ConnectorConfig(limit=42, limit_per_host=7)
+        client = LiebherrClient(api_key=API_KEY, connector_config=config)
+        session = await client._get_session()
+        try:
+            assert session.connector is not None
+            assert session.connector.limit == 42
+            assert session.connector.limit_per_host == 7
+
+            stats = client.pool_stats()
+            assert stats.limit == 42
+            assert stats.limit_per_host == 7
+            assert stats.in_use == 0
+        finally:
+            await client.close()
+
+    def test_pool_stats_without_session(self) -> None:
+        """Test pool stats before any session exists."""
+        client = LiebherrClient(api_key=API_KEY)
+        stats = client.pool_stats()
+        assert stats.limit == 0
+        assert stats.in_use == 0
+
+    async def test_in_use_tracks_active_requests(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test in-use count is raised while a request holds a connection."""
+        seen: list[int] = []
+
+        async def _read() -> bytes:
+            seen.append(client._pool_tracker.in_use)
+            return b"[]"
+
+        mock_response.status = 200
+        mock_response.read = _read
+
+        await client.get_devices()
+        assert seen == [1]
+        assert client._pool_tracker.in_use == 0
+
+    def test_connector_config_ignored_with_external_session(
+        self, mock_session: MagicMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a warning is logged when config cannot be applied."""
+        LiebherrClient(
+            api_key=API_KEY, session=mock_session, connector_config=ConnectorConfig()
+        )
+        assert "connector_config is ignored" in caplog.text
+
+    async def test_warm_up(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test warm-up opens the requested number of connections."""
+        failing = MagicMock()
+        failing.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError("boom"))
+        failing.__aexit__ = AsyncMock(return_value=None)
+        mock_session.head = MagicMock(
+            side_effect=[mock_response, mock_response, failing]
+        )
+        client = LiebherrClient(api_key=API_KEY, session=mock_session)
+
+        assert await client.warm_up(3) == 2
+        assert mock_session.head.call_count == 3
+
+    async def test_warm_up_disabled_by_default(self, client: LiebherrClient) -> None:
+        """Test warm-up is a no-op without configured connections."""
+        assert await client.warm_up() == 0
+
+    async def test_context_manager_warms_up(self) -> None:
+        """Test entering the context warms up configured connections."""
+        client = LiebherrClient(
+            api_key=API_KEY, connector_config=ConnectorConfig(warm_up_connections=2)
+        )
+        with patch.object(
+            LiebherrClient, "warm_up", AsyncMock(return_value=2)
+        ) as warm_up:
+            async with client:
+                pass
+        warm_up.assert_awaited_once_with()
+
+
 class TestDeviceOperations:
     """Tests for device-related operations."""
 
@@ -125,8 +267,8 @@ class TestDeviceOperations:
     ) -> None:
         """Test getting all devices."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value=[
+        mock_response.read = json_body(
+            [
                 {
                     "deviceId": DEVICE_ID,
                     "nickname": "Kitchen Fridge",
@@ -141,13 +283,27 @@ class TestDeviceOperations:
         assert devices[0].device_id == DEVICE_ID
         assert devices[0].nickname == "Kitchen Fridge"
 
+    async def test_get_devices_lazy(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test lazy mode returns views over the device payloads."""
+        mock_response.status = 200
+        mock_response.read = json_body(
+            [{"deviceId": DEVICE_ID, "deviceType": "FRIDGE"}, "not a device"]
+        )
+
+        devices = await client.get_devices(lazy=True)
+        assert [type(d) for d in devices] == [LazyDevice]
+        assert devices[0].device_type is DeviceType.FRIDGE
+        assert devices[0] == Device(device_id=DEVICE_ID, device_type=DeviceType.FRIDGE)
+
     async def test_get_device(
         self, client: LiebherrClient, mock_response: MagicMock
     ) -> None:
         """Test getting a specific device."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value={
+        mock_response.read = json_body(
+            {
                 "deviceId": DEVICE_ID,
                 "nickname": "Kitchen Fridge",
                 "deviceType": "FRIDGE",
@@ -171,7 +327,7 @@ class TestDeviceOperations:
     ) -> None:
         """Test get_devices with edge cases."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=response_data)
+        mock_response.read = json_body(response_data)
 
         with pytest.raises(LiebherrServerError):
             await client.get_devices()
@@ -185,12 +341,22 @@ class TestDeviceOperations:
         devices = await client.get_devices()
         assert devices == []
 
+    async def test_get_devices_empty_body(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test an empty 200 body is treated like no content."""
+        mock_response.status = 200
+        mock_response.read = AsyncMock(return_value=b" \n")
+
+        devices = await client.get_devices()
+        assert devices == []
+
     async def test_get_device_not_dict(
         self, client: LiebherrClient, mock_response: MagicMock
     ) -> None:
         """Test getting device with non-dict response."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=["not", "a", "dict"])
+        mock_response.read = json_body(["not", "a", "dict"])
 
         with pytest.raises(LiebherrServerError):
             await client.get_device(DEVICE_ID)
@@ -204,8 +370,8 @@ class TestControlOperations:
     ) -> None:
         """Test getting device controls."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value=[
+        mock_response.read = json_body(
+            [
                 {
                     "name": "temperature",
                     "type": "TemperatureControl",
@@ -222,13 +388,28 @@ class TestControlOperations:
         controls = await client.get_controls(DEVICE_ID)
         assert len(controls) == 1
 
+    async def test_get_controls_lazy(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test lazy mode skips parsing the controls."""
+        mock_response.status = 200
+        mock_response.read = json_body(
+            [{"name": "temperature", "type": "TemperatureControl", "zoneId": 0}]
+        )
+
+        with patch("pyliebherrhomeapi.client.parse_controls") as parse:
+            controls = await client.get_controls(DEVICE_ID, lazy=True)
+        parse.assert_not_called()
+        assert isinstance(controls[0], LazyTemperatureControl)
+        assert controls[0].zone_id == 0
+
     async def test_get_control(
         self, client: LiebherrClient, mock_response: MagicMock
     ) -> None:
         """Test getting specific control by name."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value=[
+        mock_response.read = json_body(
+            [
                 {
                     "name": "temperature",
                     "type": "TemperatureControl",
@@ -248,8 +429,8 @@ class TestControlOperations:
     ) -> None:
         """Test getting specific control by name with zone filter."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value=[
+        mock_response.read = json_body(
+            [
                 {
                     "name": "temperature",
                     "type": "TemperatureControl",
@@ -276,7 +457,7 @@ class TestControlOperations:
     ) -> None:
         """Test get_controls with edge cases."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=response_data)
+        mock_response.read = json_body(response_data)
 
         with pytest.raises(LiebherrServerError):
             await client.get_controls(DEVICE_ID)
@@ -295,7 +476,7 @@ class TestControlOperations:
     ) -> None:
         """Test get_control with edge cases."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=response_data)
+        mock_response.read = json_body(response_data)
 
         with pytest.raises(LiebherrServerError):
             await client.get_control(DEVICE_ID, "temperature")
@@ -336,6 +517,67 @@ class TestSetterMethods:
         await method(device_id=DEVICE_ID, **kwargs)
         # Should not raise
 
+    async def test_write_listeners(
+        self,
+        client: LiebherrClient,
+        mock_response: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test write listeners are notified of successful writes."""
+        mock_response.status = 204
+        writes: list[tuple[str, str, int | None]] = []
+
+        def failing(_device_id: str, _name: str, _zone_id: int | None) -> None:
+            raise RuntimeError("boom")
+
+        remove = client.add_write_listener(lambda *args: writes.append(args))
+        client.add_write_listener(failing)
+        await client.set_superfrost(DEVICE_ID, 1, True)
+        await client.set_party_mode(DEVICE_ID, True)
+        assert writes == [(DEVICE_ID, "superfrost", 1), (DEVICE_ID, "partymode", None)]
+        assert "Error in control write listener" in caplog.text
+
+        remove()
+        await client.set_party_mode(DEVICE_ID, False)
+        assert len(writes) == 2
+
+    async def test_write_value_listeners(
+        self,
+        client: LiebherrClient,
+        mock_response: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test value listeners receive the body of successful writes."""
+        mock_response.status = 204
+        writes: list[tuple[str, str, dict[str, Any]]] = []
+
+        def failing(_device_id: str, _name: str, _values: dict[str, Any]) -> None:
+            raise RuntimeError("boom")
+
+        remove = client.add_write_value_listener(lambda *args: writes.append(args))
+        client.add_write_value_listener(failing)
+        await client.set_ice_maker(DEVICE_ID, 1, IceMakerMode.MAX_ICE)
+        assert writes == [
+            (DEVICE_ID, "icemaker", {"zoneId": 1, "iceMakerMode": "MAX_ICE"})
+        ]
+        assert "Error in control write listener" in caplog.text
+
+        remove()
+        await client.set_party_mode(DEVICE_ID, False)
+        assert len(writes) == 1
+
+    async def test_failed_write_not_notified(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test failed writes do not reach write listeners."""
+        mock_response.status = 400
+        mock_response.read = json_body({"message": "bad"})
+        writes: list[Any] = []
+        client.add_write_listener(lambda *args: writes.append(args))
+        with pytest.raises(LiebherrBadRequestError):
+            await client.set_party_mode(DEVICE_ID, True)
+        assert writes == []
+
 
 class TestConvenienceMethods:
     """Tests for convenience methods."""
@@ -358,12 +600,91 @@ class TestConvenienceMethods:
                 "value": 4,
             }
         ]
-        mock_response.json = AsyncMock(side_effect=[device_response, controls_response])
+        mock_response.read = json_body(device_response, controls_response)
 
         state = await client.get_device_state(DEVICE_ID)
         assert state.device.device_id == DEVICE_ID
         assert len(state.controls) == 1
 
+    async def test_get_device_state_reuses_device(
+        self,
+        client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test a known device skips the device request."""
+        mock_response.status = 200
+        mock_response.read = json_body([])
+        device = Device(device_id=DEVICE_ID, nickname="Kitchen Fridge")
+
+        state = await client.get_device_state(DEVICE_ID, device=device)
+
+        assert state.device is device
+        assert mock_session.request.call_count == 1
+        assert mock_session.request.call_args.args[1].endswith("/controls")
+
+    async def test_get_device_state_is_concurrent(
+        self, client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test device and controls requests are in flight at the same time."""
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        def _request(method: str, url: str, **kwargs: Any) -> MagicMock:
+            response = MagicMock()
+            response.status = 200
+            response.read = json_body(
+                [] if url.endswith("/controls") else {"deviceId": DEVICE_ID}
+            )
+
+            async def _enter() -> MagicMock:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                if peak == 2:
+                    release.set()
+                await release.wait()
+                in_flight -= 1
+                return response
+
+            response.__aenter__ = AsyncMock(side_effect=_enter)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+
+        mock_session.request.side_effect = _request
+
+        state = await client.get_device_state(DEVICE_ID)
+
+        assert peak == 2
+        assert state.device.device_id == DEVICE_ID
+        assert state.controls == []
+
+    async def test_get_device_state_failure_cancels_sibling(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test a failed request cancels the other one."""
+        calls = 0
+        never = asyncio.Event()
+
+        async def _enter() -> MagicMock:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                mock_response.status = 404
+                return mock_response
+            await never.wait()
+            return mock_response  # pragma: no cover
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_enter)
+        mock_response.read = json_body({"message": "offline"})
+
+        with pytest.raises(LiebherrNotFoundError):
+            await client.get_device_state(DEVICE_ID)
+        await asyncio.sleep(0)
+
+        assert client._inflight == {}
+
     async def test_refresh_device(
         self, client: LiebherrClient, mock_response: MagicMock
     ) -> None:
@@ -371,7 +692,7 @@ class TestConvenienceMethods:
         mock_response.status = 200
         device_response = {"deviceId": DEVICE_ID, "deviceType": "FRIDGE"}
         controls_response: list[dict[str, Any]] = []
-        mock_response.json = AsyncMock(side_effect=[device_response, controls_response])
+        mock_response.read = json_body(device_response, controls_response)
 
         state = await client.refresh_device(DEVICE_ID)
         assert state.device.device_id == DEVICE_ID
@@ -382,8 +703,8 @@ class TestConvenienceMethods:
     ) -> None:
         """Test getting only temperature controls."""
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value=[
+        mock_response.read = json_body(
+            [
                 {
                     "name": "temperature",
                     "type": "TemperatureControl",
@@ -404,6 +725,345 @@ class TestConvenienceMethods:
         assert temp_controls[0].name == "temperature"
 
 
+class TestBulkOperations:
+    """Tests for fleet-wide operations."""
+
+    @pytest.fixture
+    def slow_gate(self) -> asyncio.Event:
+        """Hold the slow device's controls response until set."""
+        return asyncio.Event()
+
+    @pytest.fixture
+    def fleet(self, mock_session: MagicMock, slow_gate: asyncio.Event) -> list[str]:
+        """Route requests for three devices: dev-2 is offline, dev-3 is slow."""
+        device_ids = ["dev-1", "dev-2", "dev-3"]
+        routes: dict[str, tuple[int, Any]] = {
+            "devices": (200, [{"deviceId": device_id} for device_id in device_ids]),
+        }
+        for device_id in device_ids:
+            routes[f"devices/{device_id}"] = (200, {"deviceId": device_id})
+            routes[f"devices/{device_id}/controls"] = (
+                200,
+                [{"name": "partymode", "type": "ToggleControl", "value": False}],
+            )
+        routes["devices/dev-2/controls"] = (404, {"message": "offline"})
+        route_requests(
+            mock_session, routes, gates={"devices/dev-3/controls": slow_gate}
+        )
+        return device_ids
+
+    async def test_get_all_device_states(
+        self, client: LiebherrClient, fleet: list[str], slow_gate: asyncio.Event
+    ) -> None:
+        """Test failures are returned alongside successful states."""
+        slow_gate.set()
+        results = await client.get_all_device_states(fleet)
+
+        assert [result.device_id for result in results] == fleet
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, LiebherrNotFoundError)
+        assert results[1].state is None
+        assert results[2].state is not None
+        assert len(results[2].state.controls) == 1
+
+    async def test_get_all_device_states_malformed_device(
+        self, client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test a parsing error is captured instead of aborting the sweep."""
+        route_requests(
+            mock_session,
+            {
+                "devices/dev-1": (200, {"deviceId": "dev-1"}),
+                "devices/dev-1/controls": (200, []),
+                "devices/dev-2": (200, {"nickname": "broken"}),
+                "devices/dev-2/controls": (200, [{"type": "ToggleControl"}]),
+            },
+        )
+        results = await client.get_all_device_states(["dev-1", "dev-2"])
+
+        assert [result.ok for result in results] == [True, False]
+        assert isinstance(results[1].error, KeyError)
+        assert results[1].state is None
+
+    async def test_get_all_device_states_defaults_to_all_devices(
+        self,
+        client: LiebherrClient,
+        mock_session: MagicMock,
+        fleet: list[str],
+        slow_gate: asyncio.Event,
+    ) -> None:
+        """Test the device list is fetched once and its devices reused."""
+        slow_gate.set()
+        results = await client.get_all_device_states(concurrency=2)
+
+        assert [result.device_id for result in results] == fleet
+        urls = [call.args[1] for call in mock_session.request.call_args_list]
+        assert sum(url.endswith("/v1/devices") for url in urls) == 1
+        assert not any(url.endswith("/v1/devices/dev-1") for url in urls)
+
+    async def test_get_all_device_states_bounded_concurrency(
+        self, client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test no more than the configured number of devices run at once."""
+        active = 0
+        peak = 0
+
+        async def _get_controls(device_id: str) -> list[Any]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return []
+
+        device_ids = [f"dev-{index}" for index in range(10)]
+        with (
+            patch.object(client, "get_controls", side_effect=_get_controls),
+            patch.object(client, "get_device", AsyncMock(return_value=Device("d"))),
+        ):
+            results = await client.get_all_device_states(device_ids, concurrency=3)
+            for result in results:
+                assert result.ok
+
+        assert peak == 3
+
+    async def test_get_all_device_states_deadline(
+        self, client: LiebherrClient, fleet: list[str]
+    ) -> None:
+        """Test slow devices get a timeout result at the deadline."""
+        results = await client.get_all_device_states(fleet, deadline=0.2)
+
+        assert results[0].ok
+        assert isinstance(results[2].error, LiebherrTimeoutError)
+
+    async def test_iter_device_states_completion_order(
+        self, client: LiebherrClient, fleet: list[str], slow_gate: asyncio.Event
+    ) -> None:
+        """Test results are yielded as soon as each device completes."""
+        seen: list[str] = []
+        async for result in client.iter_device_states(fleet):
+            seen.append(result.device_id)
+            if len(seen) == 2:
+                slow_gate.set()
+
+        assert sorted(seen[:2]) == ["dev-1", "dev-2"]
+        assert seen[2] == "dev-3"
+
+    async def test_iter_device_states_defaults_to_all_devices(
+        self, client: LiebherrClient, fleet: list[str], slow_gate: asyncio.Event
+    ) -> None:
+        """Test all devices are streamed when no ids are given."""
+        slow_gate.set()
+        results = [result async for result in client.iter_device_states()]
+
+        assert sorted(result.device_id for result in results) == fleet
+
+    async def test_iter_device_states_invalid_concurrency(
+        self, client: LiebherrClient
+    ) -> None:
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            await anext(client.iter_device_states([DEVICE_ID], concurrency=0))
+
+    async def test_iter_device_states_reuses_devices(
+        self,
+        client: LiebherrClient,
+        mock_session: MagicMock,
+        fleet: list[str],
+        slow_gate: asyncio.Event,
+    ) -> None:
+        """Test Device objects skip the device request."""
+        slow_gate.set()
+        devices = [Device(device_id=device_id) for device_id in fleet]
+        results = [result async for result in client.iter_device_states(devices)]
+
+        by_id = {result.device_id: result for result in results}
+        assert set(by_id) == set(fleet)
+        state = by_id["dev-1"].state
+        assert state is not None
+        assert state.device is devices[0]
+        assert mock_session.request.call_count == 3
+
+    async def test_iter_device_states_pulls_ids_lazily(
+        self, client: LiebherrClient, fleet: list[str]
+    ) -> None:
+        """Test device ids are consumed only as slots free up."""
+        pulled: list[str] = []
+
+        def _ids() -> Iterator[str]:
+            for device_id in fleet:
+                pulled.append(device_id)
+                yield device_id
+
+        stream = client.iter_device_states(_ids(), concurrency=1)
+        first = await anext(stream)
+
+        assert first.device_id == "dev-1"
+        assert pulled == ["dev-1", "dev-2"]
+        await stream.aclose()
+
+    async def test_iter_device_states_early_exit_cancels(
+        self, client: LiebherrClient, fleet: list[str]
+    ) -> None:
+        """Test leaving the loop cancels requests still in flight."""
+        stream = client.iter_device_states(fleet)
+        async for _result in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert client._inflight == {}
+
+    async def test_iter_device_states_deadline(
+        self, client: LiebherrClient, fleet: list[str]
+    ) -> None:
+        """Test in-flight and unstarted devices time out at the deadline."""
+        ids = ["dev-3", "dev-1", "dev-2"]
+        results = [
+            result
+            async for result in client.iter_device_states(
+                ids, concurrency=1, deadline=0.1
+            )
+        ]
+
+        assert [result.device_id for result in results] == ids
+        assert all(isinstance(result.error, LiebherrTimeoutError) for result in results)
+
+    async def test_get_all_device_states_empty(self, client: LiebherrClient) -> None:
+        """Test an empty device list returns no results."""
+        assert await client.get_all_device_states([]) == []
+
+    async def test_get_all_device_states_invalid_concurrency(
+        self, client: LiebherrClient
+    ) -> None:
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            await client.get_all_device_states([DEVICE_ID], concurrency=0)
+
+    async def test_apply_to_devices(
+        self, client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test a write is applied per device with failures captured."""
+        routes: dict[str, tuple[int, Any]] = {
+            f"devices/{device_id}/controls/nightmode": (204, None)
+            for device_id in ("dev-1", "dev-3")
+        }
+        routes["devices/dev-2/controls/nightmode"] = (404, {"message": "offline"})
+        route_requests(mock_session, routes)
+        devices: list[str | Device] = ["dev-1", Device(device_id="dev-2"), "dev-3"]
+
+        results = await client.apply_to_devices(
+            devices, lambda device_id: client.set_night_mode(device_id, True)
+        )
+
+        assert [result.device_id for result in results] == ["dev-1", "dev-2", "dev-3"]
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[0].result is WriteResult.SENT
+        assert isinstance(results[1].error, LiebherrNotFoundError)
+        assert results[1].result is None
+        assert mock_session.request.call_count == 3
+
+    async def test_apply_to_devices_operation_errors(
+        self, client: LiebherrClient
+    ) -> None:
+        """Test any error raised by the operation stays with its device."""
+
+        async def _operation(device_id: str) -> WriteResult:
+            if device_id == "dev-2":
+                raise ValueError("bad target")
+            await asyncio.sleep(0.01)
+            return WriteResult.SENT
+
+        results = await client.apply_to_devices(["dev-1", "dev-2", "dev-3"], _operation)
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].result is WriteResult.SENT
+
+    async def test_apply_to_devices_bounded_concurrency(
+        self, client: LiebherrClient
+    ) -> None:
+        """Test no more than the configured number of writes run at once."""
+        active = 0
+        peak = 0
+
+        async def _operation(device_id: str) -> WriteResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return WriteResult.SENT
+
+        device_ids = [f"dev-{index}" for index in range(10)]
+        results = await client.apply_to_devices(device_ids, _operation, concurrency=3)
+
+        assert all(result.ok for result in results)
+        assert peak == 3
+
+    async def test_apply_to_devices_deadline(self, client: LiebherrClient) -> None:
+        """Test writes still running at the deadline get a timeout result."""
+        gate = asyncio.Event()
+
+        async def _operation(device_id: str) -> WriteResult:
+            if device_id == "slow":
+                await gate.wait()
+            return WriteResult.SENT
+
+        results = await client.apply_to_devices(
+            ["slow", "fast", "queued"], _operation, concurrency=2, deadline=0.1
+        )
+
+        assert [result.device_id for result in results] == ["slow", "fast", "queued"]
+        assert results[1].result is WriteResult.SENT
+        assert isinstance(results[0].error, LiebherrTimeoutError)
+        assert results[2].result is WriteResult.SENT
+
+    async def test_apply_to_devices_progress(self, client: LiebherrClient) -> None:
+        """Test progress is reported per device in completion order."""
+        calls: list[tuple[str, int, int]] = []
+
+        async def _operation(device_id: str) -> WriteResult:
+            await asyncio.sleep(0.01 if device_id == "dev-1" else 0)
+            return WriteResult.NO_OP
+
+        await client.apply_to_devices(
+            ["dev-1", "dev-2"],
+            _operation,
+            progress=lambda result, done, total: calls.append(
+                (result.device_id, done, total)
+            ),
+        )
+
+        assert calls == [("dev-2", 1, 2), ("dev-1", 2, 2)]
+
+    async def test_apply_to_devices_progress_error(
+        self, client: LiebherrClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a failing progress callback does not stop the run."""
+
+        def _progress(*_args: Any) -> None:
+            raise RuntimeError("boom")
+
+        results = await client.apply_to_devices(
+            ["dev-1", "dev-2"],
+            AsyncMock(return_value=WriteResult.SENT),
+            progress=_progress,
+        )
+
+        assert all(result.ok for result in results)
+        assert "Error in bulk progress callback" in caplog.text
+
+    async def test_apply_to_devices_invalid_concurrency(
+        self, client: LiebherrClient
+    ) -> None:
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            await client.apply_to_devices(
+                [DEVICE_ID], AsyncMock(return_value=WriteResult.SENT), concurrency=0
+            )
+
+
 class TestErrorHandling:
     """Tests for error handling using parametrization."""
 
@@ -429,7 +1089,7 @@ class TestErrorHandling:
     ) -> None:
         """Test HTTP error handling."""
         mock_response.status = status
-        mock_response.json = AsyncMock(return_value=response_data)
+        mock_response.read = json_body(response_data)
 
         with pytest.raises(exception_class):
             await client.get_devices()
@@ -459,17 +1119,14 @@ class TestErrorHandling:
         result = await client._request("POST", "test")
         assert result is None
 
-    async def test_extract_message_content_type_error(
+    async def test_extract_message_plain_text(
         self, client: LiebherrClient, mock_response: MagicMock
     ) -> None:
-        """Fallback to response text when JSON parsing fails due to content type."""
+        """Fallback to the body text when the error body is not JSON."""
 
         mock_response.status = 400
         mock_response.reason = "Bad Request"
-        mock_response.text = AsyncMock(return_value="plain error")
-        mock_response.json = AsyncMock(
-            side_effect=ContentTypeError(MagicMock(), (), message="bad content")
-        )
+        mock_response.read = AsyncMock(return_value=b"plain error")
 
         with pytest.raises(LiebherrBadRequestError) as err:
             await client.get_devices()
@@ -483,7 +1140,7 @@ class TestErrorHandling:
 
         mock_response.status = 400
         mock_response.reason = "Bad Request"
-        mock_response.json = AsyncMock(return_value=["oops"])
+        mock_response.read = json_body(["oops"])
 
         with pytest.raises(LiebherrBadRequestError) as err:
             await client.get_devices()
@@ -498,8 +1155,7 @@ class TestErrorHandling:
         mock_response.status = 200
         mock_response.reason = "OK"
         mock_response.raise_for_status = MagicMock(return_value=None)
-        mock_response.text = AsyncMock(return_value="not json")
-        mock_response.json = AsyncMock(side_effect=ValueError("boom"))
+        mock_response.read = AsyncMock(return_value=b"not json")
 
         with pytest.raises(LiebherrServerError) as err:
             await client.get_devices()
@@ -522,6 +1178,944 @@ class TestErrorHandling:
             await client.get_devices()
 
 
+class TestRateLimiting:
+    """Tests for rate limiting in requests."""
+
+    @pytest.mark.parametrize("status", [429, 509])
+    async def test_rate_limit_status(
+        self, mock_session: MagicMock, mock_response: MagicMock, status: int
+    ) -> None:
+        """Test 429/509 raise a rate limit error and pause the limiter."""
+        limiter = RateLimiter(rate=10)
+        client = LiebherrClient(
+            api_key=API_KEY, session=mock_session, rate_limiter=limiter
+        )
+        mock_response.status = status
+        mock_response.headers = {"Retry-After": "7"}
+        mock_response.read = json_body({"message": "Slow down"})
+
+        with patch.object(limiter, "pause") as pause:
+            with pytest.raises(LiebherrRateLimitError) as err:
+                await client.get_devices()
+
+        assert err.value.retry_after == 7
+        assert "Slow down" in str(err.value)
+        pause.assert_called_once_with(7)
+
+    async def test_rate_limit_without_limiter(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test rate limit errors are raised without a configured limiter."""
+        mock_response.status = 429
+        mock_response.headers = {}
+        mock_response.read = json_body({"message": "Slow down"})
+
+        with pytest.raises(LiebherrRateLimitError) as err:
+            await client.get_devices()
+
+        assert err.value.retry_after is None
+
+    async def test_requests_acquire_tokens(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test every request waits on the rate limiter."""
+        limiter = RateLimiter(rate=10)
+        client = LiebherrClient(
+            api_key=API_KEY, session=mock_session, rate_limiter=limiter
+        )
+        mock_response.status = 204
+
+        with patch.object(limiter, "acquire", AsyncMock()) as acquire:
+            await client.set_party_mode(DEVICE_ID, True)
+            await client.get_devices()
+
+        assert acquire.await_count == 2
+
+    def test_queue_depth(self, mock_session: MagicMock) -> None:
+        """Test queue depth is exposed on the client."""
+        assert LiebherrClient(api_key=API_KEY).rate_limit_queue_depth == 0
+        client = LiebherrClient(
+            api_key=API_KEY, session=mock_session, rate_limiter=RateLimiter(rate=1)
+        )
+        assert client.rate_limit_queue_depth == 0
+
+
+class TestRetries:
+    """Tests for retrying requests."""
+
+    @pytest.fixture
+    def retry_client(self, mock_session: MagicMock) -> LiebherrClient:
+        """Create a client that retries GET requests."""
+        return LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+        )
+
+    async def test_retries_transient_errors(
+        self, retry_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test transient errors are retried until the request succeeds."""
+        mock_response.status = 200
+        mock_response.read = json_body({"message": "boom"}, {"deviceId": DEVICE_ID})
+        statuses = iter([500, 200])
+
+        async def _enter() -> MagicMock:
+            mock_response.status = next(statuses)
+            return mock_response
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_enter)
+
+        device = await retry_client.get_device(DEVICE_ID)
+
+        assert device.device_id == DEVICE_ID
+        assert retry_client.metrics.requests == 2
+        assert retry_client.metrics.retries == 1
+        assert retry_client.metrics.retries_by_error == {"LiebherrServerError": 1}
+
+    async def test_gives_up_after_max_attempts(
+        self, retry_client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test the last error is raised once attempts are exhausted."""
+        mock_session.request.side_effect = TimeoutError()
+
+        with pytest.raises(LiebherrTimeoutError):
+            await retry_client.get_controls(DEVICE_ID)
+
+        assert mock_session.request.call_count == 3
+        assert retry_client.metrics.retries == 2
+        assert retry_client.metrics.retries_exhausted == 1
+
+    async def test_non_retryable_error(
+        self, retry_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test errors classified as permanent are raised immediately."""
+        mock_response.status = 404
+        mock_response.read = json_body({"message": "offline"})
+
+        with pytest.raises(LiebherrNotFoundError):
+            await retry_client.get_device(DEVICE_ID)
+
+        assert retry_client.metrics.requests == 1
+        assert retry_client.metrics.retries == 0
+
+    async def test_post_requests_not_retried(
+        self, retry_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test writes are not retried by default."""
+        mock_response.status = 500
+        mock_response.read = json_body({"message": "boom"})
+
+        with pytest.raises(LiebherrServerError):
+            await retry_client.set_party_mode(DEVICE_ID, True)
+
+        assert retry_client.metrics.requests == 1
+
+    async def test_honors_retry_after(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test rate limit delays take precedence over the backoff."""
+        client = LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+        )
+        mock_response.status = 429
+        mock_response.headers = {"Retry-After": "3"}
+        mock_response.read = json_body({"message": "busy"})
+
+        with (
+            patch("pyliebherrhomeapi.client.asyncio.sleep", AsyncMock()) as sleep,
+            pytest.raises(LiebherrRateLimitError),
+        ):
+            await client.get_devices()
+
+        sleep.assert_awaited_once_with(3)
+
+    async def test_gives_up_when_delay_exceeds_deadline(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test no retry is scheduled past the deadline."""
+        client = LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            retry_policy=RetryPolicy(max_attempts=5, base_delay=0, deadline=1),
+        )
+        mock_response.status = 429
+        mock_response.headers = {"Retry-After": "60"}
+        mock_response.read = json_body({"message": "busy"})
+
+        with pytest.raises(LiebherrRateLimitError):
+            await client.get_devices()
+
+        assert client.metrics.requests == 1
+        assert client.metrics.retries_exhausted == 1
+
+    async def test_deadline_interrupts_attempt(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test a slow attempt is cut off at the overall deadline."""
+        client = LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            retry_policy=RetryPolicy(deadline=0.05),
+        )
+
+        async def _slow_enter() -> MagicMock:
+            await asyncio.sleep(1)
+            return mock_response
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_slow_enter)
+
+        with pytest.raises(LiebherrTimeoutError, match="deadline"):
+            await client.get_devices()
+
+        assert client.metrics.retries_exhausted == 1
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of GET requests."""
+
+    @pytest.fixture
+    def gate(self, mock_response: MagicMock) -> asyncio.Event:
+        """Hold responses until the returned event is set."""
+        event = asyncio.Event()
+
+        async def _enter() -> MagicMock:
+            await event.wait()
+            return mock_response
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_enter)
+        mock_response.status = 200
+        mock_response.read = json_body([{"name": "partymode", "type": "ToggleControl"}])
+        return event
+
+    async def test_concurrent_identical_requests_share_one_call(
+        self,
+        client: LiebherrClient,
+        mock_session: MagicMock,
+        gate: asyncio.Event,
+    ) -> None:
+        """Test identical concurrent GETs result in a single upstream call."""
+        tasks = [asyncio.create_task(client.get_controls(DEVICE_ID)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert mock_session.request.call_count == 1
+        assert all(len(controls) == 1 for controls in results)
+        assert client.metrics.coalesced == 2
+        assert client._inflight == {}
+
+    async def test_different_params_not_coalesced(
+        self,
+        client: LiebherrClient,
+        mock_session: MagicMock,
+        gate: asyncio.Event,
+    ) -> None:
+        """Test requests with different params get their own calls."""
+        tasks = [
+            asyncio.create_task(client.get_control(DEVICE_ID, "temperature", 0)),
+            asyncio.create_task(client.get_control(DEVICE_ID, "temperature", 1)),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert mock_session.request.call_count == 2
+        assert client.metrics.coalesced == 0
+
+    async def test_coalescing_disabled(
+        self, mock_session: MagicMock, gate: asyncio.Event
+    ) -> None:
+        """Test coalescing can be turned off."""
+        client = LiebherrClient(
+            api_key=API_KEY, session=mock_session, coalesce_requests=False
+        )
+        tasks = [asyncio.create_task(client.get_controls(DEVICE_ID)) for _ in range(2)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert mock_session.request.call_count == 2
+
+    async def test_errors_fan_out(
+        self,
+        client: LiebherrClient,
+        mock_response: MagicMock,
+        gate: asyncio.Event,
+    ) -> None:
+        """Test every waiter receives the upstream error."""
+        mock_response.status = 404
+        mock_response.read = json_body({"message": "offline"})
+        tasks = [asyncio.create_task(client.get_controls(DEVICE_ID)) for _ in range(2)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, LiebherrNotFoundError) for result in results)
+
+    async def test_cancelling_one_waiter_keeps_request(
+        self, client: LiebherrClient, gate: asyncio.Event
+    ) -> None:
+        """Test a cancelled waiter does not cancel the shared request."""
+        first = asyncio.create_task(client.get_controls(DEVICE_ID))
+        second = asyncio.create_task(client.get_controls(DEVICE_ID))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert len(await second) == 1
+        assert first.cancelled()
+
+    async def test_cancelling_all_waiters_cancels_request(
+        self, client: LiebherrClient, mock_session: MagicMock, gate: asyncio.Event
+    ) -> None:
+        """Test the upstream request is cancelled once nobody waits for it."""
+        task = asyncio.create_task(client.get_controls(DEVICE_ID))
+        await asyncio.sleep(0)
+        (flight,) = client._inflight.values()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert flight.task.cancelled()
+        assert client._inflight == {}
+
+        gate.set()
+        assert len(await client.get_controls(DEVICE_ID)) == 1
+        assert mock_session.request.call_count == 2
+
+
+class TestWriteCoalescing:
+    """Tests for debounced, last-write-wins control writes."""
+
+    @pytest.fixture
+    def debounced(self, mock_session: MagicMock, mock_response: MagicMock) -> Any:
+        """Create a client with write coalescing enabled."""
+        mock_response.status = 204
+        return LiebherrClient(
+            api_key=API_KEY, session=mock_session, write_debounce=0.05
+        )
+
+    @staticmethod
+    def posted(mock_session: MagicMock) -> list[tuple[str, Any]]:
+        """Return the endpoint and body of every request sent."""
+        return [
+            (c.args[1].split("/v1/", 1)[1], c.kwargs["json"])
+            for c in mock_session.request.call_args_list
+        ]
+
+    async def test_rapid_writes_send_last_value(
+        self, debounced: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test writes within the window collapse into the last one."""
+        await asyncio.gather(
+            *(debounced.set_temperature(DEVICE_ID, 0, target) for target in (3, 4, 5)),
+            debounced.set_temperature(DEVICE_ID, 1, -18),
+        )
+        assert self.posted(mock_session) == [
+            (
+                f"devices/{DEVICE_ID}/controls/temperature",
+                {"zoneId": 0, "target": 5, "unit": "°C"},
+            ),
+            (
+                f"devices/{DEVICE_ID}/controls/temperature",
+                {"zoneId": 1, "target": -18, "unit": "°C"},
+            ),
+        ]
+        assert debounced.metrics.writes_coalesced == 2
+        assert debounced._pending_writes == {}
+        assert debounced._sending_writes == {}
+
+    @pytest.mark.parametrize(
+        ("method_name", "args"),
+        [
+            ("set_presentation_light", (1,)),
+            ("set_ice_maker", (0, IceMakerMode.ON)),
+            ("set_hydro_breeze", (0, HydroBreezeMode.LOW)),
+            ("set_bio_fresh_plus", (0, BioFreshPlusMode.ZERO_ZERO)),
+        ],
+    )
+    async def test_other_coalesced_setters(
+        self,
+        debounced: LiebherrClient,
+        mock_session: MagicMock,
+        method_name: str,
+        args: tuple[Any, ...],
+    ) -> None:
+        """Test the other value setters are coalesced too."""
+        method = getattr(debounced, method_name)
+        await asyncio.gather(method(DEVICE_ID, *args), method(DEVICE_ID, *args))
+        assert mock_session.request.call_count == 1
+
+    async def test_toggles_are_sent_immediately(
+        self, debounced: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test writes outside the coalesced controls are not held back."""
+        await asyncio.gather(
+            debounced.set_superfrost(DEVICE_ID, 1, True),
+            debounced.set_superfrost(DEVICE_ID, 1, False),
+        )
+        assert mock_session.request.call_count == 2
+
+    async def test_failure_reaches_every_caller(
+        self, debounced: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test a failed write raises in all superseded callers."""
+        mock_response.status = 400
+        mock_response.read = json_body({"message": "bad"})
+        results = await asyncio.gather(
+            debounced.set_temperature(DEVICE_ID, 0, 3),
+            debounced.set_temperature(DEVICE_ID, 0, 99),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, LiebherrBadRequestError) for r in results)
+
+    async def test_cancelled_caller_keeps_the_write(
+        self, debounced: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test cancelling a caller does not cancel the shared write."""
+        first = asyncio.create_task(debounced.set_temperature(DEVICE_ID, 0, 3))
+        await asyncio.sleep(0)
+        first.cancel()
+        await debounced.set_temperature(DEVICE_ID, 0, 4)
+        assert first.cancelled()
+        assert self.posted(mock_session)[0][1]["target"] == 4
+
+    async def test_writes_stay_in_order(
+        self,
+        debounced: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test a new window waits for the write still being sent."""
+        gate = asyncio.Event()
+
+        async def _enter() -> MagicMock:
+            await gate.wait()
+            return mock_response
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_enter)
+        first = asyncio.create_task(debounced.set_temperature(DEVICE_ID, 0, 3))
+        await asyncio.sleep(0.08)
+        assert mock_session.request.call_count == 1
+
+        second = asyncio.create_task(debounced.set_temperature(DEVICE_ID, 0, 4))
+        await asyncio.sleep(0.08)
+        assert mock_session.request.call_count == 1
+
+        gate.set()
+        await asyncio.gather(first, second)
+        assert [body["target"] for _, body in self.posted(mock_session)] == [3, 4]
+
+    async def test_flush_and_close_send_immediately(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test pending writes are sent by flush_writes() and close()."""
+        mock_response.status = 204
+        client = LiebherrClient(
+            api_key=API_KEY, session=mock_session, write_debounce=60
+        )
+        write = asyncio.create_task(client.set_temperature(DEVICE_ID, 0, 3))
+        await asyncio.sleep(0)
+        async with asyncio.timeout(1):
+            await client.flush_writes()
+        assert write.done()
+
+        write = asyncio.create_task(client.set_presentation_light(DEVICE_ID, 2))
+        await asyncio.sleep(0)
+        async with asyncio.timeout(1):
+            await client.close()
+        assert write.done()
+        assert mock_session.request.call_count == 2
+
+    async def test_close_waits_for_write_being_sent(
+        self,
+        debounced: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test close() waits for a write whose request is in flight."""
+        gate = asyncio.Event()
+
+        async def _enter() -> MagicMock:
+            await gate.wait()
+            return mock_response
+
+        mock_response.__aenter__ = AsyncMock(side_effect=_enter)
+        write = asyncio.create_task(debounced.set_temperature(DEVICE_ID, 0, 3))
+        await asyncio.sleep(0.08)
+        assert mock_session.request.call_count == 1
+        assert debounced._pending_writes == {}
+
+        closing = asyncio.create_task(debounced.close())
+        await asyncio.sleep(0.02)
+        assert not closing.done()
+
+        gate.set()
+        async with asyncio.timeout(1):
+            await closing
+        assert write.done()
+        assert write.result() is WriteResult.SENT
+
+    async def test_cancelled_flush_cancels_callers(
+        self, debounced: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test callers do not hang when the pending write is cancelled."""
+        write = asyncio.create_task(debounced.set_temperature(DEVICE_ID, 0, 3))
+        await asyncio.sleep(0)
+        for task in debounced._write_tasks:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await write
+        assert debounced._pending_writes == {}
+        mock_session.request.assert_not_called()
+
+    def test_invalid_debounce(self) -> None:
+        """Test a negative debounce window is rejected."""
+        with pytest.raises(ValueError, match="write_debounce"):
+            LiebherrClient(api_key=API_KEY, write_debounce=-1)
+
+
+class TestRedundantWrites:
+    """Tests for skipping writes that match the known control value."""
+
+    CONTROLS: list[dict[str, Any]] = [
+        {
+            "name": "temperature",
+            "type": "TemperatureControl",
+            "zoneId": 0,
+            "target": 4,
+            "unit": "°C",
+        },
+        {"name": "superfrost", "type": "ToggleControl", "zoneId": 1, "value": True},
+        {"name": "partymode", "type": "ToggleControl", "value": False},
+        {
+            "name": "icemaker",
+            "type": "IceMakerControl",
+            "zoneId": 1,
+            "iceMakerMode": "ON",
+        },
+        {
+            "name": "hydrobreeze",
+            "type": "HydroBreezeControl",
+            "zoneId": 0,
+            "currentMode": "LOW",
+        },
+        {
+            "name": "biofreshplus",
+            "type": "BioFreshPlusControl",
+            "zoneId": 0,
+            "currentMode": "ZERO_ZERO",
+        },
+        {"name": "autodoor", "type": "AutoDoorControl", "zoneId": 0, "value": "OPEN"},
+        {"name": "nightmode", "type": "ToggleControl"},
+    ]
+
+    @pytest.fixture
+    def skipping(self, mock_session: MagicMock, mock_response: MagicMock) -> Any:
+        """Create a client trusting known values for a minute."""
+        mock_response.status = 204
+        return LiebherrClient(
+            api_key=API_KEY, session=mock_session, skip_redundant_writes=60
+        )
+
+    async def test_repeated_write_is_skipped(
+        self, skipping: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test writing the value just written again is a no-op."""
+        writes: list[Any] = []
+        skipping.add_write_listener(lambda *args: writes.append(args))
+
+        assert await skipping.set_party_mode(DEVICE_ID, True) is WriteResult.SENT
+        assert await skipping.set_party_mode(DEVICE_ID, True) is WriteResult.NO_OP
+        assert await skipping.set_party_mode(DEVICE_ID, False) is WriteResult.SENT
+        assert mock_session.request.call_count == 2
+        assert len(writes) == 2
+        assert skipping.metrics.writes_skipped == 1
+
+    async def test_read_values_are_trusted(
+        self,
+        skipping: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test writes matching freshly read controls are skipped."""
+        mock_response.status = 200
+        mock_response.read = json_body(self.CONTROLS)
+        await skipping.get_controls(DEVICE_ID)
+
+        results = [
+            await skipping.set_temperature(DEVICE_ID, 0, 4),
+            await skipping.set_superfrost(DEVICE_ID, 1, True),
+            await skipping.set_party_mode(DEVICE_ID, False),
+            await skipping.set_ice_maker(DEVICE_ID, 1, IceMakerMode.ON),
+            await skipping.set_hydro_breeze(DEVICE_ID, 0, HydroBreezeMode.LOW),
+            await skipping.set_bio_fresh_plus(DEVICE_ID, 0, BioFreshPlusMode.ZERO_ZERO),
+        ]
+        assert results == [WriteResult.NO_OP] * 6
+        assert mock_session.request.call_count == 1
+
+        mock_response.status = 204
+        assert await skipping.set_night_mode(DEVICE_ID, False) is WriteResult.SENT
+        assert await skipping.set_superfrost(DEVICE_ID, 0, True) is WriteResult.SENT
+        assert (
+            await skipping.set_temperature(
+                DEVICE_ID, 0, 4, unit=TemperatureUnit.FAHRENHEIT
+            )
+            is WriteResult.SENT
+        )
+
+    async def test_auto_door_is_always_sent(
+        self, skipping: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test auto door actions are never treated as redundant."""
+        for _ in range(2):
+            assert await skipping.trigger_auto_door(DEVICE_ID, 0, True) is (
+                WriteResult.SENT
+            )
+        assert mock_session.request.call_count == 2
+
+    async def test_stale_values_are_not_trusted(
+        self, skipping: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test values older than the freshness bound are ignored."""
+        await skipping.set_party_mode(DEVICE_ID, True)
+        key = (DEVICE_ID, "partymode", None)
+        seen, payload = skipping._known_values[key]
+        skipping._known_values[key] = (seen - 61, payload)
+
+        assert await skipping.set_party_mode(DEVICE_ID, True) is WriteResult.SENT
+        assert mock_session.request.call_count == 2
+
+    async def test_failed_write_forgets_value(
+        self, skipping: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test a failed write leaves the control value unknown."""
+        await skipping.set_party_mode(DEVICE_ID, True)
+        mock_response.status = 500
+        mock_response.read = json_body({"message": "boom"})
+        with pytest.raises(LiebherrServerError):
+            await skipping.set_party_mode(DEVICE_ID, False)
+        assert skipping._known_values == {}
+
+    async def test_disabled_by_default(
+        self, client: LiebherrClient, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test every write is sent without the option."""
+        mock_response.status = 204
+        for _ in range(2):
+            assert await client.set_party_mode(DEVICE_ID, True) is WriteResult.SENT
+        assert mock_session.request.call_count == 2
+        assert client._known_values == {}
+
+    async def test_debounced_writes_compare_the_final_value(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test a slider returning to the known value sends nothing."""
+        mock_response.status = 204
+        client = LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            write_debounce=0.01,
+            skip_redundant_writes=60,
+        )
+        await client.set_temperature(DEVICE_ID, 0, 5)
+        results = await asyncio.gather(
+            client.set_temperature(DEVICE_ID, 0, 4),
+            client.set_temperature(DEVICE_ID, 0, 5),
+        )
+        assert list(results) == [WriteResult.NO_OP, WriteResult.NO_OP]
+        assert mock_session.request.call_count == 1
+
+    def test_invalid_max_age(self) -> None:
+        """Test a negative freshness bound is rejected."""
+        with pytest.raises(ValueError, match="skip_redundant_writes"):
+            LiebherrClient(api_key=API_KEY, skip_redundant_writes=-1)
+
+
+class TestResponseCaching:
+    """Tests for caching GET responses."""
+
+    @pytest.fixture
+    def cached_client(self, mock_session: MagicMock) -> LiebherrClient:
+        """Create a client with a response cache."""
+        return LiebherrClient(
+            api_key=API_KEY, session=mock_session, cache=ResponseCache()
+        )
+
+    async def test_device_metadata_cached(
+        self,
+        cached_client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test repeated device lookups are served from the cache."""
+        mock_response.status = 200
+        mock_response.read = json_body({"deviceId": DEVICE_ID})
+
+        first = await cached_client.get_device(DEVICE_ID)
+        second = await cached_client.get_device(DEVICE_ID)
+
+        assert first == second
+        assert mock_session.request.call_count == 1
+        assert cached_client.cache is not None
+        assert cached_client.cache.stats.hits == 1
+
+    async def test_device_list_seeds_device_entries(
+        self,
+        cached_client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test a device list response also answers single device lookups."""
+        mock_response.status = 200
+        mock_response.read = json_body(
+            [{"deviceId": DEVICE_ID, "nickname": "Fridge"}, "junk"]
+        )
+
+        await cached_client.get_devices()
+        device = await cached_client.get_device(DEVICE_ID)
+
+        assert device.nickname == "Fridge"
+        assert mock_session.request.call_count == 1
+
+    async def test_controls_not_cached_by_default(
+        self,
+        cached_client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test control state is always fetched unless configured."""
+        mock_response.status = 200
+        mock_response.read = json_body([])
+
+        await cached_client.get_controls(DEVICE_ID)
+        await cached_client.get_controls(DEVICE_ID)
+
+        assert mock_session.request.call_count == 2
+
+    async def test_cache_without_coalescing(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test caching works when coalescing is disabled."""
+        client = LiebherrClient(
+            api_key=API_KEY,
+            session=mock_session,
+            cache=ResponseCache(),
+            coalesce_requests=False,
+        )
+        mock_response.status = 200
+        mock_response.read = json_body({"not": "a list"})
+
+        with pytest.raises(LiebherrServerError):
+            await client.get_devices()
+        mock_response.read = json_body({"deviceId": DEVICE_ID})
+        await client.get_device(DEVICE_ID)
+        await client.get_device(DEVICE_ID)
+
+        assert mock_session.request.call_count == 2
+
+    async def test_invalidate_cache(
+        self,
+        cached_client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test explicit invalidation forces a new request."""
+        mock_response.status = 200
+        mock_response.read = json_body([{"deviceId": DEVICE_ID}])
+        await cached_client.get_devices()
+        assert cached_client.cache is not None
+        cached_client.cache.set(("devices/other", ()), {"deviceId": "other"}, 60)
+
+        assert cached_client.invalidate_cache(DEVICE_ID) == 2
+        assert cached_client.invalidate_cache() == 1
+        assert cached_client.invalidate_cache() == 0
+
+    def test_invalidate_without_cache(self, client: LiebherrClient) -> None:
+        """Test invalidation is a no-op without a cache."""
+        assert client.cache is None
+        assert client.invalidate_cache(DEVICE_ID) == 0
+
+
+class TestUnchangedResponses:
+    """Tests for reusing unchanged GET responses."""
+
+    CONTROLS = [
+        {"name": "temperature", "type": "TemperatureControl", "zoneId": 0},
+        {"name": "superfrost", "type": "ToggleControl", "zoneId": 0},
+    ]
+
+    @pytest.fixture
+    def memo_client(self, mock_session: MagicMock) -> LiebherrClient:
+        """Create a client that skips unchanged responses."""
+        return LiebherrClient(
+            api_key=API_KEY, session=mock_session, skip_unchanged=True
+        )
+
+    async def test_unchanged_body_reuses_objects(
+        self, memo_client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test identical bodies return the previously parsed controls."""
+        route_requests(
+            mock_session, {f"devices/{DEVICE_ID}/controls": (200, self.CONTROLS)}
+        )
+
+        with patch(
+            "pyliebherrhomeapi.client.parse_controls", wraps=parse_controls
+        ) as parse:
+            first = await memo_client.get_controls(DEVICE_ID)
+            second = await memo_client.get_controls(DEVICE_ID)
+
+        assert parse.call_count == 1
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert memo_client.metrics.requests == 2
+        assert memo_client.metrics.unchanged == 1
+
+    async def test_reused_controls_survive_state_updates(
+        self, memo_client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test merging into a state does not alter later identical responses."""
+        control = f"devices/{DEVICE_ID}/controls/superfrost"
+        before = [{**self.CONTROLS[1], "value": False}]
+        after = [{**self.CONTROLS[0], "value": 5}, {**self.CONTROLS[1], "value": True}]
+        route_requests(
+            mock_session,
+            {control: (200, before), f"devices/{DEVICE_ID}/controls": (200, after)},
+        )
+
+        # Targeted read, full refresh merged in place, targeted read again
+        state = DeviceState(
+            device=Device(DEVICE_ID),
+            controls=await memo_client.get_control(DEVICE_ID, "superfrost", 0),
+        )
+        state.apply_controls_payload(await memo_client.get_controls(DEVICE_ID))
+        assert state.get_control_by_name("superfrost") == ToggleControl(
+            name="superfrost", type="ToggleControl", zone_id=0, value=True
+        )
+        again = await memo_client.get_control(DEVICE_ID, "superfrost", 0)
+
+        assert memo_client.metrics.unchanged == 1
+        assert isinstance(again[0], ToggleControl)
+        assert again[0].value is False
+
+    async def test_changed_body_is_parsed(
+        self, memo_client: LiebherrClient, mock_session: MagicMock
+    ) -> None:
+        """Test a changed body is decoded and parsed again."""
+        endpoint = f"devices/{DEVICE_ID}/controls/superfrost"
+        route_requests(mock_session, {endpoint: (200, self.CONTROLS[1:])})
+        first = await memo_client.get_control(DEVICE_ID, "superfrost")
+
+        changed = [{**self.CONTROLS[1], "value": True}]
+        route_requests(mock_session, {endpoint: (200, changed)})
+        second = await memo_client.get_control(DEVICE_ID, "superfrost")
+
+        assert second[0] is not first[0]
+        assert isinstance(second[0], ToggleControl)
+        assert second[0].value is True
+        assert memo_client.metrics.unchanged == 0
+
+    async def test_etag(
+        self,
+        memo_client: LiebherrClient,
+        mock_session: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Test ETags are sent back and 304 responses reuse the last data."""
+        mock_response.status = 200
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_response.read = AsyncMock(
+            return_value=json.dumps([{"deviceId": DEVICE_ID}]).encode()
+        )
+        first = await memo_client.get_devices()
+        assert "If-None-Match" not in mock_session.request.call_args.kwargs["headers"]
+
+        mock_response.status = 304
+        second = await memo_client.get_devices()
+
+        headers = mock_session.request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert second == first
+        assert memo_client.metrics.unchanged == 1
+
+    async def test_304_without_memo_is_not_reused(
+        self, memo_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test a 304 for an unknown endpoint is not mistaken for data."""
+        mock_response.status = 304
+        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=b"")
+        mock_response.reason = "Not Modified"
+        with pytest.raises(LiebherrServerError, match="Not Modified"):
+            await memo_client.get_devices()
+
+    async def test_invalid_json(
+        self, memo_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test undecodable bodies raise a server error."""
+        mock_response.status = 200
+        mock_response.raise_for_status = MagicMock()
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=b"<html>oops</html>")
+        with pytest.raises(LiebherrServerError, match="oops"):
+            await memo_client.get_devices()
+
+    async def test_posts_are_not_memoized(
+        self, memo_client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test writes bypass the body memo."""
+        mock_response.status = 204
+        await memo_client.set_party_mode(DEVICE_ID, True)
+        assert memo_client._body_memo == {}
+
+
+class TestJsonDecoding:
+    """Tests for the pluggable JSON decoder."""
+
+    async def test_custom_loads(
+        self, mock_session: MagicMock, mock_response: MagicMock
+    ) -> None:
+        """Test the configured loads function decodes the raw body once."""
+        loads = MagicMock(side_effect=json.loads)
+        client = LiebherrClient(api_key=API_KEY, session=mock_session, json_loads=loads)
+        mock_response.status = 200
+        mock_response.read = json_body([{"deviceId": DEVICE_ID}])
+
+        devices = await client.get_devices()
+
+        assert devices == [Device(device_id=DEVICE_ID)]
+        loads.assert_called_once_with(b'[{"deviceId": "12.345.678.9"}]')
+        mock_response.read.assert_awaited_once()
+
+    async def test_error_body_read_once(
+        self, client: LiebherrClient, mock_response: MagicMock
+    ) -> None:
+        """Test error messages reuse the body that was already read."""
+        mock_response.status = 503
+        mock_response.read = json_body({"message": "down"})
+        with pytest.raises(LiebherrConnectionError, match="down"):
+            await client.get_devices()
+        mock_response.read.assert_awaited_once()
+
+    def test_default_prefers_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test orjson is used when installed and json otherwise."""
+        fake_orjson = MagicMock()
+        monkeypatch.setitem(sys.modules, "orjson", fake_orjson)
+        assert _default_json_loads() is fake_orjson.loads
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert _default_json_loads() is json.loads
+
+
 class TestVersionFallback:
     """Tests for version fallback handling."""
 
@@ -0,0 +1,110 @@
+"""Tests for connection pool configuration."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from pyliebherrhomeapi import ConnectorConfig, PoolStats
+from pyliebherrhomeapi.connector import _PoolTracker
+
+
+class TestConnectorConfig:
+    """Tests for ConnectorConfig."""
+
+    def test_defaults(self) -> None:
+        """Test default pool settings."""
+        config = ConnectorConfig()
+        assert config.limit == 100
+        assert config.limit_per_host == 0
+        assert config.keepalive_timeout == 30
+        assert config.ttl_dns_cache == 300
+        assert config.warm_up_connections == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"limit": -1},
+            {"limit_per_host": -1},
+            {"keepalive_timeout": -1},
+            {"warm_up_connections": -1},
+        ],
+    )
+    def test_invalid_values(self, kwargs: dict[str, int]) -> None:
+        """Test that negative values are rejected."""
+        with pytest.raises(ValueError):
+            ConnectorConfig(**kwargs)
+
+    async def test_create_connector(self) -> None:
+        """Test connector is created with configured limits."""
+        config = ConnectorConfig(limit=50, limit_per_host=20, keepalive_timeout=60)
+        connector = config.create_connector()
+        try:
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 50
+            assert connector.limit_per_host == 20
+        finally:
+            await connector.close()
+
+    async def test_create_connector_without_dns_cache(self) -> None:
+        """Test DNS caching can be disabled."""
+        connector = ConnectorConfig(ttl_dns_cache=None).create_connector()
+        try:
+            assert connector.use_dns_cache is False
+        finally:
+            await connector.close()
+
+
+class TestPoolTracker:
+    """Tests for pool statistics collection."""
+
+    async def test_trace_callbacks(self) -> None:
+        """Test trace callbacks update counters."""
+        tracker = _PoolTracker()
+        trace_config = tracker.trace_config()
+        assert len(trace_config.on_connection_queued_start) == 1
+        session = MagicMock()
+        ctx = SimpleNamespace()
+
+        await tracker._on_queued_start(session, ctx, None)
+        assert tracker.waiting == 1
+        assert tracker.total_waits == 1
+
+        await tracker._on_queued_end(session, ctx, None)
+        await tracker._on_create_end(session, ctx, None)
+        await tracker._on_reuseconn(session, ctx, None)
+
+        assert tracker.waiting == 0
+        assert tracker.total_waits == 1
+        assert tracker.connections_created == 1
+        assert tracker.connections_reused == 1
+
+    def test_snapshot_without_connector(self) -> None:
+        """Test snapshot before a session exists."""
+        stats = _PoolTracker().snapshot(None)
+        assert stats == PoolStats(
+            limit=0,
+            limit_per_host=0,
+            in_use=0,
+            idle=0,
+            waiting=0,
+            total_waits=0,
+            connections_created=0,
+            connections_reused=0,
+        )
+
+    def test_snapshot_counts_idle_connections(self) -> None:
+        """Test idle keep-alive connections are counted per host."""
+        tracker = _PoolTracker()
+        tracker.in_use = 2
+        connector = MagicMock(spec=aiohttp.BaseConnector)
+        connector.limit = 10
+        connector.limit_per_host = 5
+        connector._conns = {"a": [object(), object()], "b": [object()]}
+
+        stats = tracker.snapshot(connector)
+        assert stats.limit == 10
+        assert stats.limit_per_host == 5
+        assert stats.in_use == 2
+        assert stats.idle == 3
@@ -0,0 +1,695 @@
+"""Tests for the polling coordinator."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Iterable
+from typing import Any, cast
+
+import pytest
+
+from pyliebherrhomeapi import (
+    AdaptivePolling,
+    AutoDoorControl,
+    BackpressurePolicy,
+    ControlChangeKind,
+    Device,
+    DeviceControl,
+    DeviceCoordinator,
+    DeviceState,
+    DeviceStateResult,
+    DoorState,
+    LiebherrClient,
+    LiebherrConnectionError,
+    Subscription,
+    TemperatureControl,
+    TemperatureUnit,
+    ToggleControl,
+)
+
+
+class FakeClient:
+    """Client stand-in that records polls and serves canned results."""
+
+    def __init__(self) -> None:
+        """Initialize the fake client."""
+        self.polls: list[list[str | Device]] = []
+        self.failing: set[str] = set()
+        self.controls: dict[str, list[DeviceControl]] = {}
+        self.control_requests: list[tuple[str, str, int | None]] = []
+        self.gate: asyncio.Event | None = None
+        self.slow: dict[str, asyncio.Event] = {}
+        self.value_listeners: list[Callable[[str, str, dict[str, Any]], None]] = []
+
+    async def iter_device_states(
+        self, device_ids: Iterable[str | Device], *, concurrency: int
+    ) -> AsyncGenerator[DeviceStateResult, None]:
+        """Yield one result per device."""
+        targets = list(device_ids)
+        self.polls.append(targets)
+        for target in targets:
+            device_id = target if isinstance(target, str) else target.device_id
+            if device_id in self.slow:
+                await self.slow[device_id].wait()
+            if device_id in self.failing:
+                yield DeviceStateResult(
+                    device_id, error=LiebherrConnectionError("offline")
+                )
+            else:
+                device = target if isinstance(target, Device) else Device(device_id)
+                controls = list(self.controls.get(device_id, []))
+                yield DeviceStateResult(
+                    device_id, state=DeviceState(device=device, controls=controls)
+                )
+
+    async def get_control(
+        self, device_id: str, control_name: str, zone_id: int | None = None
+    ) -> list[DeviceControl]:
+        """Return the matching controls of a device."""
+        self.control_requests.append((device_id, control_name, zone_id))
+        if self.gate is not None:
+            await self.gate.wait()
+        if device_id in self.failing:
+            raise LiebherrConnectionError("offline")
+        return [
+            control
+            for control in self.controls.get(device_id, [])
+            if control.name == control_name and control.zone_id == zone_id
+        ]
+
+    def add_write_value_listener(
+        self, listener: Callable[[str, str, dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Register a write value listener."""
+        self.value_listeners.append(listener)
+        return lambda: self.value_listeners.remove(listener)
+
+    def write(self, device_id: str, control_name: str, values: dict[str, Any]) -> None:
+        """Report a successful write to the value listeners."""
+        for listener in list(self.value_listeners):
+            listener(device_id, control_name, values)
+
+
+def state(device_id: str) -> DeviceState:
+    """Build an empty state for a device."""
+    return DeviceState(device=Device(device_id=device_id))
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    """Return a fake client."""
+    return FakeClient()
+
+
+@pytest.fixture
+def coordinator(fake_client: FakeClient) -> DeviceCoordinator:
+    """Return a coordinator for two devices."""
+    return DeviceCoordinator(
+        cast(LiebherrClient, fake_client), ["dev-1", "dev-2"], interval=0.05
+    )
+
+
+class TestSubscription:
+    """Tests for Subscription backpressure."""
+
+    def make(self, maxsize: int, policy: BackpressurePolicy) -> Subscription:
+        """Create a detached subscription."""
+        return Subscription(None, maxsize, policy, lambda _sub: None)
+
+    def test_invalid_maxsize(self) -> None:
+        """Test maxsize must be positive."""
+        with pytest.raises(ValueError):
+            self.make(0, BackpressurePolicy.DROP_OLDEST)
+
+    async def test_drop_oldest(self) -> None:
+        """Test the oldest update is evicted when full."""
+        sub = self.make(2, BackpressurePolicy.DROP_OLDEST)
+        for device_id in ("a", "b", "c"):
+            await sub.offer(state(device_id))
+        assert sub.dropped == 1
+        assert (await sub.get()).device.device_id == "b"
+        assert (await sub.get()).device.device_id == "c"
+
+    async def test_drop_newest(self) -> None:
+        """Test incoming updates are discarded when full."""
+        sub = self.make(2, BackpressurePolicy.DROP_NEWEST)
+        for device_id in ("a", "b", "c"):
+            await sub.offer(state(device_id))
+        assert sub.dropped == 1
+        assert (await sub.get()).device.device_id == "a"
+        assert (await sub.get()).device.device_id == "b"
+
+    async def test_block(self) -> None:
+        """Test the producer waits for space when blocking."""
+        sub = self.make(1, BackpressurePolicy.BLOCK)
+        await sub.offer(state("a"))
+        producer = asyncio.create_task(sub.offer(state("b")))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        assert (await sub.get()).device.device_id == "a"
+        await producer
+        assert (await sub.get()).device.device_id == "b"
+        assert sub.dropped == 0
+
+    async def test_close_releases_blocked_producer(self) -> None:
+        """Test closing stops a producer waiting for space."""
+        sub = self.make(1, BackpressurePolicy.BLOCK)
+        await sub.offer(state("a"))
+        producer = asyncio.create_task(sub.offer(state("b")))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        sub.close()
+        async with asyncio.timeout(1):
+            await producer
+        with pytest.raises(StopAsyncIteration):
+            await sub.get()
+
+    async def test_close_ends_iteration(self) -> None:
+        """Test closing ends iteration even with a full queue."""
+        sub = self.make(1, BackpressurePolicy.DROP_OLDEST)
+        await sub.offer(state("a"))
+        sub.close()
+        sub.close()
+        assert sub.closed
+        await sub.offer(state("b"))
+        assert [s async for s in sub] == []
+        with pytest.raises(StopAsyncIteration):
+            await sub.get()
+
+
+class TestDeviceCoordinator:
+    """Tests for DeviceCoordinator."""
+
+    def test_invalid_interval(self, fake_client: FakeClient) -> None:
+        """Test interval must be positive."""
+        with pytest.raises(ValueError):
+            DeviceCoordinator(cast(LiebherrClient, fake_client), interval=0)
+
+    async def test_refresh_fans_out(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test one poll feeds every subscriber."""
+        everything = coordinator.subscribe()
+        only_dev_2 = coordinator.subscribe("dev-2")
+
+        results = await coordinator.refresh()
+
+        assert [r.device_id for r in results] == ["dev-1", "dev-2"]
+        assert len(fake_client.polls) == 1
+        assert everything._queue.qsize() == 2
+        assert (await only_dev_2.get()).device.device_id == "dev-2"
+        assert set(coordinator.states) == {"dev-1", "dev-2"}
+
+    async def test_known_devices_reused(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test later polls pass known Device objects to skip metadata."""
+        await coordinator.refresh()
+        await coordinator.refresh()
+        assert fake_client.polls[0] == ["dev-1", "dev-2"]
+        assert all(isinstance(t, Device) for t in fake_client.polls[1])
+
+    async def test_errors_tracked(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test failed polls are recorded and not published."""
+        sub = coordinator.subscribe()
+        fake_client.failing.add("dev-1")
+        await coordinator.refresh()
+        assert isinstance(coordinator.errors["dev-1"], LiebherrConnectionError)
+        assert sub._queue.qsize() == 1
+
+        fake_client.failing.clear()
+        await coordinator.refresh()
+        assert coordinator.errors == {}
+
+    async def test_add_and_remove_device(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test the polled device set can change."""
+        coordinator.add_device("dev-3")
+        await coordinator.refresh()
+        coordinator.remove_device("dev-1")
+        assert coordinator.device_ids == ["dev-2", "dev-3"]
+        assert "dev-1" not in coordinator.states
+        assert coordinator.interval == 0.05
+
+    async def test_removed_device_result_ignored(
+        self, coordinator: DeviceCoordinator
+    ) -> None:
+        """Test results for devices removed mid-poll are dropped."""
+        await coordinator._handle_result(DeviceStateResult("gone", state("gone")), 0)
+        await coordinator._handle_result(DeviceStateResult("dev-1"), 0)
+        assert coordinator.states == {}
+        assert coordinator.errors == {}
+
+    async def test_listeners(self, coordinator: DeviceCoordinator) -> None:
+        """Test sync and async listeners receive updates."""
+        received: list[str] = []
+        done = asyncio.Event()
+
+        def on_sync(update: DeviceState) -> None:
+            received.append(f"sync:{update.device.device_id}")
+
+        async def on_async(update: DeviceState) -> None:
+            received.append(f"async:{update.device.device_id}")
+            done.set()
+
+        remove = coordinator.add_listener(on_sync, "dev-1")
+        coordinator.add_listener(on_async, "dev-2")
+        await coordinator.refresh()
+        await done.wait()
+        await asyncio.sleep(0)
+        assert sorted(received) == ["async:dev-2", "sync:dev-1"]
+
+        remove()
+        assert len(coordinator._subscriptions) == 1
+        await coordinator.stop()
+
+    async def test_closing_blocked_subscription_resumes_polling(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test a blocking consumer that goes away no longer holds up polls."""
+        sub = coordinator.subscribe(maxsize=1, policy=BackpressurePolicy.BLOCK)
+        poll = asyncio.create_task(coordinator.refresh())
+        await asyncio.sleep(0)
+        assert not poll.done()
+
+        sub.close()
+        async with asyncio.timeout(1):
+            await poll
+            await coordinator.refresh()
+        assert len(fake_client.polls) == 2
+
+    async def test_listener_errors_logged(
+        self, coordinator: DeviceCoordinator, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a failing listener keeps receiving updates."""
+        calls: list[Any] = []
+        second = asyncio.Event()
+
+        def on_update(update: DeviceState) -> None:
+            calls.append(update)
+            if len(calls) == 2:
+                second.set()
+            raise RuntimeError("boom")
+
+        coordinator.add_listener(on_update, "dev-1")
+        await coordinator.refresh()
+        await asyncio.sleep(0)
+        await coordinator.refresh()
+        await second.wait()
+        assert "Error in device state listener" in caplog.text
+        await coordinator.stop()
+
+    async def test_polling_loop(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test the background loop polls repeatedly until stopped."""
+        async with coordinator:
+            assert coordinator.running
+            await coordinator.start()
+            sub = coordinator.subscribe("dev-1")
+            await sub.get()
+            await sub.get()
+        assert not coordinator.running
+        assert sub.closed
+        assert len(fake_client.polls) >= 2
+
+    async def test_polling_loop_survives_errors(
+        self,
+        coordinator: DeviceCoordinator,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test unexpected errors do not stop the loop."""
+        calls = 0
+        polled_again = asyncio.Event()
+
+        async def poll(device_ids: Iterable[str]) -> list[DeviceStateResult]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            polled_again.set()
+            return []
+
+        coordinator._poll = poll  # type: ignore[method-assign]
+        await coordinator.start()
+        await polled_again.wait()
+        await coordinator.stop()
+        await coordinator.stop()
+        assert "Unexpected error while polling devices" in caplog.text
+
+    async def test_polls_are_staggered(self, fake_client: FakeClient) -> None:
+        """Test each device is polled in its own slot after the first round."""
+        coordinator = DeviceCoordinator(
+            cast(LiebherrClient, fake_client), ["dev-1", "dev-2"], interval=0.2
+        )
+        sub = coordinator.subscribe()
+        async with coordinator:
+            for _ in range(4):
+                await sub.get()
+        assert fake_client.polls[0] == ["dev-1", "dev-2"]
+        assert all(len(poll) == 1 for poll in fake_client.polls[1:])
+
+    async def test_slow_device_does_not_hold_back_others(
+        self, fake_client: FakeClient
+    ) -> None:
+        """Test other devices keep their slots while one poll hangs."""
+        fake_client.slow["dev-3"] = asyncio.Event()
+        coordinator = DeviceCoordinator(
+            cast(LiebherrClient, fake_client),
+            ["dev-1", "dev-2", "dev-3"],
+            interval=0.05,
+        )
+        sub = coordinator.subscribe()
+        seen: dict[str, int] = {}
+        async with coordinator:
+            async with asyncio.timeout(2):
+                while min(seen.get("dev-1", 0), seen.get("dev-2", 0)) < 3:
+                    update = await sub.get()
+                    device_id = update.device.device_id
+                    seen[device_id] = seen.get(device_id, 0) + 1
+            assert "dev-3" not in seen
+            # The hanging device is not polled again while in flight
+            assert sum("dev-3" in poll for poll in fake_client.polls) == 1
+            fake_client.slow["dev-3"].set()
+        assert not coordinator._poll_tasks
+
+    async def test_concurrency_caps_running_polls(
+        self, fake_client: FakeClient
+    ) -> None:
+        """Test due devices wait for a free slot beyond ``concurrency``."""
+        fake_client.slow["dev-1"] = asyncio.Event()
+        coordinator = DeviceCoordinator(
+            cast(LiebherrClient, fake_client),
+            ["dev-1", "dev-2"],
+            interval=0.05,
+            concurrency=1,
+        )
+        sub = coordinator.subscribe()
+        async with coordinator:
+            await asyncio.sleep(0.1)
+            assert fake_client.polls == [["dev-1"]]
+            assert list(coordinator._queued) == ["dev-2"]
+
+            fake_client.slow["dev-1"].set()
+            async with asyncio.timeout(1):
+                while (await sub.get()).device.device_id != "dev-2":
+                    pass
+
+    async def test_device_added_while_running(self, fake_client: FakeClient) -> None:
+        """Test a device added to a running coordinator is polled at once."""
+        coordinator = DeviceCoordinator(cast(LiebherrClient, fake_client), interval=60)
+        async with coordinator:
+            sub = coordinator.subscribe()
+            coordinator.add_device("dev-1")
+            coordinator.add_device("dev-1")
+            assert (await sub.get()).device.device_id == "dev-1"
+            coordinator.remove_device("dev-1")
+        assert fake_client.polls == [["dev-1"]]
+
+
+def door(value: DoorState) -> AutoDoorControl:
+    """Build an auto door control."""
+    return AutoDoorControl(
+        name="autodoor", type="AutoDoorControl", zone_id=0, value=value
+    )
+
+
+class TestAdaptiveCoordinator:
+    """Tests for adaptive polling in DeviceCoordinator."""
+
+    @pytest.fixture
+    def adaptive(self, fake_client: FakeClient) -> DeviceCoordinator:
+        """Return an adaptive coordinator for one device with an auto door."""
+        fake_client.controls["dev-1"] = [
+            TemperatureControl(
+                name="temperature", type="TemperatureControl", zone_id=0
+            ),
+            door(DoorState.MOVING),
+        ]
+        return DeviceCoordinator(
+            cast(LiebherrClient, fake_client),
+            ["dev-1"],
+            interval=30,
+            adaptive=AdaptivePolling(floor=0.01, ceiling=120),
+        )
+
+    async def test_transient_state_uses_floor(
+        self, adaptive: DeviceCoordinator
+    ) -> None:
+        """Test a moving door switches the device to hot polling."""
+        await adaptive.refresh()
+        assert adaptive.interval_for("dev-1") == 0.01
+        assert adaptive._hot["dev-1"] == [door(DoorState.MOVING)]
+
+    async def test_idle_device_backs_off(
+        self, adaptive: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test unchanged states grow the interval up to the ceiling."""
+        fake_client.controls["dev-1"].pop()
+        await adaptive.refresh()
+        assert adaptive.interval_for("dev-1") == 30
+        await adaptive.refresh()
+        assert adaptive.interval_for("dev-1") == 60
+        for _ in range(3):
+            await adaptive.refresh()
+        assert adaptive.interval_for("dev-1") == 120
+
+    async def test_hot_poll_refreshes_only_transient_controls(
+        self, adaptive: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test hot polling fetches the door, then a full poll once it settles."""
+        sub = adaptive.subscribe()
+        async with adaptive:
+            first = await sub.get()
+            assert len(fake_client.polls) == 1
+
+            hot = await sub.get()
+            assert hot is not first
+            assert fake_client.control_requests[0] == ("dev-1", "autodoor", 0)
+            assert len(fake_client.polls) == 1
+
+            fake_client.controls["dev-1"][1] = door(DoorState.CLOSED)
+            while True:
+                update = await sub.get()
+                if update.get_auto_door_controls()[0].value == DoorState.CLOSED:
+                    break
+            assert "dev-1" not in adaptive._hot
+            assert adaptive.interval_for("dev-1") == 30
+            await sub.get()
+            assert len(fake_client.polls) == 2
+            assert adaptive.interval_for("dev-1") == 60
+
+    async def test_hot_poll_errors(
+        self, adaptive: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test hot poll failures are recorded and keep the device hot."""
+        await adaptive.refresh()
+        fake_client.failing.add("dev-1")
+        await adaptive._hot_poll("dev-1")
+        assert isinstance(adaptive.errors["dev-1"], LiebherrConnectionError)
+        assert "dev-1" in adaptive._hot
+
+    async def test_hot_poll_for_removed_device(
+        self, adaptive: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test a device removed during a hot poll is not published."""
+        await adaptive.refresh()
+        sub = adaptive.subscribe()
+        fake_client.gate = asyncio.Event()
+        hot_poll = asyncio.create_task(adaptive._hot_poll("dev-1"))
+        await asyncio.sleep(0)
+        adaptive.remove_device("dev-1")
+        fake_client.gate.set()
+        await hot_poll
+        await adaptive._hot_poll("dev-1")
+        assert adaptive.states == {}
+        assert sub._queue.empty()
+
+
+class TestChangeStream:
+    """Tests for DeviceCoordinator.changes."""
+
+    async def test_changes(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test the stream yields only what changed between polls."""
+        fake_client.controls["dev-1"] = [door(DoorState.CLOSED)]
+        await coordinator.refresh()
+
+        stream = coordinator.changes("dev-1")
+        next_change = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+
+        await coordinator.refresh()
+        fake_client.controls["dev-1"] = [door(DoorState.OPEN)]
+        await coordinator.refresh()
+
+        change = await next_change
+        assert change.kind is ControlChangeKind.CHANGED
+        assert change.changed_fields == {"value": (DoorState.CLOSED, DoorState.OPEN)}
+        await stream.aclose()
+        assert coordinator._subscriptions == []
+
+    async def test_unknown_device_reports_added(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test the first state of a device reports its controls as added."""
+        fake_client.controls["dev-2"] = [door(DoorState.CLOSED)]
+        stream = coordinator.changes()
+        next_change = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        await coordinator.refresh()
+
+        change = await next_change
+        assert change.device_id == "dev-2"
+        assert change.kind is ControlChangeKind.ADDED
+        await coordinator.stop()
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+
+class TestOptimisticUpdates:
+    """Tests for optimistic state updates after writes."""
+
+    @pytest.fixture
+    def optimistic(self, fake_client: FakeClient) -> DeviceCoordinator:
+        """Return an optimistic coordinator for one device."""
+        fake_client.controls["dev-1"] = [
+            TemperatureControl(
+                name="temperature",
+                type="TemperatureControl",
+                zone_id=0,
+                target=4,
+                unit=TemperatureUnit.CELSIUS,
+            ),
+            ToggleControl(name="partymode", type="ToggleControl", value=False),
+        ]
+        return DeviceCoordinator(
+            cast(LiebherrClient, fake_client),
+            ["dev-1"],
+            interval=30,
+            optimistic_updates=True,
+        )
+
+    @staticmethod
+    def target(coordinator: DeviceCoordinator) -> int | None:
+        """Return the temperature target of dev-1."""
+        return coordinator.states["dev-1"].get_temperature_controls()[0].target
+
+    async def test_write_is_published(
+        self, optimistic: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test a write is patched in and published until a poll confirms it."""
+        sub = optimistic.subscribe()
+        async with optimistic:
+            first = await sub.get()
+            fake_client.write(
+                "dev-1", "temperature", {"zoneId": 0, "target": 2, "unit": "°C"}
+            )
+
+            patched = await sub.get()
+            assert patched is optimistic.states["dev-1"]
+            assert patched.get_temperature_controls()[0].target == 2
+            assert patched.optimistic_controls == {("temperature", 0)}
+            assert first.get_temperature_controls()[0].target == 4
+            assert not first.optimistic
+            assert len(fake_client.polls) == 1
+
+            cast(TemperatureControl, fake_client.controls["dev-1"][0]).target = 2
+            await asyncio.sleep(0.001)
+            await optimistic.refresh()
+            assert self.target(optimistic) == 2
+            assert not optimistic.states["dev-1"].optimistic
+            assert optimistic._optimistic == {}
+        assert fake_client.value_listeners == []
+
+    async def test_stale_poll_keeps_written_value(
+        self, optimistic: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test a poll sent before the write does not revert it."""
+        await optimistic.start()
+        await optimistic.subscribe().get()
+        started = asyncio.get_running_loop().time()
+        stale = DeviceState(
+            device=Device("dev-1"), controls=list(fake_client.controls["dev-1"])
+        )
+        await asyncio.sleep(0.001)
+        fake_client.write(
+            "dev-1", "temperature", {"zoneId": 0, "target": 2, "unit": "°C"}
+        )
+
+        await optimistic._handle_result(DeviceStateResult("dev-1", stale), started)
+        assert self.target(optimistic) == 2
+        assert optimistic.states["dev-1"].optimistic
+
+        # A later poll is authoritative, even if the device rejected the value
+        await asyncio.sleep(0.001)
+        await optimistic.refresh()
+        assert self.target(optimistic) == 4
+        assert not optimistic.states["dev-1"].optimistic
+        await optimistic.stop()
+
+    async def test_partial_poll_confirms_only_polled_controls(
+        self, optimistic: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test a poll of some controls leaves the others optimistic."""
+        await optimistic.start()
+        await optimistic.subscribe().get()
+        fake_client.write(
+            "dev-1", "temperature", {"zoneId": 0, "target": 2, "unit": "°C"}
+        )
+        fake_client.write("dev-1", "partymode", {"value": True})
+        state = optimistic.states["dev-1"]
+        assert state.optimistic_controls == {("temperature", 0), ("partymode", None)}
+
+        await asyncio.sleep(0.001)
+        polled = DeviceState(device=state.device, controls=list(state.controls))
+        optimistic._keep_optimistic(
+            "dev-1",
+            polled,
+            asyncio.get_running_loop().time(),
+            {("temperature", 0)},
+        )
+        assert polled.optimistic_controls == {("partymode", None)}
+        await optimistic.stop()
+
+    async def test_ignored_writes(
+        self, optimistic: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test writes to unknown devices or controls publish nothing."""
+        sub = optimistic.subscribe()
+        await optimistic.start()
+        await sub.get()
+        fake_client.write("dev-9", "partymode", {"value": True})
+        fake_client.write("dev-1", "nightmode", {"value": True})
+        await asyncio.sleep(0)
+        assert sub._queue.empty()
+
+        fake_client.write("dev-1", "partymode", {"value": True})
+        optimistic.remove_device("dev-1")
+        assert optimistic._optimistic == {}
+        await optimistic.stop()
+
+    async def test_disabled_by_default(
+        self, coordinator: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test writes are not tracked unless enabled."""
+        async with coordinator:
+            assert fake_client.value_listeners == []
+
+    async def test_stop_cancels_blocked_publish(
+        self, optimistic: DeviceCoordinator, fake_client: FakeClient
+    ) -> None:
+        """Test stopping does not wait for a subscriber that is full."""
+        sub = optimistic.subscribe(maxsize=1, policy=BackpressurePolicy.BLOCK)
+        await optimistic.start()
+        while sub._queue.empty():
+            await asyncio.sleep(0)
+        fake_client.write("dev-1", "partymode", {"value": True})
+        await asyncio.sleep(0)
+        assert optimistic._publish_tasks
+
+        async with asyncio.timeout(1):
+            await optimistic.stop()
@@ -9,6 +9,7 @@ from pyliebherrhomeapi import (
     LiebherrError,
     LiebherrNotFoundError,
     LiebherrPreconditionFailedError,
+    LiebherrRateLimitError,
     LiebherrServerError,
     LiebherrTimeoutError,
     LiebherrUnsupportedError,
@@ -54,6 +55,14 @@ class TestExceptions:
         assert str(error) == "Device not onboarded"
         assert isinstance(error, LiebherrError)
 
+    def test_rate_limit_error(self) -> None:
+        """Test LiebherrRateLimitError."""
+        error = LiebherrRateLimitError("Rate limit exceeded", retry_after=5.0)
+        assert str(error) == "Rate limit exceeded"
+        assert error.retry_after == 5.0
+        assert isinstance(error, LiebherrConnectionError)
+        assert LiebherrRateLimitError("No hint").retry_after is None
+
     def test_server_error(self) -> None:
         """Test LiebherrServerError."""
         error = LiebherrServerError("Internal server error")
@@ -80,6 +89,7 @@ class TestExceptions:
             LiebherrConnectionError,
             LiebherrNotFoundError,
             LiebherrPreconditionFailedError,
+            LiebherrRateLimitError,
             LiebherrServerError,
             LiebherrTimeoutError,
             LiebherrUnsupportedError,
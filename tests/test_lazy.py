@@ -0,0 +1,190 @@
+"""Tests for lazy model views."""
+
+from dataclasses import fields
+from typing import Any
+
+import pytest
+
+from pyliebherrhomeapi import (
+    AutoDoorControl,
+    BioFreshPlusControl,
+    BioFreshPlusMode,
+    Device,
+    DeviceType,
+    DoorState,
+    HydroBreezeControl,
+    IceMakerControl,
+    LazyAutoDoorControl,
+    LazyBioFreshPlusControl,
+    LazyDevice,
+    LazyHydroBreezeControl,
+    LazyIceMakerControl,
+    LazyModel,
+    LazyTemperatureControl,
+    LazyToggleControl,
+    TemperatureControl,
+    TemperatureUnit,
+    ToggleControl,
+    lazy_controls,
+    models,
+    register_control_type,
+)
+from pyliebherrhomeapi.models import parse_control
+
+CONTROLS: list[dict[str, Any]] = [
+    {
+        "name": "temperature",
+        "type": "TemperatureControl",
+        "zoneId": 0,
+        "zonePosition": "top",
+        "value": 5,
+        "target": 5,
+        "min": 2,
+        "max": 9,
+        "unit": "°C",
+    },
+    {"name": "partymode", "type": "ToggleControl", "value": True},
+    {
+        "name": "autodoor",
+        "type": "AutoDoorControl",
+        "zoneId": 0,
+        "value": "MOVING",
+    },
+    {
+        "name": "icemaker",
+        "type": "IceMakerControl",
+        "zoneId": 1,
+        "iceMakerMode": "TURBO",
+        "hasMaxIce": False,
+    },
+    {
+        "name": "hydrobreeze",
+        "type": "HydroBreezeControl",
+        "zoneId": 0,
+        "currentMode": "LOW",
+    },
+    {
+        "name": "biofreshplus",
+        "type": "BioFreshPlusControl",
+        "zoneId": 0,
+        "currentMode": "ZERO_ZERO",
+        "supportedModes": ["ZERO_ZERO", None],
+        "temperatureUnit": "°F",
+    },
+]
+
+
+class TestLazyViews:
+    """Tests for lazy views over raw payloads."""
+
+    @pytest.mark.parametrize(
+        ("view", "model"),
+        [
+            (LazyDevice, Device),
+            (LazyTemperatureControl, TemperatureControl),
+            (LazyToggleControl, ToggleControl),
+            (LazyAutoDoorControl, AutoDoorControl),
+            (LazyIceMakerControl, IceMakerControl),
+            (LazyHydroBreezeControl, HydroBreezeControl),
+            (LazyBioFreshPlusControl, BioFreshPlusControl),
+        ],
+    )
+    def test_views_mirror_model_attributes(
+        self, view: type[LazyModel[Any]], model: type[Any]
+    ) -> None:
+        """Test every model field has a lazy counterpart."""
+        for f in fields(model):
+            assert hasattr(view, f.name)
+        assert view._model is model
+
+    def test_views_decode_like_the_models(self) -> None:
+        """Test lazy views compare equal to the eagerly parsed controls."""
+        views = lazy_controls([*CONTROLS, "not a control"])
+        assert views == [parse_control(data) for data in CONTROLS]
+        assert [v.materialize() for v in views] == views  # type: ignore[union-attr]
+
+    def test_fields_are_decoded_on_access_and_cached(self) -> None:
+        """Test only accessed fields are decoded, each once."""
+        view = LazyTemperatureControl(dict(CONTROLS[0]))
+        assert view._values is None
+
+        assert view.unit is TemperatureUnit.CELSIUS
+        assert view._values == {"unit": TemperatureUnit.CELSIUS}
+
+        view.raw["unit"] = "°F"
+        assert view.unit is TemperatureUnit.CELSIUS
+        assert view.validate_temperature(1) is False
+        assert view.validate_temperature(10) is False
+        assert view.validate_temperature(5) is True
+
+    def test_enum_fields(self) -> None:
+        """Test enum coercion keeps unknown values as strings."""
+        door, ice = lazy_controls(CONTROLS[2:4])
+        assert isinstance(door, LazyAutoDoorControl)
+        assert door.value is DoorState.MOVING
+        assert isinstance(ice, LazyIceMakerControl)
+        assert ice.ice_maker_mode == "TURBO"
+
+        biofresh = LazyBioFreshPlusControl(CONTROLS[5])
+        assert biofresh.supported_modes == [BioFreshPlusMode.ZERO_ZERO]
+        assert LazyBioFreshPlusControl({}).supported_modes == []
+
+    def test_assignment_overrides_cached_value(self) -> None:
+        """Test assigning an attribute leaves the payload untouched."""
+        raw = dict(CONTROLS[1])
+        view = LazyToggleControl(raw)
+        view.value = False
+        assert view.value is False
+        assert raw["value"] is True
+
+        other = LazyToggleControl(raw)
+        other.value = view.value
+        other.value = None
+        assert other.value is None
+
+    def test_missing_required_key_raises_on_access(self) -> None:
+        """Test required keys are only checked when read."""
+        view = LazyHydroBreezeControl({"name": "hydrobreeze"})
+        assert view.name == "hydrobreeze"
+        with pytest.raises(KeyError):
+            _ = view.zone_id
+
+    def test_device_view(self) -> None:
+        """Test device helpers work on the lazy view."""
+        device = LazyDevice({"deviceId": "1", "deviceType": "WINE"})
+        assert device.is_wine()
+        assert not device.is_fridge()
+        assert not device.is_freezer()
+        assert not device.is_combi()
+        assert device.device_type is DeviceType.WINE
+        assert device == LazyDevice({"deviceId": "1", "deviceType": "WINE"})
+        assert device != LazyDevice({"deviceId": "2"})
+        assert device != "1"
+        assert repr(device) == "LazyDevice({'deviceId': '1', 'deviceType': 'WINE'})"
+
+    def test_unknown_and_registered_types(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test unknown types fall back to toggles and registered ones parse."""
+        monkeypatch.setattr(models, "_CONTROL_PARSERS", dict(models._CONTROL_PARSERS))
+        monkeypatch.setattr(
+            "pyliebherrhomeapi.lazy._EAGER_PARSERS", models._CONTROL_PARSERS
+        )
+        register_control_type("DoorAlarmControl", ToggleControl.from_dict)
+
+        alarm, future = lazy_controls(
+            [
+                {"name": "dooralarm", "type": "DoorAlarmControl"},
+                {"name": "future", "type": "FutureControl", "value": True},
+            ]
+        )
+        assert type(alarm) is ToggleControl
+        assert isinstance(future, LazyToggleControl)
+        assert future.value is True
+
+    def test_unhashable_type(self) -> None:
+        """Test an unhashable type value falls back to a toggle view."""
+        (control,) = lazy_controls([{"name": "odd", "type": ["odd"], "value": True}])
+        assert isinstance(control, LazyToggleControl)
+        assert control.value is True
+        assert control == parse_control(control.raw)
@@ -0,0 +1,31 @@
+"""Tests for client metrics."""
+
+from pyliebherrhomeapi import (
+    ClientMetrics,
+    LiebherrServerError,
+    LiebherrTimeoutError,
+)
+
+
+class TestClientMetrics:
+    """Tests for ClientMetrics."""
+
+    def test_record_retry(self) -> None:
+        """Test retries are counted per error type."""
+        metrics = ClientMetrics()
+        metrics.record_retry(LiebherrServerError("boom"))
+        metrics.record_retry(LiebherrServerError("boom"))
+        metrics.record_retry(LiebherrTimeoutError("slow"))
+
+        assert metrics.retries == 3
+        assert metrics.retries_by_error == {
+            "LiebherrServerError": 2,
+            "LiebherrTimeoutError": 1,
+        }
+
+    def test_reset(self) -> None:
+        """Test reset clears all counters."""
+        metrics = ClientMetrics(requests=5, retries_exhausted=1)
+        metrics.record_retry(LiebherrServerError("boom"))
+        metrics.reset()
+        assert metrics == ClientMetrics()
@@ -1,5 +1,9 @@
 """Tests for Liebherr models."""
 
+import json
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, fields, replace
 from typing import Any
 
 import pytest
@@ -8,6 +12,8 @@ from pyliebherrhomeapi import (
     AutoDoorControl,
     BioFreshPlusControl,
     BioFreshPlusMode,
+    ControlChange,
+    ControlChangeKind,
     Device,
     DeviceControl,
     DeviceState,
@@ -21,8 +27,12 @@ from pyliebherrhomeapi import (
     TemperatureUnit,
     ToggleControl,
     ZonePosition,
+    diff_states,
+    models,
+    parse_controls,
+    register_control_type,
 )
-from pyliebherrhomeapi.models import parse_control
+from pyliebherrhomeapi.models import _coerce_enum, parse_control
 
 
 class TestDevice:
@@ -368,6 +378,61 @@ class TestParseControl:
         control = parse_control(data)
         assert isinstance(control, expected_class)
 
+    def test_parse_control_unhashable_type(self) -> None:
+        """Test an unhashable type value falls back to ToggleControl."""
+        control = parse_control({"name": "test", "type": ["odd"]})
+        assert isinstance(control, ToggleControl)
+
+    def test_parse_controls(self) -> None:
+        """Test batch parsing dispatches per type and skips non-dicts."""
+        controls = parse_controls(
+            [
+                {"name": "temperature", "type": "TemperatureControl", "zoneId": 0},
+                "junk",
+                {"name": "partymode", "type": "ToggleControl"},
+                {"name": "new", "type": "FutureControl"},
+                {"name": "odd", "type": {"nested": True}},
+            ]
+        )
+        assert [type(c) for c in controls] == [
+            TemperatureControl,
+            ToggleControl,
+            ToggleControl,
+            ToggleControl,
+        ]
+
+    def test_register_control_type(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test new control types can be registered."""
+        monkeypatch.setattr(models, "_CONTROL_PARSERS", dict(models._CONTROL_PARSERS))
+        register_control_type("FutureControl", AutoDoorControl.from_dict)
+        data = {"name": "future", "type": "FutureControl", "zoneId": 2}
+        assert isinstance(parse_control(data), AutoDoorControl)
+        assert isinstance(parse_controls([data])[0], AutoDoorControl)
+
+
+class TestCoerceEnum:
+    """Tests for memoized enum coercion."""
+
+    def test_known_and_unknown_values(self) -> None:
+        """Test known values map to members and unknown ones pass through."""
+        assert _coerce_enum(DoorState, "OPEN") is DoorState.OPEN
+        assert _coerce_enum(DoorState, "FLYING") == "FLYING"
+        assert _coerce_enum(DoorState, None) is None
+
+    def test_unknown_values_are_memoized(self) -> None:
+        """Test repeated unknown values do not retry the enum lookup."""
+        models._lookup_enum.cache_clear()
+        for _ in range(3):
+            _coerce_enum(ZonePosition, "sideways")
+        info = models._lookup_enum.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_unhashable_value(self) -> None:
+        """Test unhashable raw values are returned unchanged."""
+        value: Any = ["top"]
+        assert _coerce_enum(ZonePosition, value) is value
+
 
 class TestDeviceState:
     """Tests for DeviceState model."""
@@ -482,3 +547,532 @@ class TestDeviceState:
         assert len(state.get_ice_maker_controls()) == 0
         assert len(state.get_hydro_breeze_controls()) == 0
         assert len(state.get_biofresh_plus_controls()) == 0
+
+    def test_update_control(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test update_control replaces by name and zone, or appends."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        fresh = ToggleControl(
+            name="toggle2", type="ToggleControl", zone_id=1, value=True
+        )
+        state.update_control(fresh)
+        assert state.controls[3] is fresh
+        assert len(state.controls) == 8
+
+        other_zone = ToggleControl(name="toggle2", type="ToggleControl", zone_id=2)
+        state.update_control(other_zone)
+        assert state.controls[-1] is other_zone
+        assert len(state.controls) == 9
+
+    @pytest.mark.parametrize(
+        ("name", "zone_id", "values", "field", "expected"),
+        [
+            (
+                "temp2",
+                1,
+                {"zoneId": 1, "target": 40, "unit": "°F"},
+                "unit",
+                TemperatureUnit.FAHRENHEIT,
+            ),
+            ("toggle1", 0, {"zoneId": 0, "value": True}, "value", True),
+            (
+                "ice1",
+                0,
+                {"zoneId": 0, "iceMakerMode": "MAX_ICE"},
+                "ice_maker_mode",
+                IceMakerMode.MAX_ICE,
+            ),
+            (
+                "hydro1",
+                1,
+                {"zoneId": 1, "hydroBreezeMode": "HIGH"},
+                "current_mode",
+                HydroBreezeMode.HIGH,
+            ),
+            (
+                "bio1",
+                1,
+                {"zoneId": 1, "bioFreshPlusMode": "ZERO_ZERO"},
+                "current_mode",
+                BioFreshPlusMode.ZERO_ZERO,
+            ),
+        ],
+    )
+    def test_apply_write(
+        self,
+        sample_device: Device,
+        sample_controls: list[DeviceControl],
+        name: str,
+        zone_id: int,
+        values: dict[str, Any],
+        field: str,
+        expected: Any,
+    ) -> None:
+        """Test a write body is patched into a copy of the control."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        original = next(
+            c for c in sample_controls if c.name == name and c.zone_id == zone_id
+        )
+
+        updated = state.apply_write(name, values)
+
+        assert updated is not None
+        assert updated is not original
+        assert getattr(updated, field) == expected
+        assert getattr(original, field) != expected
+        assert updated in state.controls
+        assert original not in state.controls
+
+    @pytest.mark.parametrize(
+        ("name", "values"),
+        [
+            ("missing", {"value": True}),
+            ("toggle1", {"zoneId": 5, "value": True}),
+            ("door1", {"zoneId": 0, "value": True}),
+            ("toggle1", {"zoneId": 0, "target": 2}),
+        ],
+    )
+    def test_apply_write_ignored(
+        self,
+        sample_device: Device,
+        sample_controls: list[DeviceControl],
+        name: str,
+        values: dict[str, Any],
+    ) -> None:
+        """Test writes without a matching control or field change nothing."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        assert state.apply_write(name, values) is None
+        assert state.controls == sample_controls
+
+    def test_optimistic(self, sample_device: Device) -> None:
+        """Test optimistic controls are flagged but ignored by equality."""
+        state = DeviceState(device=sample_device)
+        marked = DeviceState(
+            device=sample_device, optimistic_controls=frozenset({("partymode", None)})
+        )
+        assert not state.optimistic
+        assert marked.optimistic
+        assert marked == state
+
+    def test_apply_controls_payload_unchanged(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test an identical payload touches nothing."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        original = state.controls
+        payload = [
+            TemperatureControl(name="temp1", type="TemperatureControl", zone_id=0),
+            *sample_controls[1:],
+        ]
+        assert state.apply_controls_payload(payload) == []
+        assert state.controls is original
+        assert state.controls[0] is sample_controls[0]
+
+    def test_apply_controls_payload_replaces_changed(
+        self, sample_device: Device
+    ) -> None:
+        """Test changed controls are replaced without modifying the old ones."""
+        old = TemperatureControl(
+            name="temperature", type="TemperatureControl", zone_id=0, value=5
+        )
+        kept = ToggleControl(name="partymode", type="ToggleControl", value=False)
+        state = DeviceState(device=sample_device, controls=[old, kept])
+        original = state.controls
+        fresh = TemperatureControl(
+            name="temperature", type="TemperatureControl", zone_id=0, value=3
+        )
+
+        changes = state.apply_controls_payload(
+            [fresh, ToggleControl(name="partymode", type="ToggleControl", value=False)]
+        )
+
+        assert old.value == 5
+        assert state.controls is original
+        assert state.controls[0] is fresh
+        assert state.controls[1] is kept
+        assert state.get_temperature_controls()[0] is fresh
+        assert changes == [
+            ControlChange(
+                "12345",
+                "temperature",
+                0,
+                ControlChangeKind.CHANGED,
+                old=old,
+                new=fresh,
+                changed_fields={"value": (5, 3)},
+            )
+        ]
+
+    def test_apply_controls_payload_structure_changes(
+        self, sample_device: Device
+    ) -> None:
+        """Test added, removed, retyped and reordered controls."""
+        temperature = TemperatureControl(
+            name="temperature", type="TemperatureControl", zone_id=0
+        )
+        party = ToggleControl(name="partymode", type="ToggleControl")
+        door = ToggleControl(name="autodoor", type="ToggleControl", zone_id=0)
+        state = DeviceState(device=sample_device, controls=[temperature, party, door])
+        original = state.controls
+        state.get_control_by_name("autodoor")
+
+        night = ToggleControl(name="nightmode", type="ToggleControl")
+        moving = AutoDoorControl(
+            name="autodoor", type="AutoDoorControl", zone_id=0, value=DoorState.OPEN
+        )
+        changes = state.apply_controls_payload([moving, night, temperature])
+
+        assert state.controls is original
+        assert state.controls == [moving, night, temperature]
+        assert state.get_control_by_name("autodoor") is moving
+        assert state.get_control_by_name("partymode") is None
+        assert [(c.name, c.kind) for c in changes] == [
+            ("autodoor", ControlChangeKind.CHANGED),
+            ("nightmode", ControlChangeKind.ADDED),
+            ("partymode", ControlChangeKind.REMOVED),
+        ]
+        assert changes[0].old is door
+        assert changes[0].changed_fields["value"] == (None, DoorState.OPEN)
+
+        assert state.apply_controls_payload([temperature, moving, night]) == []
+        assert state.controls == [temperature, moving, night]
+
+    def test_indexes_are_built_once(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test lookups reuse the index until the controls change."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        assert state._index is None
+
+        assert state.get_control_by_name("temp1") is sample_controls[0]
+        index = state._index
+        assert index is not None
+        state.get_toggle_controls()
+        state.get_controls_by_zone(0)
+        assert state._index is index
+
+    def test_lookups_return_copies(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test changing a returned collection leaves the index intact."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        state.get_temperature_controls().clear()
+        state.get_controls_by_zone(0).clear()
+        assert len(state.get_temperature_controls()) == 2
+        assert len(state.get_controls_by_zone(0)) == 4
+
+    def test_indexes_follow_controls_changes(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test reassigning, appending and updating controls refresh lookups."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        assert state.get_control_by_name("party") is None
+
+        party = ToggleControl(name="party", type="ToggleControl")
+        state.controls.append(party)
+        assert state.get_control_by_name("party") is party
+
+        fresh = TemperatureControl(
+            name="temp1", type="TemperatureControl", zone_id=0, value=3
+        )
+        state.update_control(fresh)
+        assert state.get_temperature_controls()[0] is fresh
+
+        state.controls = [party]
+        assert state.get_temperature_controls() == {}
+        assert state.get_controls_by_zone(None) == [party]  # type: ignore[arg-type]
+
+    def test_indexes_follow_same_length_changes(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test changes keeping the list length still refresh lookups."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        removed = state.get_control_by_name("temp1")
+        assert removed is not None
+
+        party = ToggleControl(name="party", type="ToggleControl")
+        state.controls.append(party)
+        state.controls.remove(removed)
+        assert state.get_control_by_name("temp1") is None
+        assert state.get_control_by_name("party") is party
+        assert 0 not in state.get_temperature_controls()
+
+        state.controls[0] = removed
+        assert state.get_control_by_name("temp1") is removed
+
+    def test_indexes_follow_sort(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test reordering the controls refreshes zone lookups."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        before = state.get_controls_by_zone(0)
+
+        state.controls.sort(key=lambda control: control.name, reverse=True)
+        after = state.get_controls_by_zone(0)
+        assert after == sorted(before, key=lambda control: control.name, reverse=True)
+        assert after != before
+
+    def test_every_list_change_refreshes_indexes(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test each mutating list method drops the current index."""
+        party = ToggleControl(name="party", type="ToggleControl")
+        changes: list[Callable[[list[DeviceControl]], object]] = [
+            lambda controls: controls.extend([party]),
+            lambda controls: controls.insert(0, party),
+            lambda controls: controls.pop(),
+            lambda controls: controls.clear(),
+            lambda controls: controls.reverse(),
+            lambda controls: controls.__delitem__(slice(0, 1)),
+            lambda controls: controls.__iadd__([party]),
+            lambda controls: controls.__imul__(1),
+        ]
+        for change in changes:
+            state = DeviceState(device=sample_device, controls=list(sample_controls))
+            index = state._indexes()
+            change(state.controls)
+            assert state._indexes() is not index
+
+    def test_controls_assignment_copies_list(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test the state keeps its own copy of an assigned controls list."""
+        controls = list(sample_controls)
+        state = DeviceState(device=sample_device, controls=controls)
+        assert state.controls == controls
+        assert state.controls is not controls
+
+        tracked = state.controls
+        state.controls = tracked
+        assert state.controls is tracked
+
+    def test_index_is_not_a_field(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test dataclass helpers only see the public fields."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        state.get_temperature_controls()
+
+        assert [f.name for f in fields(state)] == [
+            "device",
+            "controls",
+            "optimistic_controls",
+        ]
+        assert set(asdict(state)) == {"device", "controls", "optimistic_controls"}
+        copied = replace(state)
+        assert copied.controls == state.controls
+        assert copied._index is None
+
+    def test_invalidate_indexes(
+        self, sample_device: Device, sample_controls: list[DeviceControl]
+    ) -> None:
+        """Test renaming a control in place needs an explicit invalidation."""
+        state = DeviceState(device=sample_device, controls=list(sample_controls))
+        control = state.get_control_by_name("temp1")
+        assert control is not None
+        control.name = "temp9"
+        assert state.get_control_by_name("temp9") is None
+
+        state.invalidate_indexes()
+        assert state.get_control_by_name("temp9") is control
+
+    def test_indexes_keep_isinstance_semantics(self, sample_device: Device) -> None:
+        """Test subclasses are indexed like their base and other types skipped."""
+
+        class BoostControl(ToggleControl):
+            pass
+
+        class OtherControl:
+            name = "other"
+            zone_id = 0
+
+        boost = BoostControl(name="boost", type="BoostControl", zone_id=0)
+        other: Any = OtherControl()
+        state = DeviceState(device=sample_device, controls=[boost, other])
+        assert state.get_toggle_controls() == {0: boost}
+        assert state.get_controls_by_zone(0) == [boost]
+        assert state.get_control_by_name("other") is other
+
+    def test_first_control_wins_by_name(self, sample_device: Device) -> None:
+        """Test name lookups return the first control, zone lookups the last."""
+        top = TemperatureControl(name="temp", type="TemperatureControl", zone_id=0)
+        bottom = TemperatureControl(name="temp", type="TemperatureControl", zone_id=0)
+        state = DeviceState(device=sample_device, controls=[top, bottom])
+        assert state.get_control_by_name("temp") is top
+        assert state.get_temperature_controls()[0] is bottom
+        assert state.get_controls_by_zone(0) == [top, bottom]
+        assert state == DeviceState(device=sample_device, controls=[top, bottom])
+
+
+class TestDiffStates:
+    """Tests for diff_states."""
+
+    @pytest.fixture
+    def old(self) -> DeviceState:
+        """Return the previous snapshot."""
+        return DeviceState(
+            device=Device(device_id="12345"),
+            controls=[
+                TemperatureControl(
+                    name="temperature", type="TemperatureControl", zone_id=0, value=5
+                ),
+                TemperatureControl(
+                    name="temperature", type="TemperatureControl", zone_id=1, value=-18
+                ),
+                ToggleControl(
+                    name="superfrost", type="ToggleControl", zone_id=1, value=False
+                ),
+                AutoDoorControl(
+                    name="autodoor",
+                    type="AutoDoorControl",
+                    zone_id=0,
+                    value=DoorState.CLOSED,
+                ),
+            ],
+        )
+
+    def test_no_changes(self, old: DeviceState) -> None:
+        """Test identical snapshots produce no changes."""
+        new = DeviceState(device=old.device, controls=list(old.controls))
+        assert diff_states(old, new) == []
+
+    def test_initial_snapshot(self, old: DeviceState) -> None:
+        """Test every control is added without a previous snapshot."""
+        changes = diff_states(None, old)
+        assert [c.kind for c in changes] == [ControlChangeKind.ADDED] * 4
+        assert changes[0].control is old.controls[0]
+
+    def test_changes(self, old: DeviceState) -> None:
+        """Test changed, added and removed controls are reported."""
+        new = DeviceState(
+            device=old.device,
+            controls=[
+                old.controls[0],
+                TemperatureControl(
+                    name="temperature", type="TemperatureControl", zone_id=1, value=-17
+                ),
+                ToggleControl(
+                    name="superfrost", type="ToggleControl", zone_id=1, value=True
+                ),
+                ToggleControl(name="partymode", type="ToggleControl", value=False),
+            ],
+        )
+
+        changes = diff_states(old, new)
+
+        assert [(c.name, c.zone_id, c.kind) for c in changes] == [
+            ("temperature", 1, ControlChangeKind.CHANGED),
+            ("superfrost", 1, ControlChangeKind.CHANGED),
+            ("partymode", None, ControlChangeKind.ADDED),
+            ("autodoor", 0, ControlChangeKind.REMOVED),
+        ]
+        assert changes[0].changed_fields == {"value": (-18, -17)}
+        assert changes[1].changed_fields == {"value": (False, True)}
+        assert changes[3].control is old.controls[3]
+        assert all(c.device_id == "12345" for c in changes)
+
+    def test_type_change(self, old: DeviceState) -> None:
+        """Test a control that changes type reports all its fields."""
+        door = old.controls[3]
+        new = DeviceState(
+            device=old.device,
+            controls=[ToggleControl(name="autodoor", type="ToggleControl", zone_id=0)],
+        )
+        change = diff_states(DeviceState(device=old.device, controls=[door]), new)[0]
+        assert change.kind is ControlChangeKind.CHANGED
+        assert change.changed_fields["type"] == ("AutoDoorControl", "ToggleControl")
+        assert change.changed_fields["value"] == (DoorState.CLOSED, None)
+
+    def test_control_requires_old_or_new(self) -> None:
+        """Test an empty ControlChange has no control."""
+        change = ControlChange("12345", "x", None, ControlChangeKind.CHANGED)
+        with pytest.raises(ValueError):
+            _ = change.control
+
+
+class TestCompactModels:
+    """Tests for the memory footprint of model instances."""
+
+    @staticmethod
+    def _controls_body(device_index: int) -> bytes:
+        """Return a freshly encoded controls body for one device."""
+        return json.dumps(
+            [
+                {
+                    "name": "temperature",
+                    "type": "TemperatureControl",
+                    "zoneId": zone,
+                    "zonePosition": "top",
+                    "value": device_index % 8,
+                    "unit": "°C",
+                }
+                for zone in range(2)
+            ]
+            + [
+                {"name": "superfrost", "type": "ToggleControl", "value": False},
+                {"name": "partymode", "type": "ToggleControl", "value": False},
+            ]
+        ).encode()
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Device(device_id="1"),
+            TemperatureControl(
+                name="temperature", type="TemperatureControl", zone_id=0
+            ),
+            ToggleControl(name="partymode", type="ToggleControl"),
+            AutoDoorControl(name="autodoor", type="AutoDoorControl", zone_id=0),
+            IceMakerControl(name="icemaker", type="IceMakerControl", zone_id=0),
+            HydroBreezeControl(
+                name="hydrobreeze", type="HydroBreezeControl", zone_id=0
+            ),
+            BioFreshPlusControl(
+                name="biofreshplus", type="BioFreshPlusControl", zone_id=0
+            ),
+            DeviceState(device=Device(device_id="1")),
+        ],
+    )
+    def test_instances_have_no_dict(self, instance: object) -> None:
+        """Test model instances are slotted."""
+        assert not hasattr(instance, "__dict__")
+
+    def test_repeated_strings_are_shared(self) -> None:
+        """Test names and types decoded for different devices are interned."""
+        first, second = (
+            parse_controls(json.loads(self._controls_body(i))) for i in range(2)
+        )
+        for left, right in zip(first, second, strict=True):
+            assert left.name is right.name
+            assert left.type is right.type
+
+        devices = [Device.from_dict(json.loads('{"deviceId": "42"}')) for _ in "ab"]
+        assert devices[0].device_id is devices[1].device_id
+
+    def test_non_string_values_are_kept(self) -> None:
+        """Test unexpected non-string values pass through unchanged."""
+        assert models._intern(7) == 7
+        assert models._intern(None) is None
+
+    def test_fleet_memory_budget(self) -> None:
+        """Test a parsed fleet stays within its per-state memory budget."""
+        bodies = [
+            (f'{{"deviceId": "{i:012d}"}}'.encode(), self._controls_body(i))
+            for i in range(1000)
+        ]
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            fleet = [
+                DeviceState(
+                    device=Device.from_dict(json.loads(device)),
+                    controls=parse_controls(json.loads(controls)),
+                )
+                for device, controls in bodies
+            ]
+            per_state = (tracemalloc.get_traced_memory()[0] - before) / len(fleet)
+        finally:
+            tracemalloc.stop()
+        # About 1,400 bytes before models were slotted and interned, 630 after
+        assert per_state < 900
@@ -0,0 +1,192 @@
+"""Tests for the refresh planner."""
+
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pyliebherrhomeapi import (
+    AutoDoorControl,
+    Device,
+    DeviceState,
+    DoorState,
+    LiebherrClient,
+    RefreshPlan,
+    RefreshPlanner,
+    TemperatureControl,
+    ToggleControl,
+)
+
+DEVICE_ID = "12345"
+
+
+def temperature(zone_id: int, value: int) -> TemperatureControl:
+    """Build a temperature control."""
+    return TemperatureControl(
+        name="temperature", type="TemperatureControl", zone_id=zone_id, value=value
+    )
+
+
+def toggle(name: str, value: bool, zone_id: int | None = 0) -> ToggleControl:
+    """Build a toggle control."""
+    return ToggleControl(name=name, type="ToggleControl", zone_id=zone_id, value=value)
+
+
+@pytest.fixture
+def state() -> DeviceState:
+    """Return a known device state."""
+    return DeviceState(
+        device=Device(device_id=DEVICE_ID),
+        controls=[
+            temperature(0, 5),
+            temperature(1, -18),
+            toggle("superfrost", False),
+            toggle("partymode", False, None),
+        ],
+    )
+
+
+@pytest.fixture
+def planner() -> RefreshPlanner:
+    """Return a planner whose device had a full refresh at t=0."""
+    planner = RefreshPlanner(full_refresh_interval=300, write_window=60)
+    planner._full_refreshed[DEVICE_ID] = 0
+    return planner
+
+
+class TestRefreshPlanner:
+    """Tests for RefreshPlanner."""
+
+    def test_invalid_max_targeted(self) -> None:
+        """Test max_targeted must not be negative."""
+        with pytest.raises(ValueError):
+            RefreshPlanner(max_targeted=-1)
+
+    def test_full_refresh_when_unknown(self, state: DeviceState) -> None:
+        """Test unknown devices get a full refresh."""
+        planner = RefreshPlanner()
+        assert planner.plan(DEVICE_ID, None, now=0).full
+        assert planner.plan(DEVICE_ID, state, now=0).full
+
+    def test_full_refresh_when_stale(
+        self, planner: RefreshPlanner, state: DeviceState
+    ) -> None:
+        """Test full refreshes happen at least every full_refresh_interval."""
+        assert not planner.plan(DEVICE_ID, state, now=299).full
+        assert planner.plan(DEVICE_ID, state, now=300).full
+
+    def test_volatile_controls(
+        self, planner: RefreshPlanner, state: DeviceState
+    ) -> None:
+        """Test volatile controls are fetched for all zones at once."""
+        assert planner.plan(DEVICE_ID, state, now=10) == RefreshPlan(
+            DEVICE_ID, full=False, targets=[("temperature", None)]
+        )
+
+    def test_recent_writes(self, planner: RefreshPlanner, state: DeviceState) -> None:
+        """Test written controls are refreshed until the window passes."""
+        planner.record_write(DEVICE_ID, "superfrost", 0, at=5)
+        planner.record_write(DEVICE_ID, "temperature", 1, at=5)
+        assert planner.plan(DEVICE_ID, state, now=10).targets == [
+            ("temperature", None),
+            ("superfrost", 0),
+        ]
+        assert planner.plan(DEVICE_ID, state, now=70).targets == [("temperature", None)]
+        assert planner._writes[DEVICE_ID] == {}
+
+    def test_too_many_targets(self, state: DeviceState) -> None:
+        """Test many targeted controls fall back to the full list."""
+        planner = RefreshPlanner(max_targeted=1)
+        planner._full_refreshed[DEVICE_ID] = 0
+        planner.record_write(DEVICE_ID, "partymode", at=5)
+        assert planner.plan(DEVICE_ID, state, now=10).full
+
+    def test_forget(self, planner: RefreshPlanner, state: DeviceState) -> None:
+        """Test forgetting a device resets its plan."""
+        planner.record_write(DEVICE_ID, "partymode")
+        planner.forget(DEVICE_ID)
+        assert planner.plan(DEVICE_ID, state).full
+        assert DEVICE_ID not in planner._writes
+
+    def test_attach(self) -> None:
+        """Test attaching registers a write listener."""
+        client = MagicMock(spec=LiebherrClient)
+        planner = RefreshPlanner()
+        planner.attach(client)
+        client.add_write_listener.assert_called_once_with(planner.record_write)
+
+
+class TestRefreshExecution:
+    """Tests for RefreshPlanner.refresh."""
+
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        """Return a mocked client."""
+        client = MagicMock(spec=LiebherrClient)
+        client.get_device_state = AsyncMock()
+        client.get_controls = AsyncMock()
+        client.get_control = AsyncMock()
+        return client
+
+    async def test_unknown_device(self, client: MagicMock, state: DeviceState) -> None:
+        """Test an unknown device fetches its full state."""
+        client.get_device_state.return_value = state
+        planner = RefreshPlanner()
+        result = await planner.refresh(cast(LiebherrClient, client), DEVICE_ID, None)
+        assert result is state
+        assert planner.full_refreshes == 1
+        assert DEVICE_ID in planner._full_refreshed
+
+    async def test_full_refresh_patches_state(
+        self, client: MagicMock, state: DeviceState
+    ) -> None:
+        """Test a full refresh merges the controls into the known state."""
+        fresh = [temperature(0, 4)]
+        client.get_controls.return_value = fresh
+        old = state.get_temperature_controls()[0]
+        old_value = old.value
+        planner = RefreshPlanner()
+        result = await planner.refresh(cast(LiebherrClient, client), DEVICE_ID, state)
+        assert result is state
+        assert state.controls == [temperature(0, 4)]
+        assert state.controls[0] is fresh[0]
+        assert old.value == old_value
+        client.get_device_state.assert_not_called()
+
+    async def test_targeted_refresh_patches_state(
+        self, client: MagicMock, state: DeviceState
+    ) -> None:
+        """Test a targeted refresh only fetches and patches planned controls."""
+        client.get_control.side_effect = [
+            [temperature(0, 6), temperature(1, -17)],
+            [toggle("superfrost", True)],
+        ]
+        planner = RefreshPlanner()
+        planner.record_write(DEVICE_ID, "superfrost", 0)
+        planner._full_refreshed[DEVICE_ID] = planner._writes[DEVICE_ID][
+            ("superfrost", 0)
+        ]
+        original = state.controls
+
+        result = await planner.refresh(cast(LiebherrClient, client), DEVICE_ID, state)
+
+        assert result is state
+        assert state.controls is original
+        assert state.get_temperature_controls()[1].value == -17
+        assert state.get_toggle_controls()[0].value is True
+        assert planner.targeted_refreshes == 1
+        client.get_controls.assert_not_called()
+        assert [c.args for c in client.get_control.await_args_list] == [
+            (DEVICE_ID, "temperature", None),
+            (DEVICE_ID, "superfrost", 0),
+        ]
+
+    async def test_auto_door_is_volatile(self, client: MagicMock) -> None:
+        """Test auto door controls are refreshed by default."""
+        door = AutoDoorControl(
+            name="autodoor", type="AutoDoorControl", zone_id=0, value=DoorState.OPEN
+        )
+        state = DeviceState(device=Device(device_id=DEVICE_ID), controls=[door])
+        planner = RefreshPlanner()
+        planner._full_refreshed[DEVICE_ID] = 0
+        assert planner.plan(DEVICE_ID, state, now=1).targets == [("autodoor", None)]
@@ -0,0 +1,103 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from pyliebherrhomeapi import RateLimiter
+from pyliebherrhomeapi.ratelimit import _parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, None),
+            ("", None),
+            ("5", 5.0),
+            (" 1.5 ", 1.5),
+            ("-3", 0.0),
+            ("not a date", None),
+        ],
+    )
+    def test_parse(self, value: str | None, expected: float | None) -> None:
+        """Test delay-seconds and invalid values."""
+        assert _parse_retry_after(value) == expected
+
+    def test_parse_http_date(self) -> None:
+        """Test HTTP-date values are converted to a delay."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    def test_parse_naive_http_date_in_past(self) -> None:
+        """Test dates without a zone are treated as UTC and clamped to zero."""
+        assert _parse_retry_after("Mon, 01 Jan 2001 00:00:00 -0000") == 0.0
+
+
+class TestRateLimiter:
+    """Tests for the token bucket."""
+
+    @pytest.mark.parametrize(
+        ("rate", "burst"),
+        [(0, None), (-1, None), (1, 0)],
+    )
+    def test_invalid_configuration(self, rate: float, burst: int | None) -> None:
+        """Test invalid rate and burst values are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate, burst)
+
+    def test_default_burst(self) -> None:
+        """Test burst defaults to the rate rounded up."""
+        assert RateLimiter(2.5).burst == 3
+        assert RateLimiter(0.2).burst == 1
+        assert RateLimiter(5, burst=10).rate == 5
+
+    async def test_burst_is_immediate(self) -> None:
+        """Test requests within the burst do not wait."""
+        limiter = RateLimiter(rate=1, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    async def test_waits_when_empty(self) -> None:
+        """Test requests beyond the burst wait for refill."""
+        limiter = RateLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.015
+
+    async def test_queue_depth(self) -> None:
+        """Test queue depth reports waiting requests."""
+        limiter = RateLimiter(rate=20, burst=1)
+        await limiter.acquire()
+        tasks = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+        await asyncio.gather(*tasks)
+        assert limiter.queue_depth == 0
+
+    async def test_pause(self) -> None:
+        """Test pausing blocks acquisition for the given delay."""
+        limiter = RateLimiter(rate=1000, burst=10)
+        limiter.pause(0.05)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_for_api_key_shares_instance(self) -> None:
+        """Test limiters are shared per API key."""
+        first = RateLimiter.for_api_key("shared-key", rate=2)
+        second = RateLimiter.for_api_key("shared-key", rate=10)
+        other = RateLimiter.for_api_key("other-key", rate=2)
+        assert first is second
+        assert first.rate == 2
+        assert first is not other
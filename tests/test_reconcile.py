@@ -0,0 +1,269 @@
+"""Tests for desired-state reconciliation."""
+
+import asyncio
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyliebherrhomeapi import (
+    AutoDoorControl,
+    BioFreshPlusControl,
+    BioFreshPlusMode,
+    DesiredState,
+    Device,
+    DeviceControl,
+    DeviceState,
+    HydroBreezeControl,
+    HydroBreezeMode,
+    IceMakerControl,
+    IceMakerMode,
+    LiebherrClient,
+    LiebherrConnectionError,
+    LiebherrNotFoundError,
+    ReconcileAction,
+    Reconciler,
+    TemperatureControl,
+    TemperatureUnit,
+    ToggleControl,
+    WriteResult,
+)
+
+
+def device_controls() -> list[DeviceControl]:
+    """Return the controls of a fully featured appliance."""
+    return [
+        TemperatureControl(
+            name="temperature",
+            type="TemperatureControl",
+            zone_id=0,
+            target=5,
+            unit=TemperatureUnit.CELSIUS,
+        ),
+        TemperatureControl(
+            name="temperature",
+            type="TemperatureControl",
+            zone_id=1,
+            target=-18,
+            unit=TemperatureUnit.CELSIUS,
+        ),
+        ToggleControl(name="superfrost", type="ToggleControl", zone_id=1, value=False),
+        ToggleControl(name="supercool", type="ToggleControl", zone_id=0, value=False),
+        ToggleControl(name="partymode", type="ToggleControl", value=False),
+        ToggleControl(name="nightmode", type="ToggleControl", zone_id=0, value=True),
+        IceMakerControl(
+            name="icemaker",
+            type="IceMakerControl",
+            zone_id=1,
+            ice_maker_mode=IceMakerMode.OFF,
+        ),
+        HydroBreezeControl(
+            name="hydrobreeze",
+            type="HydroBreezeControl",
+            zone_id=0,
+            current_mode=HydroBreezeMode.LOW,
+        ),
+        BioFreshPlusControl(
+            name="biofreshplus",
+            type="BioFreshPlusControl",
+            zone_id=0,
+            current_mode=BioFreshPlusMode.ZERO_ZERO,
+        ),
+    ]
+
+
+IN_SYNC = DesiredState(
+    temperatures={0: 5, 1: -18},
+    superfrost={1: False},
+    supercool={0: False},
+    party_mode=False,
+    night_mode=True,
+    ice_maker={1: IceMakerMode.OFF},
+    hydro_breeze={0: HydroBreezeMode.LOW},
+    bio_fresh_plus={0: BioFreshPlusMode.ZERO_ZERO},
+)
+
+DRIFTED = DesiredState(
+    temperatures={0: 4, 1: -18},
+    superfrost={1: True},
+    supercool={0: True},
+    party_mode=True,
+    night_mode=False,
+    ice_maker={1: IceMakerMode.ON},
+    hydro_breeze={0: HydroBreezeMode.HIGH},
+    bio_fresh_plus={0: BioFreshPlusMode.MINUS_TWO_ZERO},
+)
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Return a client mock whose devices all have the full control set."""
+    client = MagicMock(spec=LiebherrClient)
+    client.get_controls.side_effect = lambda _device_id: device_controls()
+    for name in dir(LiebherrClient):
+        if name.startswith(("set_", "trigger_")):
+            getattr(client, name).return_value = WriteResult.SENT
+    return client
+
+
+def reconciler(client: MagicMock, **kwargs: Any) -> Reconciler:
+    """Build a reconciler over the client mock."""
+    return Reconciler(cast(LiebherrClient, client), **kwargs)
+
+
+def writes(client: MagicMock) -> list[tuple[str, tuple[Any, ...]]]:
+    """Return the setter calls made, in order."""
+    return [(c[0], c.args) for c in client.method_calls if c[0].startswith("set_")]
+
+
+class TestReconciler:
+    """Tests for Reconciler."""
+
+    def test_invalid_concurrency(self, client: MagicMock) -> None:
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            reconciler(client, concurrency=0)
+
+    async def test_no_drift_costs_only_reads(self, client: MagicMock) -> None:
+        """Test devices matching their desired state get no writes."""
+        desired = {f"device-{i}": IN_SYNC for i in range(1000)}
+        report = await reconciler(client).reconcile(desired)
+
+        assert client.get_controls.await_count == 1000
+        assert writes(client) == []
+        assert report.writes == 0
+        assert report.in_sync == list(desired)
+        assert report.changed == report.failed == []
+
+    async def test_drift_issues_minimal_writes(self, client: MagicMock) -> None:
+        """Test only differing controls are written, with their targets."""
+        report = await reconciler(client).reconcile({"a": DRIFTED})
+
+        assert writes(client) == [
+            ("set_temperature", ("a", 0, 4, TemperatureUnit.CELSIUS)),
+            ("set_superfrost", ("a", 1, True)),
+            ("set_supercool", ("a", 0, True)),
+            ("set_party_mode", ("a", True)),
+            ("set_night_mode", ("a", False)),
+            ("set_ice_maker", ("a", 1, IceMakerMode.ON)),
+            ("set_hydro_breeze", ("a", 0, HydroBreezeMode.HIGH)),
+            ("set_bio_fresh_plus", ("a", 0, BioFreshPlusMode.MINUS_TWO_ZERO)),
+        ]
+        (result,) = report.results
+        assert result.actions[0] == ReconcileAction("a", "temperature", 0, 5, 4)
+        assert result.applied == result.actions
+        assert report.changed == ["a"]
+        assert report.writes == 8
+
+    def test_unit_mismatch_and_missing_controls(self, client: MagicMock) -> None:
+        """Test another unit forces a write and unknown controls are reported."""
+        state = DeviceState(device=Device(device_id="a"), controls=device_controls())
+        state.controls.append(
+            AutoDoorControl(name="door", type="AutoDoorControl", zone_id=0)
+        )
+        desired = DesiredState(
+            temperatures={0: 5, 2: 4},
+            temperature_unit=TemperatureUnit.FAHRENHEIT,
+            superfrost={0: True},
+        )
+        result = reconciler(client).plan("a", state, desired)
+        assert [(a.control, a.zone_id, a.current) for a in result.actions] == [
+            ("temperature", 0, None)
+        ]
+        assert result.missing == [("temperature", 2), ("superfrost", 0)]
+
+        odd = DeviceState(
+            device=Device(device_id="a"),
+            controls=[
+                AutoDoorControl(name="partymode", type="AutoDoorControl", zone_id=0)
+            ],
+        )
+        result = reconciler(client).plan("a", odd, DesiredState(party_mode=False))
+        assert result.actions[0].current is None
+
+    def test_unknown_unit_compares_target(self, client: MagicMock) -> None:
+        """Test a control without a unit only needs a write when drifted."""
+        controls: list[DeviceControl] = [
+            TemperatureControl(
+                name="temperature", type="TemperatureControl", zone_id=0, target=5
+            )
+        ]
+        state = DeviceState(device=Device(device_id="a"), controls=controls)
+
+        in_sync = reconciler(client).plan("a", state, DesiredState(temperatures={0: 5}))
+        drifted = reconciler(client).plan("a", state, DesiredState(temperatures={0: 4}))
+
+        assert in_sync.actions == []
+        assert drifted.actions == [ReconcileAction("a", "temperature", 0, 5, 4)]
+
+    async def test_known_states_and_dry_run(self, client: MagicMock) -> None:
+        """Test supplied states skip reads and dry runs skip writes."""
+        state = DeviceState(device=Device(device_id="a"), controls=device_controls())
+        report = await reconciler(client).reconcile(
+            {"a": DRIFTED, "b": DRIFTED}, states={"a": state}, dry_run=True
+        )
+        assert [c.args for c in client.get_controls.await_args_list] == [("b",)]
+        assert writes(client) == []
+        assert [len(r.actions) for r in report.results] == [8, 8]
+        assert report.failed == ["a", "b"]
+
+    async def test_errors_are_captured_per_device(self, client: MagicMock) -> None:
+        """Test read and write errors end up in the device results."""
+
+        def _controls(device_id: str) -> list[DeviceControl]:
+            if device_id == "unreachable":
+                raise LiebherrNotFoundError("gone")
+            return device_controls()
+
+        client.get_controls.side_effect = _controls
+        client.set_superfrost.side_effect = LiebherrConnectionError("boom")
+
+        report = await reconciler(client).reconcile(
+            {"unreachable": IN_SYNC, "flaky": DRIFTED, "fine": IN_SYNC}
+        )
+        unreachable, flaky, _fine = report.results
+        assert isinstance(unreachable.error, LiebherrNotFoundError)
+        assert isinstance(flaky.error, LiebherrConnectionError)
+        assert len(flaky.applied) == 1
+        assert report.failed == ["unreachable", "flaky"]
+        assert report.in_sync == ["fine"]
+
+    async def test_unexpected_errors_are_captured(self, client: MagicMock) -> None:
+        """Test parsing and other errors never abort the whole report."""
+
+        def _controls(device_id: str) -> list[DeviceControl]:
+            if device_id == "malformed":
+                raise KeyError("name")
+            return device_controls()
+
+        client.get_controls.side_effect = _controls
+        client.set_superfrost.side_effect = ValueError("bad value")
+
+        report = await reconciler(client).reconcile(
+            {"malformed": IN_SYNC, "flaky": DRIFTED, "fine": IN_SYNC}
+        )
+        assert [r.device_id for r in report.results] == ["malformed", "flaky", "fine"]
+        malformed, flaky, _fine = report.results
+        assert isinstance(malformed.error, KeyError)
+        assert isinstance(flaky.error, ValueError)
+        assert len(flaky.applied) == 1
+        assert report.failed == ["malformed", "flaky"]
+        assert report.in_sync == ["fine"]
+
+    async def test_concurrency_is_bounded(self, client: MagicMock) -> None:
+        """Test at most ``concurrency`` devices are reconciled at once."""
+        active = peak = 0
+
+        async def _controls(_device_id: str) -> list[DeviceControl]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return device_controls()
+
+        client.get_controls.side_effect = _controls
+        await reconciler(client, concurrency=3).reconcile(
+            {str(i): IN_SYNC for i in range(10)}
+        )
+        assert peak == 3
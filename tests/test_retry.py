@@ -0,0 +1,65 @@
+"""Tests for retry policy."""
+
+import pytest
+
+from pyliebherrhomeapi import (
+    LiebherrBadRequestError,
+    LiebherrConnectionError,
+    LiebherrRateLimitError,
+    LiebherrServerError,
+    LiebherrTimeoutError,
+    RetryPolicy,
+)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_attempts": 0},
+            {"base_delay": -1},
+            {"max_delay": -1},
+            {"deadline": 0},
+        ],
+    )
+    def test_invalid_values(self, kwargs: dict[str, float]) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)  # type: ignore[arg-type]
+
+    def test_applies_to_get_only_by_default(self) -> None:
+        """Test only GET requests are retried by default."""
+        policy = RetryPolicy()
+        assert policy.applies_to("GET")
+        assert policy.applies_to("get")
+        assert not policy.applies_to("POST")
+        assert RetryPolicy(methods=frozenset({"GET", "POST"})).applies_to("POST")
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (LiebherrServerError("boom"), True),
+            (LiebherrConnectionError("down"), True),
+            (LiebherrTimeoutError("slow"), True),
+            (LiebherrRateLimitError("busy"), True),
+            (LiebherrBadRequestError("bad"), False),
+        ],
+    )
+    def test_should_retry(self, error: Exception, expected: bool) -> None:
+        """Test default error classification."""
+        assert RetryPolicy().should_retry(error) is expected
+
+    def test_give_up_on_overrides_retry_on(self) -> None:
+        """Test excluded subclasses are not retried."""
+        policy = RetryPolicy(give_up_on=(LiebherrRateLimitError,))
+        assert not policy.should_retry(LiebherrRateLimitError("busy"))
+        assert policy.should_retry(LiebherrConnectionError("down"))
+
+    def test_backoff_full_jitter(self) -> None:
+        """Test backoff stays within the capped exponential bound."""
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for attempt, cap in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+            for _ in range(50):
+                assert 0 <= policy.backoff(attempt) <= cap
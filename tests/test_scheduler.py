@@ -0,0 +1,182 @@
+"""Tests for phase-staggered poll scheduling."""
+
+from typing import Any
+
+import pytest
+
+from pyliebherrhomeapi import (
+    AdaptivePolling,
+    AutoDoorControl,
+    Device,
+    DeviceControl,
+    DeviceState,
+    DoorState,
+    PollScheduler,
+    TemperatureControl,
+    ToggleControl,
+)
+
+
+class TestPollScheduler:
+    """Tests for PollScheduler."""
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"interval": 0}, {"interval": 30, "ramp_up": -1}]
+    )
+    def test_invalid_values(self, kwargs: dict[str, float]) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            PollScheduler(**kwargs)
+
+    def test_phase_is_stable(self) -> None:
+        """Test phases depend only on the device ID."""
+        first = PollScheduler(30)
+        second = PollScheduler(30)
+        for device_id in ("a", "b", "c"):
+            second.add(device_id, 0)
+        assert first.phase("b") == second.phase("b")
+        assert 0 <= first.phase("b") < 30
+
+    def test_phases_are_spread(self) -> None:
+        """Test a fleet is spread evenly across the interval."""
+        scheduler = PollScheduler(30)
+        buckets = [0] * 10
+        for i in range(1000):
+            buckets[int(scheduler.phase(f"device-{i}") // 3)] += 1
+        assert min(buckets) > 60
+        assert max(buckets) < 140
+
+    def test_polls_follow_phase(self) -> None:
+        """Test devices are polled at once, then in their own slot."""
+        scheduler = PollScheduler(30)
+        scheduler.start(1000)
+        scheduler.add("a", 1000)
+        scheduler.add("b", 1000)
+        assert len(scheduler) == 2
+        assert sorted(scheduler.pop_due(1000)) == ["a", "b"]
+        assert scheduler.pop_due(1000) == []
+
+        for device_id in ("a", "b"):
+            next_poll = scheduler._due[device_id]
+            assert 1000 < next_poll <= 1030
+            assert next_poll % 30 == pytest.approx(scheduler.phase(device_id))
+
+        due_at = scheduler.next_due()
+        assert due_at is not None
+        polled = scheduler.pop_due(due_at)
+        assert len(polled) == 1
+        assert scheduler._due[polled[0]] == pytest.approx(due_at + 30)
+
+    def test_remove(self) -> None:
+        """Test removed devices are no longer returned."""
+        scheduler = PollScheduler(30)
+        scheduler.add("a", 0)
+        scheduler.remove("a")
+        scheduler.remove("a")
+        assert "a" not in scheduler
+        assert scheduler.next_due() is None
+        assert scheduler.pop_due(100) == []
+
+    def test_ramp_up(self) -> None:
+        """Test first polls are spread across the ramp-up window."""
+        scheduler = PollScheduler(30, ramp_up=10)
+        scheduler.start(0)
+        for i in range(100):
+            scheduler.add(f"device-{i}", 0)
+        assert scheduler.pop_due(0) == []
+        first_second = scheduler.pop_due(1)
+        assert 0 < len(first_second) < 30
+        rest = scheduler.pop_due(10)
+        assert set(first_second) | set(rest) == {f"device-{i}" for i in range(100)}
+
+    def test_add_after_ramp_up(self) -> None:
+        """Test devices added after ramp-up are due immediately."""
+        scheduler = PollScheduler(30, ramp_up=10)
+        scheduler.start(0)
+        scheduler.add("late", 50)
+        assert scheduler.next_due() == 50
+
+    def test_set_interval(self) -> None:
+        """Test per-device intervals move the device to the new grid."""
+        scheduler = PollScheduler(30)
+        scheduler.add("a", 0)
+        scheduler.pop_due(0)
+        scheduler.set_interval("a", 5, 0)
+        assert scheduler.interval_for("a") == 5
+        assert scheduler.phase("a") < 5
+        assert 0 < scheduler._due["a"] <= 5
+
+        scheduler.set_interval("a", 5, 1)
+        scheduler.set_interval("a", 30, 0)
+        assert scheduler._intervals == {}
+        scheduler.set_interval("b", 60, 0)
+        assert "b" not in scheduler
+        scheduler.remove("b")
+        assert scheduler.interval_for("b") == 30
+        with pytest.raises(ValueError):
+            scheduler.set_interval("a", 0, 0)
+
+
+def door(value: DoorState) -> AutoDoorControl:
+    """Build an auto door control."""
+    return AutoDoorControl(
+        name="autodoor", type="AutoDoorControl", zone_id=0, value=value
+    )
+
+
+def toggle(name: str, value: bool) -> ToggleControl:
+    """Build a toggle control."""
+    return ToggleControl(name=name, type="ToggleControl", zone_id=0, value=value)
+
+
+class TestAdaptivePolling:
+    """Tests for AdaptivePolling."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"floor": 0},
+            {"floor": 10, "ceiling": 5},
+            {"backoff": 0.5},
+        ],
+    )
+    def test_invalid_values(self, kwargs: dict[str, Any]) -> None:
+        """Test invalid bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptivePolling(**kwargs)
+
+    @pytest.mark.parametrize(
+        ("control", "transient"),
+        [
+            (door(DoorState.MOVING), True),
+            (door(DoorState.CLOSED), False),
+            (toggle("superfrost", True), True),
+            (toggle("supercool", True), True),
+            (toggle("supercool", False), False),
+            (toggle("partymode", True), False),
+            (
+                TemperatureControl(
+                    name="temperature", type="TemperatureControl", zone_id=0
+                ),
+                False,
+            ),
+        ],
+    )
+    def test_transient_controls(self, control: DeviceControl, transient: bool) -> None:
+        """Test which controls count as transient."""
+        state = DeviceState(device=Device(device_id="a"), controls=[control])
+        expected = [control] if transient else []
+        assert AdaptivePolling().transient_controls(state) == expected
+
+    def test_next_interval(self) -> None:
+        """Test intervals shrink for transient states and grow when idle."""
+        policy = AdaptivePolling(floor=5, ceiling=100, backoff=2)
+        idle = DeviceState(device=Device(device_id="a"))
+        moving = DeviceState(
+            device=Device(device_id="a"), controls=[door(DoorState.MOVING)]
+        )
+        assert policy.next_interval(moving, 30, 30, changed=True) == 5
+        assert policy.next_interval(idle, 30, 30, changed=False) == 60
+        assert policy.next_interval(idle, 80, 30, changed=False) == 100
+        assert policy.next_interval(idle, 100, 30, changed=True) == 30
+        assert policy.next_interval(idle, 1, 1, changed=True) == 5